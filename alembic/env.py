@@ -28,6 +28,7 @@ import app.domains.auth.models
 import app.domains.lists.models
 import app.domains.api_clients.models
 import app.domains.tasks.models
+import app.domains.sync.models
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from app.db.base import Base
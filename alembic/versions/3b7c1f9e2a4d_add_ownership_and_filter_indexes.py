@@ -0,0 +1,51 @@
+"""Add ownership and filter indexes
+
+Revision ID: 3b7c1f9e2a4d
+Revises: 60e73d562cf8
+Create Date: 2026-10-18 09:12:31.504118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7c1f9e2a4d'
+down_revision = '60e73d562cf8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so build
+    # the indexes in autocommit mode. A failed concurrent build leaves an INVALID
+    # index behind: drop it and re-run the migration.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_lists_user_id_created_at', 'lists',
+            ['user_id', sa.text('created_at DESC'), 'id'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tasks_list_id_completed_due_date', 'tasks',
+            ['list_id', 'completed', 'due_date', sa.text('priority DESC'), 'id'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_verification_token', 'users', ['verification_token'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text('verification_token IS NOT NULL'),
+        )
+        op.create_index(
+            'ix_users_reset_token', 'users', ['reset_token'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text('reset_token IS NOT NULL'),
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_reset_token', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_verification_token', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_list_id_completed_due_date', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_lists_user_id_created_at', table_name='lists', postgresql_concurrently=True)
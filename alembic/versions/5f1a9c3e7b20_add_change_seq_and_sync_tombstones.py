@@ -0,0 +1,82 @@
+"""Add change_seq columns and sync_tombstones table
+
+Revision ID: 5f1a9c3e7b20
+Revises: 8d2e4a6c1f35
+Create Date: 2026-10-18 16:05:47.913402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f1a9c3e7b20'
+down_revision = '8d2e4a6c1f35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False))
+    op.add_column('lists', sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False))
+    op.add_column('tasks', sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False))
+
+    op.create_table('sync_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=8), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('change_seq', sa.BigInteger(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_sync_tombstones_user_id_change_seq', 'sync_tombstones', ['user_id', 'change_seq'], unique=False)
+
+    # Number existing rows per user (lists first, then tasks) so a first sync
+    # after the upgrade can page through them, and leave each user's sequence
+    # at the last number handed out
+    op.execute("""
+        UPDATE lists SET change_seq = numbered.seq
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY user_id ORDER BY id) AS seq
+            FROM lists
+        ) AS numbered
+        WHERE lists.id = numbered.id
+    """)
+    op.execute("""
+        UPDATE tasks SET change_seq = numbered.seq
+        FROM (
+            SELECT tasks.id,
+                   row_number() OVER (PARTITION BY lists.user_id ORDER BY tasks.id)
+                   + (SELECT count(*) FROM lists AS owned WHERE owned.user_id = lists.user_id) AS seq
+            FROM tasks JOIN lists ON lists.id = tasks.list_id
+        ) AS numbered
+        WHERE tasks.id = numbered.id
+    """)
+    op.execute("""
+        UPDATE users SET change_seq = (SELECT count(*) FROM lists WHERE lists.user_id = users.id)
+            + (SELECT count(*) FROM tasks JOIN lists ON lists.id = tasks.list_id WHERE lists.user_id = users.id)
+    """)
+
+    # Built after the backfill, so the UPDATEs above do not maintain them
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_lists_user_id_change_seq', 'lists', ['user_id', 'change_seq'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tasks_list_id_change_seq', 'tasks', ['list_id', 'change_seq'],
+            unique=False, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_list_id_change_seq', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_lists_user_id_change_seq', table_name='lists', postgresql_concurrently=True)
+    op.drop_index('ix_sync_tombstones_user_id_change_seq', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    op.drop_column('tasks', 'change_seq')
+    op.drop_column('lists', 'change_seq')
+    op.drop_column('users', 'change_seq')
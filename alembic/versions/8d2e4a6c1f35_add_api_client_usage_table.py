@@ -0,0 +1,38 @@
+"""Add api_client_usage table
+
+Revision ID: 8d2e4a6c1f35
+Revises: 3b7c1f9e2a4d
+Create Date: 2026-10-18 13:40:12.281907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e4a6c1f35'
+down_revision = '3b7c1f9e2a4d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('api_client_usage',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.String(), nullable=False),
+    sa.Column('period_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('period_end', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('request_count', sa.Integer(), nullable=False),
+    sa.Column('bytes_in', sa.BigInteger(), nullable=False),
+    sa.Column('bytes_out', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['api_clients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_api_client_usage_id'), 'api_client_usage', ['id'], unique=False)
+    op.create_index('ix_api_client_usage_client_id_period_start', 'api_client_usage', ['client_id', 'period_start'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_api_client_usage_client_id_period_start', table_name='api_client_usage')
+    op.drop_index(op.f('ix_api_client_usage_id'), table_name='api_client_usage')
+    op.drop_table('api_client_usage')
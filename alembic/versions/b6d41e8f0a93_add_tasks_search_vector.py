@@ -0,0 +1,48 @@
+"""Add tasks.search_vector with a GIN index
+
+Revision ID: b6d41e8f0a93
+Revises: 5f1a9c3e7b20
+Create Date: 2026-10-18 19:12:33.604218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6d41e8f0a93'
+down_revision = '5f1a9c3e7b20'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of app.domains.tasks.models.SEARCH_VECTOR_SQL
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Search falls back to LIKE on other databases
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # A stored generated column: adding it rewrites the table under an
+    # ACCESS EXCLUSIVE lock, so run this in a maintenance window on large tables
+    op.execute(
+        f"ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_vector', 'tasks', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_search_vector', table_name='tasks', postgresql_concurrently=True)
+    op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,216 @@
+import posixpath
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Literal, Optional
+from urllib.parse import unquote
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel, Field
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from app import logger
+from app.core.config import settings
+from app.db.session import SHARED_SESSION_SCOPE_KEY, AnySession, get_request_db, run_in_session
+from app.domains.auth.schemas import Principal
+from app.domains.auth.utils import PRINCIPAL_SCOPE_KEY, get_verified_user
+
+router = APIRouter()
+
+API_PREFIX = "/api/v1"
+# Streams, uploads and nested batches have no single JSON body to return
+NOT_BATCHABLE = {"/batch", "/sync/events", "/tasks/export", "/tasks/import"}
+# Set on every sub-request scope, so a batch reached from inside one refuses to run
+BATCH_SCOPE_KEY = "taskflow.in_batch"
+# Batch request headers that describe the batch body itself, or that a
+# sub-request sets for itself (conditional GETs)
+BATCH_ONLY_HEADERS = {
+    b"content-length", b"content-type", b"content-encoding", b"transfer-encoding", b"accept-encoding",
+    b"if-none-match", b"if-match", b"if-modified-since",
+}
+# Identity stays the batch's: a sub-request can't switch user or host
+PROTECTED_HEADERS = {"authorization", "cookie", "host", "content-length"}
+# Sub-response headers that only make sense on the batch response
+DROPPED_RESPONSE_HEADERS = {"content-length", "content-type", "set-cookie"}
+
+
+class BatchSubRequest(BaseModel):
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+    path: str = Field(..., pattern=r"^/", description="Path and query string, relative to /api/v1")
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest] = Field(..., min_length=1, max_length=settings.BATCH_MAX_REQUESTS)
+
+
+class BatchSubResponse(BaseModel):
+    status: int
+    headers: Dict[str, str]
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchSubResponse]
+
+
+def encode_sub_response(status_code: int, headers: Dict[str, str], body: bytes, content_type: str = "") -> bytes:
+    """
+    One item of the ``responses`` array. A JSON body from the app is embedded
+    as is, without being parsed and serialized again.
+    """
+    if not body:
+        body_json = b"null"
+    elif content_type.startswith("application/json"):
+        body_json = body
+    else:
+        body_json = orjson.dumps(body.decode("utf-8", "replace"))
+    return b'{"status":%d,"headers":%s,"body":%s}' % (status_code, orjson.dumps(headers), body_json)
+
+
+def encode_error(status_code: int, detail: str) -> bytes:
+    return encode_sub_response(status_code, {}, orjson.dumps({"detail": detail}), "application/json")
+
+
+def normalize_path(raw_path: str) -> Optional[str]:
+    """
+    The path a sub-request is routed on: percent-decoded once, with dot
+    segments, repeated and trailing slashes collapsed. None when it still holds
+    a ``%`` (double encoding), which the router would never see the same way.
+    """
+    path = unquote(raw_path)
+    if "%" in path:
+        return None
+    return posixpath.normpath("/" + path.lstrip("/"))
+
+
+async def dispatch(
+    request: Request, sub_request: BatchSubRequest, path: str, db: AnySession, principal: Principal
+) -> bytes:
+    """
+    Run one sub-request through the app's router, in-process: past the
+    middleware stack (API key, compression), on the batch's session and
+    principal, with the batch's remaining headers. ``path`` is the normalized
+    one the batchable check ran on.
+    """
+    query = sub_request.path.partition("?")[2]
+    path = API_PREFIX + path
+    body = b"" if sub_request.body is None else orjson.dumps(sub_request.body)
+
+    headers = [(name, value) for name, value in request.scope["headers"] if name not in BATCH_ONLY_HEADERS]
+    headers.extend(
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in sub_request.headers.items() if name.lower() not in PROTECTED_HEADERS
+    )
+    if body:
+        headers.extend([(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())])
+
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub_request.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+        "app": request.app,
+        "state": dict(request.scope.get("state", {})),
+        # Installed by ExceptionMiddleware, which sub-requests don't pass through
+        "starlette.exception_handlers": request.scope["starlette.exception_handlers"],
+        SHARED_SESSION_SCOPE_KEY: db,
+        PRINCIPAL_SCOPE_KEY: principal,
+        BATCH_SCOPE_KEY: True,
+    }
+
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    started = {}
+    chunks = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            started.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        # Normally opened by FastAPI's AsyncExitStackMiddleware, per request
+        async with AsyncExitStack() as stack:
+            scope["fastapi_middleware_astack"] = stack
+            await request.app.router(scope, receive, send)
+    except StarletteHTTPException as e:
+        # Raised by the router itself (no such route or method), outside any route's handlers
+        return encode_error(e.status_code, e.detail)
+
+    response_headers = {}
+    content_type = ""
+    for name, value in started.get("headers", []):
+        name = name.decode("latin-1")
+        if name == "content-type":
+            content_type = value.decode("latin-1")
+        if name not in DROPPED_RESPONSE_HEADERS:
+            response_headers[name] = value.decode("latin-1")
+    return encode_sub_response(started.get("status", 500), response_headers, b"".join(chunks), content_type)
+
+
+@router.post("/batch", response_model=BatchResponse, tags=["Batch"])
+async def batch(
+    payload: BatchRequest,
+    request: Request,
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
+):
+    """
+    Run several API calls in one HTTP round trip.
+
+    Each item of `requests` is a method, a path relative to `/api/v1` (query
+    string included), optional headers (e.g. `If-None-Match`) and an optional
+    JSON body. They run one after another, in order, as the caller of the
+    batch, and `responses` holds their status, headers and body in the same
+    order. A failed sub-request does not undo the ones before it.
+
+    Sub-requests not started within the batch time limit are answered `504`;
+    streaming and upload endpoints, and percent-encoded `%` in paths, are
+    answered `400`.
+    """
+    if request.scope.get(BATCH_SCOPE_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batches can't be nested"
+        )
+
+    deadline = time.monotonic() + settings.BATCH_TIMEOUT_SECONDS
+    parts = []
+    for sub_request in payload.requests:
+        path = normalize_path(sub_request.path.partition("?")[0])
+        if path is None:
+            parts.append(encode_error(400, "Encoded '%' is not allowed in batch paths"))
+            continue
+        if path in NOT_BATCHABLE:
+            parts.append(encode_error(400, f"{path} can't be called in a batch"))
+            continue
+        if time.monotonic() >= deadline:
+            parts.append(encode_error(504, "Batch time limit reached before this request ran"))
+            continue
+        try:
+            parts.append(await dispatch(request, sub_request, path, db, current_user))
+        except Exception as e:
+            logger.error(f"Batch sub-request {sub_request.method} {path} failed: {str(e)}")
+            # Leave the shared session usable for the next sub-requests
+            await run_in_session(db, lambda session: session.rollback())
+            parts.append(encode_error(500, "Internal server error"))
+
+    return Response(content=b'{"responses":[' + b",".join(parts) + b"]}", media_type="application/json")
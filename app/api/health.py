@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import AnySession, get_request_db, run_in_session
 
 router = APIRouter()
 
 @router.get("/health", tags=["Health"])
-def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AnySession = Depends(get_request_db)):
     try:
-        db.execute(text("SELECT 1"))
+        await run_in_session(db, lambda session: session.execute(text("SELECT 1")))
     except Exception as e:
         return {"status": "fail", "db": False, "error": str(e)}
     return {"status": "ok", "db": True}
@@ -0,0 +1,82 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.core.config import settings
+from app.core.responses import ORJSONResponse
+from app.core.response_cache import response_cache
+from app.core.tokens import token_service
+from app.db.pool_metrics import pool_metrics
+from app.db.session import ENGINES
+from app.domains.auth.hashing import password_hasher
+from app.domains.auth.principal_cache import principal_cache
+from app.domains.sync.feed import change_feed
+
+
+
+def require_ops_token(x_ops_token: str = Header("", description="INTERNAL_ENDPOINTS_TOKEN")) -> None:
+    """
+    Operators only: the API key alone is held by every client app, and these
+    endpoints have no user to authorize
+    """
+    expected = settings.INTERNAL_ENDPOINTS_TOKEN
+    if not expected or not hmac.compare_digest(x_ops_token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Operator token required"
+        )
+
+
+# Plain stats dicts, no response_model to validate against
+router = APIRouter(
+    prefix="/internal", tags=["Internal"], dependencies=[Depends(require_ops_token)],
+    default_response_class=ORJSONResponse
+)
+
+
+@router.get("/db-pool")
+def db_pool_stats():
+    """
+    Connection pool gauges (size, checked out, overflow) and checkout wait histograms.
+    """
+    return {"pools": [pool_metrics.snapshot(name, target.pool) for name, target in ENGINES.items()]}
+
+
+@router.get("/principal-cache")
+def principal_cache_stats():
+    """
+    Hit/miss counters of the authenticated-principal cache.
+    """
+    return principal_cache.stats()
+
+
+@router.get("/password-hasher")
+def password_hasher_stats():
+    """
+    Queue depth and 503 rejections of the bcrypt process pool.
+    """
+    return password_hasher.stats()
+
+
+@router.get("/token-cache")
+def token_cache_stats():
+    """
+    Hit/miss counters of the verified-JWT cache.
+    """
+    return token_service.stats()
+
+
+@router.get("/response-cache")
+def response_cache_stats():
+    """
+    Hit ratio and estimated latency saved by the per-user response cache.
+    """
+    return response_cache.stats()
+
+
+@router.get("/change-feed")
+def change_feed_stats():
+    """
+    Open change streams and events published, dropped for slow readers or rejected.
+    """
+    return change_feed.stats()
@@ -1,7 +1,11 @@
 from fastapi import APIRouter
+from app.core.config import settings
+from app.api.batch import router as batch_router
 from app.api.health import router as health_router
+from app.api.internal import router as internal_router
 from app.domains.auth.router import router as auth_router
 from app.domains.lists.router import router as lists_router
+from app.domains.sync.router import router as sync_router
 from app.domains.tasks.router import router as tasks_router
 
 
@@ -10,3 +14,8 @@ router.include_router(health_router)
 router.include_router(auth_router)
 router.include_router(lists_router)
 router.include_router(tasks_router)
+router.include_router(sync_router)
+router.include_router(batch_router)
+
+if settings.INTERNAL_ENDPOINTS_ENABLED:
+    router.include_router(internal_router)
@@ -1,7 +1,15 @@
 from pydantic import BaseModel, computed_field
-from typing import Optional
+from typing import List, Optional
 
 class UserRegisteredPayload(BaseModel):
     user_id: int
     email: str
-    role: str
\ No newline at end of file
+    role: str
+
+class ChangeEventPayload(BaseModel):
+    # A committed write to a user's lists or tasks, numbered like delta sync
+    user_id: int
+    entity: str  # "list" or "task"
+    action: str  # "created", "updated", "deleted" or "imported"
+    ids: List[int]  # empty for "imported"
+    change_seq: int
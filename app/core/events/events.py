@@ -14,15 +14,15 @@ class EventBus:
         logger.info(f"Subscribed handler {handler.__name__} to event {event_name}")
 
     def publish(self, event_name: str, payload: dict):
-        logger.info(f"Publishing event {event_name} with payload: {payload}")
+        logger.debug(f"Publishing event {event_name} with payload: {payload}")
         handlers = self.subscribers.get(event_name, [])
-        logger.info(f"Found {len(handlers)} handlers for event {event_name}")
+        logger.debug(f"Found {len(handlers)} handlers for event {event_name}")
 
         for handler in handlers:
             try:
-                logger.info(f"Executing handler {handler.__name__} for event {event_name}")
+                logger.debug(f"Executing handler {handler.__name__} for event {event_name}")
                 handler(payload)
-                logger.info(f"Successfully executed handler {handler.__name__} for event {event_name}")
+                logger.debug(f"Successfully executed handler {handler.__name__} for event {event_name}")
             except Exception as e:
                 logger.error(f"Error in handler {handler.__name__} for event {event_name}: {str(e)}", exc_info=True)
                 if getattr(self, "event_handler_fail_fatal", False):
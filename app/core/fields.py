@@ -0,0 +1,74 @@
+# app/core/fields.py
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple, Type
+
+from fastapi import Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, create_model
+
+# Returned whatever is asked for: clients key their local state on it
+ALWAYS_INCLUDED = ("id",)
+
+
+def parse_fields(raw: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Field names of ``model`` requested in a comma-separated ``fields`` value, in
+    the model's declaration order (so every spelling of a set shares one cache
+    entry and one ETag). None means every field.
+    """
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    requested.update(ALWAYS_INCLUDED)
+    if requested >= model.model_fields.keys():
+        return None
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+def sparse_fields(model: Type[BaseModel]):
+    """Route dependency reading the ``fields`` query parameter for ``model``"""
+    def get_fields(
+        fields: Optional[str] = Query(
+            None,
+            description=f"Comma-separated fields to return, of: {', '.join(model.model_fields)}; all when omitted"
+        )
+    ) -> Optional[Tuple[str, ...]]:
+        return parse_fields(fields, model)
+    return Depends(get_fields)
+
+
+@lru_cache(maxsize=1024)
+def sparse_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    ``model`` narrowed to ``fields``: same types and config, other fields
+    absent from validation and from the JSON. Built once per field set.
+    """
+    return create_model(
+        f"{model.__name__}[{','.join(fields)}]",
+        __config__=model.model_config,
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields}
+    )
+
+
+def sparse_columns(columns: Sequence[Any], fields: Optional[Tuple[str, ...]], keyset: Sequence[Any] = ()) -> tuple:
+    """
+    The ``columns`` behind ``fields``, plus the sort key columns a keyset page
+    reads its cursors from.
+    """
+    if fields is None:
+        return tuple(columns)
+    keys = set(fields).union(key.column.key for key in keyset)
+    return tuple(column for column in columns if column.key in keys)
+
+
+def sparse_response(item: BaseModel) -> Response:
+    """
+    JSON response for a sparse model, which would not validate as the route's
+    full ``response_model``
+    """
+    return Response(content=item.model_dump_json(), media_type="application/json")
@@ -0,0 +1,43 @@
+# app/core/http_cache.py
+import hashlib
+
+from fastapi import Depends, Request, Response, status
+
+# Default for /api/ responses, applied by NoCacheMiddleware when a route sets nothing
+NO_STORE = "no-cache, no-store, must-revalidate, max-age=0"
+# Per-user data that clients may keep but must revalidate (If-None-Match) before reuse
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def cache_control(value: str):
+    """Route dependency setting the Cache-Control policy of that route's responses"""
+    def set_cache_control(response: Response) -> None:
+        response.headers["Cache-Control"] = value
+    return Depends(set_cache_control)
+
+
+def weak_etag(*parts) -> str:
+    """
+    Weak ETag over the given validator parts, e.g. (scope, query params, count,
+    max(updated_at)). Cheap: the response body is never serialized for it.
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of ``etag`` against the request's If-None-Match"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def not_modified(etag: str, cache_control_value: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control_value}
+    )
@@ -1,42 +1,76 @@
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 import hashlib
 
-EXEMPT_PATHS = [
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.domains.api_clients.registry import APIKeyRegistry, UsageRecorder
+
+EXEMPT_PATHS = frozenset({
     "/api/v1/health",
     "/docs",
     "/openapi.json",
     "/redoc",
     "/api/v1/psp/mollie/webhooks/payment"  # Mollie webhook - uses signature validation
-]
-
-class APIKeyMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, allowed_keys: set[str]):
-        super().__init__(app)
-        self.allowed_keys = allowed_keys
-
-    async def dispatch(self, request: Request, call_next):
-        # Skip OPTIONS requests (preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-        
-        # Allow exempt paths without requiring an API key
-        if request.url.path in EXEMPT_PATHS:
-            return await call_next(request)
-        
-        raw_key = request.headers.get("x-api-key")
+})
+
+API_KEY_HEADER = b"x-api-key"
+
+
+class APIKeyMiddleware:
+    """
+    Require a known X-API-Key on every request outside ``exempt_paths``.
+
+    Plain ASGI: the key is read from the raw scope headers, and request/response
+    bytes are counted on the messages as they pass, so streaming is unaffected.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: APIKeyRegistry,
+        usage: UsageRecorder,
+        exempt_paths: frozenset = EXEMPT_PATHS
+    ):
+        self.app = app
+        self.registry = registry
+        self.usage = usage
+        self.exempt_paths = exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip OPTIONS requests (preflight) and exempt paths
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        raw_key = next((value for name, value in scope["headers"] if name == API_KEY_HEADER), None)
         if not raw_key:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Missing API key"}
-            )
-
-        hashed = hashlib.sha256(raw_key.encode()).hexdigest()
-        if hashed not in self.allowed_keys:
-            return JSONResponse(
-                status_code=403,
-                content={"detail": "Invalid API key"}
-            )
-
-        return await call_next(request)
+            response = JSONResponse(status_code=401, content={"detail": "Missing API key"})
+            await response(scope, receive, send)
+            return
+
+        client_id = self.registry.lookup(hashlib.sha256(raw_key).hexdigest())
+        if client_id is None:
+            response = JSONResponse(status_code=403, content={"detail": "Invalid API key"})
+            await response(scope, receive, send)
+            return
+
+        bytes_in = 0
+        bytes_out = 0
+
+        async def counting_receive() -> Message:
+            nonlocal bytes_in
+            message = await receive()
+            if message["type"] == "http.request":
+                bytes_in += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            nonlocal bytes_out
+            if message["type"] == "http.response.body":
+                bytes_out += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            self.usage.record(client_id, bytes_in, bytes_out)
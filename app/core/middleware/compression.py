@@ -0,0 +1,202 @@
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # br is simply not offered without the optional brotli package
+    brotli = None
+
+# Only textual payloads compress well; images, archives etc. pass through
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/problem+json",
+    "application/xml",
+    "application/javascript",
+    "text/",
+)
+# Event streams must reach the client event by event, never held back for a threshold
+NEVER_COMPRESSED_TYPES = ("text/event-stream",)
+# Never bodies, or nothing worth compressing
+UNCOMPRESSED_STATUSES = frozenset({204, 304})
+
+
+def negotiate_encoding(accept_encoding: str, brotli_available: bool = brotli is not None) -> Optional[str]:
+    """
+    Pick "br" or "gzip" from an Accept-Encoding header (q-values honoured,
+    br preferred on ties), or None when neither is acceptable.
+    """
+    weights = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            weights[coding.strip()] = q
+
+    wildcard = weights.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli_available else ["gzip"]
+    best, best_q = None, 0.0
+    for coding in candidates:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        # wbits=31: gzip container
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        # Sync-flush each streamed chunk so clients can decode it on arrival
+        chunk = self._compressor.compress(data)
+        return chunk + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else chunk
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        chunk = self._compressor.process(data)
+        return chunk + self._compressor.flush() if flush else chunk
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with br or gzip, as negotiated from Accept-Encoding.
+
+    Plain ASGI. The start message is held back until ``minimum_size`` body bytes
+    (or the whole body) have arrived: smaller responses go out untouched, larger
+    ones are compressed whole (with a new Content-Length) or, when streamed,
+    chunk by chunk with a flush after each chunk so streams stay incremental.
+    Responses that already carry a Content-Encoding, or whose type is not
+    textual, are passed through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _encoder(self, encoding: str):
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        buffered: list = []
+        buffered_size = 0
+        encoder = None
+        passthrough = False
+
+        async def send_start(compressed_length: Optional[int] = None) -> None:
+            """Send the held start message, marked as compressed when an encoder is set"""
+            headers = MutableHeaders(scope=start_message)
+            if encoder is not None or compressed_length is not None:
+                headers["Content-Encoding"] = encoding
+                if compressed_length is None:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(compressed_length)
+                # The representation changes, so a strong validator must become weak
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+            await send(start_message)
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, buffered_size, passthrough, encoder
+            message_type = message["type"]
+
+            if message_type == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    message["status"] in UNCOMPRESSED_STATUSES
+                    or "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or content_type.startswith(NEVER_COMPRESSED_TYPES)
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+                start_message = message
+                return
+
+            if passthrough or message_type != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None and start_message is not None:
+                buffered.append(body)
+                buffered_size += len(body)
+                if not more_body and buffered_size < self.minimum_size:
+                    # Whole body known and too small to be worth it
+                    await send_start()
+                    start_message = None
+                    await send({"type": "http.response.body", "body": b"".join(buffered)})
+                    return
+                if more_body and buffered_size < self.minimum_size:
+                    # Streamed: wait for enough bytes to decide
+                    return
+                pending = b"".join(buffered)
+                buffered.clear()
+                if not more_body:
+                    compressed = self._encoder(encoding).finish(pending)
+                    await send_start(compressed_length=len(compressed))
+                    start_message = None
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                encoder = self._encoder(encoding)
+                await send_start()
+                start_message = None
+                body = pending
+
+            if encoder is None:
+                # Start already sent uncompressed (small body)
+                await send(message)
+            elif more_body:
+                await send({"type": "http.response.body", "body": encoder.compress(body, flush=True), "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": encoder.finish(body)})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,40 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.http_cache import NO_STORE
+
+NO_CACHE_HEADERS = {
+    "Cache-Control": NO_STORE,
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+class NoCacheMiddleware:
+    """
+    Prevent caching of API responses, unless the route chose its own
+    Cache-Control policy (see ``app.core.http_cache.cache_control``).
+
+    Plain ASGI: the headers are added to the ``http.response.start`` message, so
+    the body (streamed or not) passes through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only add no-cache headers for API endpoints
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if "cache-control" not in headers:
+                    for name, value in NO_CACHE_HEADERS.items():
+                        headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
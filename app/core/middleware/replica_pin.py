@@ -0,0 +1,49 @@
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db.routing import PIN_COOKIE, PIN_HEADER, PIN_SCOPE_KEY
+
+
+def pin_cookie(until: int) -> str:
+    """Set-Cookie value for a pin, with the attributes ``Response.set_cookie`` would give it"""
+    cookie = SimpleCookie()
+    cookie[PIN_COOKIE] = str(until)
+    cookie[PIN_COOKIE]["max-age"] = settings.REPLICA_PIN_SECONDS
+    cookie[PIN_COOKIE]["path"] = "/"
+    cookie[PIN_COOKIE]["httponly"] = True
+    cookie[PIN_COOKIE]["samesite"] = "lax"
+    return cookie.output(header="").strip()
+
+
+class ReplicaPinMiddleware:
+    """
+    Send the read-your-writes pin a request's writes earned (see
+    ``app.db.routing.set_pin``) as the X-DB-Pin-Until header and the
+    db_pin_until cookie.
+
+    Plain ASGI: the headers go on the ``http.response.start`` message, so they
+    reach every response, whether the route returned a model, its own
+    Response or a stream. A commit made after the response has started (while
+    streaming) can't pin the client.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            until = scope.get(PIN_SCOPE_KEY)
+            if message["type"] == "http.response.start" and until is not None:
+                headers = MutableHeaders(scope=message)
+                headers[PIN_HEADER] = str(until)
+                headers.append("set-cookie", pin_cookie(until))
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
@@ -1,13 +1,23 @@
+import base64
+import binascii
+import json
+from datetime import date
+from enum import Enum
 from math import ceil
-from typing import Generic, List, Sequence, Tuple, TypeVar
+from typing import Any, Generic, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
 
+from fastapi import HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy import and_, false, literal, or_
 from sqlalchemy.orm import Query
 
-from app.core.schemas import PageMeta, PaginatedResponse
+from app.core.schemas import CursorPageMeta, CursorPaginatedResponse, PageMeta, PaginatedResponse
 
 T = TypeVar("T")
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 
 def paginate_query(query: Query, page: int, page_size: int) -> Tuple[Sequence, int]:
     """
@@ -49,3 +59,139 @@ def build_paginated_response(items: List[T], total_count: int, page: int, page_s
 
     return PaginatedResponse[T](items=items, meta=meta)
 
+
+# --- Keyset (cursor) pagination --- #
+class KeysetColumn(NamedTuple):
+    """One column of a keyset sort order. Nullable columns sort NULLs last."""
+    column: Any
+    descending: bool = False
+    nullable: bool = False
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _load_value(column: Any, raw: Any) -> Any:
+    if raw is None:
+        return None
+    python_type = column.type.python_type
+    if issubclass(python_type, date):
+        return python_type.fromisoformat(raw)
+    return python_type(raw)
+
+
+def encode_cursor(values: Sequence[Any], direction: str) -> str:
+    """Encode sort-key values into an opaque, URL-safe cursor"""
+    payload = json.dumps([direction, [_dump_value(v) for v in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keyset: Sequence[KeysetColumn]) -> Tuple[str, List[Any]]:
+    """Decode a cursor into (direction, values), validating it against the keyset"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, raw_values = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in ("next", "prev") or len(raw_values) != len(keyset):
+            raise ValueError("Cursor does not match this sort order")
+        values = [_load_value(key.column, raw) for key, raw in zip(keyset, raw_values)]
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return direction, values
+
+
+def _order_clauses(keyset: Sequence[KeysetColumn], reverse: bool) -> list:
+    clauses = []
+    for key in keyset:
+        descending = key.descending != reverse
+        clause = key.column.desc() if descending else key.column.asc()
+        if key.nullable:
+            clause = clause.nullsfirst() if reverse else clause.nullslast()
+        clauses.append(clause)
+    return clauses
+
+
+def _column_after(key: KeysetColumn, value: Any, reverse: bool):
+    """Rows whose ``key`` sorts strictly after ``value``"""
+    nulls_after_values = not reverse
+    if value is None:
+        return key.column.isnot(None) if not nulls_after_values else false()
+    # Bind through the column type: plain ``>`` is rejected for True/False values
+    value = literal(value, key.column.type)
+    ascending = key.descending == reverse
+    after = key.column > value if ascending else key.column < value
+    if key.nullable and nulls_after_values:
+        after = or_(after, key.column.is_(None))
+    return after
+
+
+def _keyset_after(keyset: Sequence[KeysetColumn], values: Sequence[Any], reverse: bool):
+    """Expand (a, b, c) > (x, y, z) into an OR of prefix-equality terms"""
+    terms = []
+    for position, (key, value) in enumerate(zip(keyset, values)):
+        equal_prefix = [
+            prev.column.is_(None) if prev_value is None else prev.column == literal(prev_value, prev.column.type)
+            for prev, prev_value in zip(keyset[:position], values[:position])
+        ]
+        terms.append(and_(*equal_prefix, _column_after(key, value, reverse)))
+    return or_(*terms)
+
+
+def keyset_paginate(
+    query: Query,
+    keyset: Sequence[KeysetColumn],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """
+    Fetch one page of ``query`` ordered by ``keyset`` and return
+    (items, next_cursor, prev_cursor).
+
+    Pages are located with a WHERE on the sort key instead of OFFSET, so the cost
+    of a page does not grow with its depth and no count() is needed.
+    """
+    limit = max(limit, 1)
+    direction, values = decode_cursor(cursor, keyset) if cursor else ("next", None)
+    reverse = direction == "prev"
+
+    query = query.order_by(None).order_by(*_order_clauses(keyset, reverse))
+    if values is not None:
+        query = query.filter(_keyset_after(keyset, values, reverse))
+
+    # One extra row tells us whether there is another page in this direction
+    items = query.limit(limit + 1).all()
+    has_more = len(items) > limit
+    items = items[:limit]
+    if reverse:
+        items.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, cursor is not None
+
+    def key_of(item: Any) -> List[Any]:
+        return [getattr(item, key.column.key) for key in keyset]
+
+    next_cursor = encode_cursor(key_of(items[-1]), "next") if items and has_next else None
+    prev_cursor = encode_cursor(key_of(items[0]), "prev") if items and has_prev else None
+    return items, next_cursor, prev_cursor
+
+
+def build_cursor_response(
+    items: List[T], limit: int, next_cursor: Optional[str], prev_cursor: Optional[str]
+) -> CursorPaginatedResponse[T]:
+    """Build a CursorPaginatedResponse from a keyset page."""
+    meta = CursorPageMeta(
+        limit=limit,
+        has_next=next_cursor is not None,
+        has_prev=prev_cursor is not None,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+    return CursorPaginatedResponse[T](items=items, meta=meta)
@@ -0,0 +1,265 @@
+# app/core/response_cache.py
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app import logger
+from app.core.config import settings
+from app.core.http_cache import etag_matches, not_modified, weak_etag
+from app.db.session import AnySession
+
+GENERATION_KEY = "respcache:gen:{user_id}"
+ENTRY_KEY = "respcache:entry:{user_id}:{etag}"
+# Generations outlive the entries they version by a wide margin
+GENERATION_TTL_SECONDS = 7 * 24 * 3600
+
+
+class ResponseCache:
+    """
+    Per-user cache of serialized GET responses.
+
+    Entries are keyed by (user, route, params, version) through the response
+    ETag, so a stale entry is never looked up once the version moves on:
+
+    * with Redis, the version is a per-user generation counter that every
+      mutation in ListsService / TasksService bumps, so a hit costs no query;
+    * without Redis (or while it is unreachable) entries live in an in-process
+      LRU and the version is the route's cheap aggregate validator, which
+      stays correct across workers at the cost of that one query.
+
+    A user whose bump has not reached Redis yet is served through the
+    validator path on this worker until it does (retried on their next
+    request) or until every entry it should have invalidated has expired.
+
+    Bodies stored under a generation are built on the primary: a lagging
+    replica would store an old body under the new generation, and every
+    client would be served it until the next bump.
+    """
+
+    def __init__(self, enabled: bool, ttl_seconds: int, max_entries: int, redis_url: Optional[str] = None):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+        self._async_redis = None
+        if enabled and redis_url:
+            import redis
+            import redis.asyncio
+
+            self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.1, socket_connect_timeout=0.1)
+            self._async_redis = redis.asyncio.Redis.from_url(
+                redis_url, socket_timeout=0.1, socket_connect_timeout=0.1
+            )
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.saved_ms = 0.0
+        self._build_ms: Dict[str, Tuple[int, float]] = {}
+        # user_id -> monotonic deadline: bumps not yet applied in Redis
+        self._pending: Dict[int, float] = {}
+        self._bump_tasks: Set[asyncio.Task] = set()
+
+    def bump(self, user_id: int) -> None:
+        """
+        Invalidate every cached response of a user; called from services after
+        commit. From a worker thread the Redis round trip is made here; on the
+        event loop (async sessions) it is scheduled instead of blocking it, and
+        the async services await it through ``settle``.
+        """
+        if self._redis is None:
+            return
+        with self._lock:
+            # Past the TTL every entry of the old generation is gone anyway
+            self._pending[user_id] = time.monotonic() + self.ttl_seconds
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            task = loop.create_task(self._apply_bump(user_id))
+            self._bump_tasks.add(task)
+            task.add_done_callback(self._bump_tasks.discard)
+            return
+        key = GENERATION_KEY.format(user_id=user_id)
+        try:
+            pipe = self._redis.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, GENERATION_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache generation bump failed for user {user_id}: {str(e)}")
+            return
+        self._applied(user_id)
+
+    async def _apply_bump(self, user_id: int) -> bool:
+        key = GENERATION_KEY.format(user_id=user_id)
+        try:
+            pipe = self._async_redis.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, GENERATION_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache generation bump failed for user {user_id}: {str(e)}")
+            return False
+        self._applied(user_id)
+        return True
+
+    async def settle(self) -> None:
+        """
+        Wait for the bumps scheduled on the event loop, so a write responds only
+        once the other workers see the new generation.
+        """
+        if self._bump_tasks:
+            await asyncio.gather(*self._bump_tasks)
+
+    def _applied(self, user_id: int) -> None:
+        with self._lock:
+            self._pending.pop(user_id, None)
+
+    async def _bump_pending(self, user_id: int) -> bool:
+        """Retry a bump that has not reached Redis; False while it still hasn't"""
+        with self._lock:
+            deadline = self._pending.get(user_id)
+            if deadline is not None and deadline <= time.monotonic():
+                del self._pending[user_id]
+                deadline = None
+        if deadline is None:
+            return True
+        return await self._apply_bump(user_id)
+
+    async def _generation(self, user_id: int) -> Optional[bytes]:
+        if self._async_redis is None:
+            return None
+        try:
+            return await self._async_redis.get(GENERATION_KEY.format(user_id=user_id)) or b"0"
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache generation read failed: {str(e)}")
+            return None
+
+    async def _get(self, key: str, shared: bool) -> Optional[bytes]:
+        if shared:
+            try:
+                return await self._async_redis.get(key)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Response cache read failed: {str(e)}")
+                return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    async def _set(self, key: str, body: bytes, shared: bool) -> None:
+        if shared:
+            try:
+                await self._async_redis.set(key, body, ex=self.ttl_seconds)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Response cache write failed: {str(e)}")
+            return
+        with self._lock:
+            self._entries[key] = (body, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _record_hit(self, route: str) -> None:
+        with self._lock:
+            self.hits += 1
+            count, total_ms = self._build_ms.get(route, (0, 0.0))
+            if count:
+                self.saved_ms += total_ms / count
+
+    def _record_miss(self, route: str, build_ms: float) -> None:
+        with self._lock:
+            self.misses += 1
+            count, total_ms = self._build_ms.get(route, (0, 0.0))
+            self._build_ms[route] = (count + 1, total_ms + build_ms)
+
+    async def respond(
+        self,
+        request: Request,
+        db: AnySession,
+        user_id: int,
+        route: str,
+        params: tuple,
+        version: Callable[[], Awaitable[tuple]],
+        build: Callable[[], Awaitable[BaseModel]],
+        cache_control: str
+    ) -> Response:
+        """
+        Serve a GET from the cache, honoring If-None-Match.
+
+        ``version`` returns the route's aggregate validator (it may raise, e.g.
+        404); ``build`` produces the response model on a miss, reading through
+        ``db``.
+        """
+        generation = None
+        if self.enabled and await self._bump_pending(user_id):
+            generation = await self._generation(user_id)
+        shared = generation is not None
+        validator = ("gen", generation) if shared else await version()
+
+        etag = weak_etag(route, user_id, *params, *validator)
+        if etag_matches(request, etag):
+            return not_modified(etag, cache_control)
+
+        key = ENTRY_KEY.format(user_id=user_id, etag=etag)
+        body = await self._get(key, shared) if self.enabled else None
+        if body is not None:
+            self._record_hit(route)
+        else:
+            if shared:
+                db.info["pinned"] = True
+            started = time.perf_counter()
+            body = (await build()).model_dump_json().encode()
+            if self.enabled:
+                self._record_miss(route, (time.perf_counter() - started) * 1000)
+                await self._set(key, body, shared)
+
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": cache_control}
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "backend": "redis" if self._redis is not None else "memory",
+                "local_entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "errors": self.errors,
+                "pending_bumps": len(self._pending),
+                "estimated_saved_ms": round(self.saved_ms, 1),
+                "avg_build_ms": {
+                    route: round(total_ms / count, 2) for route, (count, total_ms) in self._build_ms.items()
+                },
+            }
+
+
+response_cache = ResponseCache(
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    redis_url=settings.REDIS_URL if settings.RESPONSE_CACHE_REDIS_ENABLED else None,
+)
@@ -0,0 +1,44 @@
+# app/core/responses.py
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (datetimes, dates, enums and UUIDs natively).
+
+    For routes that return plain dicts or rows (the internal stats endpoints).
+    Never set it on a route with a ``response_model``, nor as the app default:
+    any explicit response class turns off FastAPI's fast path, which dumps the
+    validated model straight to JSON bytes with pydantic-core.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that closes its body generator, then awaits ``on_close``,
+    however the response ends. On a client disconnect Starlette just drops the
+    generator (its ``finally`` waits for garbage collection) and, under ASGI
+    spec 2.4, skips ``background`` altogether.
+    """
+
+    def __init__(self, *args, on_close: Optional[Callable[[], Awaitable[None]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            if self.on_close is not None:
+                # Also covers a generator that never started, whose finally can't run
+                await self.on_close()
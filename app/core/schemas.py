@@ -1,4 +1,4 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -17,4 +17,15 @@ class PageMeta(BaseModel):
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
-    meta: PageMeta
\ No newline at end of file
+    meta: PageMeta
+
+class CursorPageMeta(BaseModel):
+    limit: int
+    has_next: bool
+    has_prev: bool
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    items: List[T]
+    meta: CursorPageMeta
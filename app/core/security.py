@@ -1,27 +1,23 @@
 # app/core/security.py
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import Optional
 from app import logger
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jose import JWTError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from app.core.config import settings
 from app.core.schemas import UserTokenPayload
-
-
-# Setup password hasher
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.tokens import token_service
+from app.domains.auth.hashing import pwd_context
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-# Token config
+# Token config (issuing and verification live in app.core.tokens)
 SECRET_KEY = settings.SECRET_KEY
-ALGORITHM = "HS256"
-# Default to expire at 5h for user session
-ACCESS_TOKEN_EXPIRE_MINUTES = 300
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 INVITE_TOKEN_EXPIRE_HOURS = 48
 RESET_TOKEN_EXPIRE_HOURS = 2
 
@@ -36,15 +32,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 # --- JWT Token Handling --- #
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return token_service.create_access_token(data, expires_delta)
 
 
 def decode_token(token: str) -> dict:
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return token_service.decode(token)
     except JWTError:
         raise ValueError("Invalid or expired token")
 
@@ -58,7 +51,7 @@ def create_reset_token(email: str) -> str:
 
 def verify_reset_token(token: str) -> str:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = token_service.decode(token)
         email = payload.get("sub")
         if email is None:
             raise ValueError("Token payload missing 'sub'")
@@ -81,7 +74,7 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> UserTokenPayload:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = token_service.decode(token)
         user_id: Optional[str] = payload.get("sub")
         role: Optional[str] = payload.get("role")
         if user_id is None or role is None:
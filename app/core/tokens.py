@@ -0,0 +1,83 @@
+# app/core/tokens.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError
+
+from app.core.config import settings
+
+
+class TokenService:
+    """
+    Single place where JWTs are issued and verified.
+
+    ``decode`` keeps successfully verified payloads in a bounded LRU keyed by the
+    SHA-256 digest of the token, so a client sending the same token on every
+    request pays one full signature check. Cached entries are still checked
+    against their ``exp`` on every hit.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, expire_minutes: int, cache_size: int):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.expire_minutes = expire_minutes
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
+        to_encode = data.copy()
+        expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=self.expire_minutes))
+        to_encode.update({"exp": expire})
+        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> dict:
+        """
+        Verify ``token`` and return a copy of its claims.
+        Raises jose's JWTError (ExpiredSignatureError once expired) when invalid.
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(digest)
+            if entry is not None:
+                payload, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._cache.move_to_end(digest)
+                    self.hits += 1
+                    return dict(payload)
+                del self._cache[digest]
+                raise ExpiredSignatureError("Signature has expired.")
+            self.misses += 1
+
+        payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        if self.cache_size > 0:
+            exp = payload.get("exp")
+            with self._lock:
+                self._cache[digest] = (payload, float(exp) if exp is not None else None)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return dict(payload)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._cache), "max_entries": self.cache_size, "hits": self.hits, "misses": self.misses}
+
+
+token_service = TokenService(
+    secret_key=settings.SECRET_KEY,
+    algorithm=settings.ALGORITHM,
+    expire_minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+    cache_size=settings.TOKEN_CACHE_MAX_ENTRIES,
+)
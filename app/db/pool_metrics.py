@@ -0,0 +1,118 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from app.core.config import settings
+
+# Checkout wait buckets in seconds (upper bounds, last one catches the rest)
+WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram"""
+
+    def __init__(self, buckets: Tuple[float, ...] = WAIT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.total += value
+            self.count += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+            return {
+                "count": self.count,
+                "sum_seconds": round(self.total, 6),
+                "buckets": dict(zip(bounds, self.counts)),
+            }
+
+
+class PoolMetrics:
+    """Checkout wait histograms and timeout counters per named pool"""
+
+    def __init__(self):
+        self.wait: Dict[str, Histogram] = {}
+        self.timeouts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, name: str) -> Histogram:
+        with self._lock:
+            return self.wait.setdefault(name, Histogram())
+
+    def observe_wait(self, name: str, seconds: float) -> None:
+        self._histogram(name).observe(seconds)
+
+    def record_timeout(self, name: str) -> None:
+        with self._lock:
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+    def snapshot(self, name: str, pool: Pool) -> dict:
+        """Live gauges plus the wait histogram for one pool"""
+        if isinstance(pool, NullPool):
+            return {"name": name, "mode": "null"}
+
+        data = {"name": name, "mode": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "timeout_seconds": pool.timeout(),
+            })
+        data["checkout_timeouts"] = self.timeouts.get(name, 0)
+        data["checkout_wait"] = self._histogram(name).snapshot()
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout. The pool's logging_name labels the metrics."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record_timeout(self.logging_name or "default")
+            raise
+        finally:
+            pool_metrics.observe_wait(self.logging_name or "default", time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(name: str, is_async: bool = False) -> dict:
+    """create_engine pool arguments built from Settings"""
+    if settings.DB_USE_NULLPOOL:
+        # No client-side pooling, e.g. behind PgBouncer in transaction mode
+        return {"poolclass": NullPool}
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_logging_name": name,
+    }
@@ -0,0 +1,129 @@
+import functools
+import random
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Sequence, TypeVar
+
+from fastapi import Request
+from sqlalchemy import Delete, Insert, Update, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+F = TypeVar("F", bound=Callable)
+
+# Read-your-writes pin, sent back by clients as a cookie or a header
+PIN_COOKIE = "db_pin_until"
+PIN_HEADER = "X-DB-Pin-Until"
+# Scope key holding the pin a request's writes earned, until ReplicaPinMiddleware sends it
+PIN_SCOPE_KEY = "taskflow.replica_pin_until"
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads marked with ``replica_reads`` to a read replica.
+
+    Everything else (writes, flushes, unmarked reads, and reads from a session
+    pinned after a recent write) goes to the primary the session is bound to.
+    A session keeps the replica it first picked: a validator and the body built
+    after it must not come from two replicas lagging by different amounts.
+    """
+
+    def __init__(self, *args, replicas: Sequence[Engine] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self.replicas
+            and self.info.get("read_only")
+            and not self.info.get("pinned")
+            and not self._flushing
+            and not isinstance(clause, (Insert, Update, Delete))
+        ):
+            replica = self.info.get("replica")
+            if replica is None:
+                replica = self.info["replica"] = random.choice(self.replicas)
+            return replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@contextmanager
+def replica_reads(db: Session) -> Iterator[None]:
+    """Allow the statements run inside the block to be served by a replica"""
+    previous = db.info.get("read_only", False)
+    db.info["read_only"] = True
+    try:
+        yield
+    finally:
+        db.info["read_only"] = previous
+
+
+def read_only(method: F) -> F:
+    """Mark a service method as safe to serve from a read replica"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with replica_reads(self.db):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _flushed(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _executed(orm_execute_state):
+    # Core-style DML (INSERT ... RETURNING, UPDATE ... FROM) never flushes
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _committed(session):
+    if not session.info.pop("wrote", False):
+        return
+    # The rest of this request reads its own writes from the primary too
+    session.info["pinned"] = True
+    on_write = session.info.get("on_write")
+    if on_write is not None:
+        on_write()
+
+
+def pinned_until(request: Request) -> Optional[float]:
+    """Read the pin timestamp sent by the client, if any"""
+    value = request.headers.get(PIN_HEADER) or request.cookies.get(PIN_COOKIE)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def is_pinned(request: Request) -> bool:
+    """Whether the client wrote recently enough that its reads must hit the primary"""
+    until = pinned_until(request)
+    return until is not None and until > time.time()
+
+
+def set_pin(request: Request) -> None:
+    """
+    Pin the client's reads to the primary for REPLICA_PIN_SECONDS.
+
+    Recorded on the request scope: ReplicaPinMiddleware puts the header and
+    cookie on whichever response the route ends up sending (a returned
+    Response, a stream, /batch), as long as it has not started yet.
+    """
+    request.scope[PIN_SCOPE_KEY] = int(time.time()) + settings.REPLICA_PIN_SECONDS
+
+
+def bind_request(db: Session, request: Request) -> None:
+    """
+    Apply the client's read-your-writes pin to ``db`` and refresh it on commit.
+
+    ``db`` may be a Session or an AsyncSession; both share the sync session ``info``.
+    """
+    if is_pinned(request):
+        db.info["pinned"] = True
+    db.info["on_write"] = lambda: set_pin(request)
@@ -1,15 +1,140 @@
+from typing import Callable, TypeVar, Union
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
+from app.db.pool_metrics import pool_options
+from app.db.routing import RoutingSession, bind_request
+
+T = TypeVar("T")
 
 DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(DATABASE_URL, echo=False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(DATABASE_URL, echo=False, **pool_options("primary"))
+replica_engines = [
+    create_engine(url, echo=False, **pool_options(f"replica_{index}"))
+    for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, class_=RoutingSession, replicas=replica_engines
+)
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching async driver"""
+    if url.startswith(("postgresql://", "postgresql+psycopg2://")):
+        return "postgresql+psycopg://" + url.split("://", 1)[1]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url.split("://", 1)[1]
+    return url
+
+
+# The async engine is only created when enabled, so deployments on the sync
+# path don't need the async driver extras installed
+async_engine = None
+async_replica_engines = []
+AsyncSessionLocal = None
+if settings.DB_ASYNC_ENABLED:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL or to_async_url(DATABASE_URL), echo=False,
+        **pool_options("primary_async", is_async=True)
+    )
+    async_replica_engines = [
+        create_async_engine(to_async_url(url), echo=False, **pool_options(f"replica_{index}_async", is_async=True))
+        for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+    ]
+    # expire_on_commit=False: routers read ORM attributes after the service commits,
+    # and an implicit refresh outside the greenlet is not allowed on AsyncSession
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replicas=[replica.sync_engine for replica in async_replica_engines]
+    )
+
+AnySession = Union[Session, AsyncSession]
 
-def get_db() -> Session:
+# Engines reported by the internal pool stats endpoint, keyed by pool name
+ENGINES = {"primary": engine}
+ENGINES.update((f"replica_{index}", replica) for index, replica in enumerate(replica_engines))
+if async_engine is not None:
+    ENGINES["primary_async"] = async_engine.sync_engine
+    ENGINES.update(
+        (f"replica_{index}_async", replica.sync_engine) for index, replica in enumerate(async_replica_engines)
+    )
+
+
+# Scope key under which POST /batch hands its session to the sub-requests it dispatches
+SHARED_SESSION_SCOPE_KEY = "taskflow.shared_db"
+
+
+def get_db(request: Request = None) -> Session:
+    if request is not None and SHARED_SESSION_SCOPE_KEY in request.scope:
+        # Owned (and closed) by the batch request
+        yield request.scope[SHARED_SESSION_SCOPE_KEY]
+        return
     db = SessionLocal()
+    # Outside a request (scripts call next(get_db())) there is no pin to carry
+    if replica_engines and request is not None:
+        bind_request(db, request)
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request = None) -> AsyncSession:
+    if request is not None and SHARED_SESSION_SCOPE_KEY in request.scope:
+        yield request.scope[SHARED_SESSION_SCOPE_KEY]
+        return
+    async with AsyncSessionLocal() as db:
+        if async_replica_engines and request is not None:
+            bind_request(db, request)
+        yield db
+
+
+# Session dependency used by the routers, selected by DB_ASYNC_ENABLED
+get_request_db = get_async_db if settings.DB_ASYNC_ENABLED else get_db
+
+
+async def run_in_session(db: AnySession, fn: Callable[[Session], T]) -> T:
+    """
+    Run a callable taking a sync Session without blocking the event loop.
+
+    On an AsyncSession it runs in a greenlet on top of the async driver; on a
+    plain Session it is sent to the threadpool, exactly like a sync ``def`` route.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn)
+    return await run_in_threadpool(fn, db)
+
+
+class AsyncService:
+    """
+    Awaitable facade over a sync service class.
+
+    Every public method of ``service_class`` becomes a coroutine executed through
+    ``run_in_session``, so one service implementation serves both database paths.
+    """
+    service_class: type
+
+    def __init__(self, db: AnySession):
+        self.db = db
+
+    async def _call(self, name: str, *args, **kwargs):
+        method = getattr(self.service_class, name)
+        return await run_in_session(
+            self.db, lambda session: method(self.service_class(session), *args, **kwargs)
+        )
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        getattr(self.service_class, name)
+
+        async def call(*args, **kwargs):
+            return await self._call(name, *args, **kwargs)
+
+        return call
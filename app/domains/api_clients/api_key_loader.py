@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from app.domains.api_clients.models import APIClient
 
-def load_active_hashed_keys(db: Session) -> set[str]:
-    return {
-        client.api_key for client in db.query(APIClient).filter(APIClient.active == True).all()
-    }
+def load_active_hashed_keys(db: Session) -> dict[str, str]:
+    """Map the hashed key of every active client to its client id"""
+    rows = db.query(APIClient.api_key, APIClient.id).filter(APIClient.active == True).all()
+    return {api_key: client_id for api_key, client_id in rows}
@@ -1,5 +1,5 @@
 from uuid import uuid4
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Boolean, Enum as SqlEnum
+from sqlalchemy import BigInteger, Column, Date, DateTime, ForeignKey, Index, Integer, String, Boolean, Enum as SqlEnum
 from app.db.base import Base
 from sqlalchemy.sql import func
 
@@ -10,4 +10,20 @@ class APIClient(Base):
     name = Column(String, unique=True, nullable=False)
     api_key = Column(String, unique=True, nullable=False)  # Store **hashed**, not plain
     active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class APIClientUsage(Base):
+    """Request and byte counts of one API client over one flush window"""
+    __tablename__ = "api_client_usage"
+
+    id = Column(Integer, primary_key=True, index=True)
+    client_id = Column(String, ForeignKey("api_clients.id", ondelete="CASCADE"), nullable=False)
+    period_start = Column(DateTime(timezone=True), nullable=False)
+    period_end = Column(DateTime(timezone=True), nullable=False)
+    request_count = Column(Integer, nullable=False, default=0)
+    bytes_in = Column(BigInteger, nullable=False, default=0)
+    bytes_out = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_api_client_usage_client_id_period_start", "client_id", "period_start"),
+    )
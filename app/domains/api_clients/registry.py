@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
+
+from app import logger
+from app.db.session import SessionLocal
+from app.domains.api_clients.api_key_loader import load_active_hashed_keys
+from app.domains.api_clients.models import APIClientUsage
+
+
+class APIKeyRegistry:
+    """
+    Hashed API key -> client id map, refreshed in the background.
+
+    Every refresh builds a complete new dict and rebinds ``self.keys`` in one
+    assignment, so request handlers always see either the old or the new set
+    and never wait for a refresh.
+    """
+
+    def __init__(self):
+        self.keys: Dict[str, str] = {}
+        self.loaded_at: Optional[datetime] = None
+
+    def lookup(self, hashed_key: str) -> Optional[str]:
+        return self.keys.get(hashed_key)
+
+    def refresh(self) -> None:
+        """Reload the active keys and swap them in when they changed"""
+        db = SessionLocal()
+        try:
+            keys = load_active_hashed_keys(db)
+        finally:
+            db.close()
+
+        added = keys.keys() - self.keys.keys()
+        removed = self.keys.keys() - keys.keys()
+        if added or removed or self.loaded_at is None:
+            self.keys = keys
+            logger.info(f"API key registry: {len(keys)} active keys (+{len(added)} / -{len(removed)})")
+        self.loaded_at = datetime.now(timezone.utc)
+
+    async def run(self, interval: float) -> None:
+        """Poll for added and revoked keys until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await run_in_threadpool(self.refresh)
+            except Exception as e:
+                # Keep serving the last good set
+                logger.error(f"API key registry refresh failed: {str(e)}")
+
+
+class UsageRecorder:
+    """
+    Per-client request and byte counters, flushed to api_client_usage in batches.
+
+    ``record`` runs on the event loop and only touches a dict; ``flush`` swaps
+    the dict out first, so recording never waits on the database.
+    """
+
+    def __init__(self):
+        self._counts: Dict[str, List[int]] = {}
+        self._period_start = datetime.now(timezone.utc)
+
+    def record(self, client_id: str, bytes_in: int, bytes_out: int) -> None:
+        counts = self._counts.get(client_id)
+        if counts is None:
+            counts = self._counts[client_id] = [0, 0, 0]
+        counts[0] += 1
+        counts[1] += bytes_in
+        counts[2] += bytes_out
+
+    def take(self) -> tuple:
+        """Detach the counters collected so far with their time window"""
+        counts, self._counts = self._counts, {}
+        period_start, self._period_start = self._period_start, datetime.now(timezone.utc)
+        return counts, period_start, self._period_start
+
+    @staticmethod
+    def write(counts: Dict[str, List[int]], period_start: datetime, period_end: datetime) -> None:
+        db = SessionLocal()
+        try:
+            db.execute(insert(APIClientUsage), [
+                {
+                    "client_id": client_id,
+                    "period_start": period_start,
+                    "period_end": period_end,
+                    "request_count": request_count,
+                    "bytes_in": bytes_in,
+                    "bytes_out": bytes_out,
+                }
+                for client_id, (request_count, bytes_in, bytes_out) in counts.items()
+            ])
+            db.commit()
+        finally:
+            db.close()
+
+    async def flush(self) -> None:
+        counts, period_start, period_end = self.take()
+        if not counts:
+            return
+        try:
+            await run_in_threadpool(self.write, counts, period_start, period_end)
+        except Exception as e:
+            logger.error(f"Failed to flush API usage for {len(counts)} clients: {str(e)}")
+
+    async def run(self, interval: float) -> None:
+        """Flush every ``interval`` seconds until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+
+api_key_registry = APIKeyRegistry()
+usage_recorder = UsageRecorder()
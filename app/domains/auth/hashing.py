@@ -0,0 +1,156 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Work factors considered by the calibration (each step doubles the cost)
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+
+def bcrypt_rounds() -> int:
+    return pwd_context.handler("bcrypt").default_rounds
+
+
+def configure_rounds(rounds: int) -> None:
+    """
+    Hash new passwords with ``rounds`` and flag stored hashes with any other
+    cost as needing an update, so they are rehashed on the next login.
+    """
+    pwd_context.update(bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds)
+
+
+def measure_rounds(rounds: int, samples: int = 3) -> float:
+    """Median milliseconds of one bcrypt hash at ``rounds`` on this machine"""
+    handler = pwd_context.handler("bcrypt").using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def calibrate_rounds(target_ms: float) -> int:
+    """
+    Highest work factor whose hash time stays within ``target_ms`` (never below
+    MIN_BCRYPT_ROUNDS). Extrapolates from the cheapest cost, since each extra
+    round doubles the time.
+    """
+    base_ms = measure_rounds(MIN_BCRYPT_ROUNDS)
+    rounds = MIN_BCRYPT_ROUNDS
+    while rounds < MAX_BCRYPT_ROUNDS and base_ms * 2 ** (rounds + 1 - MIN_BCRYPT_ROUNDS) <= target_ms:
+        rounds += 1
+    return rounds
+
+
+if settings.BCRYPT_ROUNDS:
+    configure_rounds(settings.BCRYPT_ROUNDS)
+
+
+# Module-level functions so the pool workers can unpickle them
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify and, when the stored cost differs from the configured one, return a new hash"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def run_with_rounds(rounds: int, fn: Callable, *args):
+    """Pool worker entry point: adopt the submitter's work factor before ``fn``"""
+    if bcrypt_rounds() != rounds:
+        configure_rounds(rounds)
+    return fn(*args)
+
+
+class PasswordHasher:
+    """
+    Async bcrypt front end backed by a process pool.
+
+    Hashes run outside the worker process, so a login burst costs the event loop
+    nothing. At most ``max_pending`` calls may be queued or running; beyond that
+    callers get a 503 instead of waiting behind seconds of queued bcrypt work.
+    With ``workers=0`` the calls run in the threadpool (handy for tests).
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that already runs an event loop and threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def _run(self, fn: Callable, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(fn, *args)
+            # The rounds travel with every call: configure_rounds may run after the workers started
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), run_with_rounds, bcrypt_rounds(), fn, *args
+            )
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return await self._run(verify_and_update, plain_password, hashed_password)
+
+    def set_rounds(self, rounds: int) -> None:
+        """Switch the work factor; pool workers pick it up with their next call"""
+        configure_rounds(rounds)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "bcrypt_rounds": bcrypt_rounds(),
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
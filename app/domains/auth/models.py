@@ -1,10 +1,23 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import BigInteger, Column, Integer, String, Boolean, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Token lookups in verify_email / reset_password; partial since most rows are NULL
+        Index(
+            "ix_users_verification_token", "verification_token",
+            postgresql_where=text("verification_token IS NOT NULL"),
+            sqlite_where=text("verification_token IS NOT NULL"),
+        ),
+        Index(
+            "ix_users_reset_token", "reset_token",
+            postgresql_where=text("reset_token IS NOT NULL"),
+            sqlite_where=text("reset_token IS NOT NULL"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -15,6 +28,8 @@ class User(Base):
     reset_token = Column(String, nullable=True)
     reset_token_expires = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Last change sequence handed out for this user's lists, tasks and tombstones
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
     
     # Relationships
     lists = relationship("List", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app import logger
+from app.core.config import settings
+from .schemas import Principal
+
+REDIS_KEY_PREFIX = "principal:"
+
+
+class PrincipalCache:
+    """
+    Two-tier cache of authenticated principals keyed by user id.
+
+    The first tier is an in-process TTL + LRU map; the optional second tier is
+    Redis, shared by every worker. Only verified principals are cached, so the
+    unverified -> verified transition can never be served stale.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int, redis_url: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+        if redis_url:
+            import redis
+
+            self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.1, socket_connect_timeout=0.1)
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @property
+    def has_shared_tier(self) -> bool:
+        return self._redis is not None
+
+    def get_local(self, user_id: int) -> Optional[Principal]:
+        """In-process lookup; cheap enough to call on the event loop"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[user_id]
+        return None
+
+    def get_shared(self, user_id: int) -> Optional[Principal]:
+        """Redis lookup (blocking); promotes hits into the local tier"""
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(f"{REDIS_KEY_PREFIX}{user_id}")
+        except Exception as e:
+            logger.warning(f"Principal cache Redis read failed: {str(e)}")
+            return None
+        if raw is None:
+            return None
+        principal = Principal.model_validate_json(raw)
+        self._store_local(principal)
+        with self._lock:
+            self.redis_hits += 1
+        return principal
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def set(self, principal: Principal) -> None:
+        """Cache a principal in both tiers (blocking when Redis is configured)"""
+        if not self.enabled or not principal.is_verified:
+            return
+        self._store_local(principal)
+        if self._redis is not None:
+            try:
+                self._redis.set(
+                    f"{REDIS_KEY_PREFIX}{principal.id}", principal.model_dump_json(), ex=self.ttl_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Principal cache Redis write failed: {str(e)}")
+
+    def _store_local(self, principal: Principal) -> None:
+        with self._lock:
+            self._entries[principal.id] = (principal, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's principal from both tiers. Other workers' local tiers
+        expire within ttl_seconds.
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self.invalidations += 1
+        if self._redis is not None:
+            try:
+                self._redis.delete(f"{REDIS_KEY_PREFIX}{user_id}")
+            except Exception as e:
+                logger.warning(f"Principal cache Redis invalidation failed: {str(e)}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.redis_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "redis_enabled": self._redis is not None,
+                "hits": self.hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.redis_hits) / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    redis_url=settings.REDIS_URL if settings.PRINCIPAL_CACHE_REDIS_ENABLED else None,
+)
@@ -21,6 +21,17 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class Principal(BaseModel):
+    """Slim authenticated-user record resolved from the access token (no password hash)"""
+    id: int
+    name: str
+    email: str
+    is_verified: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
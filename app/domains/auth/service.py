@@ -3,7 +3,10 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 
+from app.db.session import AsyncService
 from . import models, schemas, utils
+from .hashing import password_hasher
+from .principal_cache import principal_cache
 from .tasks import send_verification_email_task, send_password_reset_email_task, send_welcome_email_task
 
 
@@ -11,22 +14,30 @@ class AuthService:
     def __init__(self, db: Session):
         self.db = db
 
-    def register_user(self, payload: schemas.UserRegister) -> models.User:
-        """Register a new user"""
-        # Check if user exists
-        existing_user = self.db.query(models.User).filter(
-            models.User.email == payload.email
+    def get_user_by_email(self, email: str) -> Optional[models.User]:
+        """Get a user by email"""
+        return self.db.query(models.User).filter(
+            models.User.email == email
         ).first()
 
-        if existing_user:
+    def ensure_email_available(self, email: str) -> None:
+        """Raise if the email is already registered"""
+        if self.get_user_by_email(email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
 
+    def register_user(self, payload: schemas.UserRegister) -> models.User:
+        """Register a new user"""
+        # Check if user exists
+        self.ensure_email_available(payload.email)
+        return self.create_user(payload, utils.get_password_hash(payload.password))
+
+    def create_user(self, payload: schemas.UserRegister, hashed_password: str) -> models.User:
+        """Create a new user with an already hashed password"""
         # Create new user
         verification_token = utils.generate_verification_token()
-        hashed_password = utils.get_password_hash(payload.password)
 
         db_user = models.User(
             name=payload.name,
@@ -51,11 +62,31 @@ class AuthService:
 
     def login_user(self, payload: schemas.UserLogin) -> dict:
         """Login user and return JWT token"""
-        user = self.db.query(models.User).filter(
-            models.User.email == payload.email
-        ).first()
+        user = self.get_user_by_email(payload.email)
+        password_valid, new_hash = False, None
+        if user is not None:
+            password_valid, new_hash = utils.verify_and_update(payload.password, user.hashed_password)
+        return self.finish_login(user, password_valid, new_hash)
+
+    def finish_login(self, user: Optional[models.User], password_valid: bool, new_hash: Optional[str]) -> dict:
+        """
+        Store a pending rehash, then issue the token. Kept in one session call:
+        the rehash commit expires ``user``, and reading it again must refresh
+        inside the session rather than on the event loop.
+        """
+        if password_valid and new_hash:
+            self.update_password_hash(user, new_hash)
+        return self.complete_login(user, password_valid)
+
+    def update_password_hash(self, user: models.User, hashed_password: str) -> None:
+        """Store a rehash of the user's unchanged password (e.g. after a bcrypt cost change)"""
+        user.hashed_password = hashed_password
+        self.db.commit()
 
-        if not user or not utils.verify_password(payload.password, user.hashed_password):
+    @staticmethod
+    def complete_login(user: Optional[models.User], password_valid: bool) -> dict:
+        """Check the login outcome and issue the JWT token"""
+        if not user or not password_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -86,6 +117,7 @@ class AuthService:
         user.verification_token = None
         self.db.commit()
         self.db.refresh(user)
+        principal_cache.invalidate(user.id)
 
         # Send welcome email asynchronously via Celery
         send_welcome_email_task.delay(
@@ -120,6 +152,11 @@ class AuthService:
 
     def reset_password(self, token: str, new_password: str) -> models.User:
         """Reset password with token"""
+        user = self.get_user_for_reset(token)
+        return self.set_password(user, utils.get_password_hash(new_password))
+
+    def get_user_for_reset(self, token: str) -> models.User:
+        """Get the user owning a valid, unexpired reset token"""
         user = self.db.query(models.User).filter(
             models.User.reset_token == token
         ).first()
@@ -136,11 +173,41 @@ class AuthService:
                 detail="Reset token has expired"
             )
 
-        user.hashed_password = utils.get_password_hash(new_password)
+        return user
+
+    def set_password(self, user: models.User, hashed_password: str) -> models.User:
+        """Store a new password hash and clear the reset token"""
+        user.hashed_password = hashed_password
         user.reset_token = None
         user.reset_token_expires = None
 
         self.db.commit()
         self.db.refresh(user)
+        principal_cache.invalidate(user.id)
+
+        return user
+
 
-        return user
\ No newline at end of file
+class AsyncAuthService(AsyncService):
+    """
+    Awaitable AuthService. Password hashing runs on the bcrypt process pool
+    between the database steps so it never holds the event loop or the threadpool.
+    """
+    service_class = AuthService
+
+    async def register_user(self, payload: schemas.UserRegister) -> models.User:
+        await self._call("ensure_email_available", payload.email)
+        hashed_password = await password_hasher.hash(payload.password)
+        return await self._call("create_user", payload, hashed_password)
+
+    async def login_user(self, payload: schemas.UserLogin) -> dict:
+        user = await self._call("get_user_by_email", payload.email)
+        password_valid, new_hash = False, None
+        if user is not None:
+            password_valid, new_hash = await password_hasher.verify_and_update(payload.password, user.hashed_password)
+        return await self._call("finish_login", user, password_valid, new_hash)
+
+    async def reset_password(self, token: str, new_password: str) -> models.User:
+        user = await self._call("get_user_for_reset", token)
+        hashed_password = await password_hasher.hash(new_password)
+        return await self._call("set_password", user, hashed_password)
@@ -1,33 +1,26 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from jose import JWTError
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from app.core.config import settings
-from app.db.session import get_db
+from app.core.tokens import token_service
+from app.db.routing import replica_reads
+from app.db.session import AnySession, get_request_db, run_in_session
+from app.domains.auth.hashing import get_password_hash, pwd_context, verify_and_update, verify_password  # noqa: F401
 from app.domains.auth.models import User
+from app.domains.auth.principal_cache import principal_cache
+from app.domains.auth.schemas import Principal
 import secrets
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+# Scope key under which POST /batch passes its authenticated principal to the sub-requests
+PRINCIPAL_SCOPE_KEY = "taskflow.principal"
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return token_service.create_access_token(data, expires_delta)
 
 def generate_verification_token() -> str:
     return secrets.token_urlsafe(32)
@@ -35,10 +28,23 @@ def generate_verification_token() -> str:
 def generate_reset_token() -> str:
     return secrets.token_urlsafe(32)
 
+def load_principal(db: Session, user_id: int) -> Optional[Principal]:
+    """Look up the authenticated user's principal columns; a replica is good enough for this read"""
+    with replica_reads(db):
+        row = db.query(
+            User.id, User.name, User.email, User.is_verified, User.created_at
+        ).filter(User.id == user_id).first()
+    return Principal.model_validate(row) if row else None
+
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AnySession = Depends(get_request_db)
+) -> Principal:
+    if PRINCIPAL_SCOPE_KEY in request.scope:
+        # Sub-request of a batch: the token was checked once for all of them
+        return request.scope[PRINCIPAL_SCOPE_KEY]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -46,7 +52,7 @@ async def get_current_user(
     )
     try:
         token = credentials.credentials
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = token_service.decode(token)
         user_id_str = payload.get("sub")
         if user_id_str is None:
             raise credentials_exception
@@ -54,12 +60,23 @@ async def get_current_user(
     except (JWTError, ValueError, TypeError):
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    principal = principal_cache.get_local(user_id)
+    if principal is None and principal_cache.has_shared_tier:
+        principal = await run_in_threadpool(principal_cache.get_shared, user_id)
+    if principal is not None:
+        return principal
+
+    principal_cache.record_miss()
+    principal = await run_in_session(db, lambda session: load_principal(session, user_id))
+    if principal is None:
         raise credentials_exception
-    return user
+    if principal_cache.has_shared_tier:
+        await run_in_threadpool(principal_cache.set, principal)
+    else:
+        principal_cache.set(principal)
+    return principal
 
-async def get_verified_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_verified_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     if not current_user.is_verified:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
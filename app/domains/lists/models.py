@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -14,7 +14,15 @@ class List(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Per-user change sequence of the last write (see app.domains.sync)
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     # Relationships
     user = relationship("User", back_populates="lists")
-    tasks = relationship("Task", back_populates="list", cascade="all, delete-orphan")
\ No newline at end of file
+    tasks = relationship("Task", back_populates="list", cascade="all, delete-orphan")
+
+
+# Ownership filter + newest-first ordering used by every ListsService query
+Index("ix_lists_user_id_created_at", List.user_id, List.created_at.desc(), List.id)
+# Delta sync: the user's lists changed after a watermark
+Index("ix_lists_user_id_change_seq", List.user_id, List.change_seq)
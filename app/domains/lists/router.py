@@ -1,54 +1,62 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-
-from app.db.session import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import Optional, Tuple
+
+from app.core.fields import sparse_fields, sparse_response
+from app.core.http_cache import PRIVATE_REVALIDATE, cache_control
+from app.core.response_cache import response_cache
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.schemas import CursorPaginatedResponse
+from app.db.session import AnySession, get_request_db
 from app.domains.auth.utils import get_verified_user
-from app.domains.auth.models import User
+from app.domains.auth.schemas import Principal
 from . import schemas, service
 
 router = APIRouter(prefix="/lists", tags=["lists"])
 
 
-@router.get("", response_model=List[schemas.ListResponse])
-def get_lists(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+@router.get(
+    "",
+    response_model=CursorPaginatedResponse[schemas.ListResponse],
+    dependencies=[cache_control(PRIVATE_REVALIDATE)]
+)
+async def get_lists(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[Tuple[str, ...]] = sparse_fields(schemas.ListResponse),
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
-    Get all lists for the authenticated user.
-    """
-    lists_service = service.ListsService(db)
-    lists = lists_service.get_all_lists(current_user.id)
+    Get a page of lists for the authenticated user, newest first.
 
-    # Convert to response schema
-    return [
-        schemas.ListResponse(
-            id=list_obj.id,
-            name=list_obj.name,
-            color=list_obj.color,
-            description=list_obj.description,
-            user_id=list_obj.user_id,
-            task_count=0,  # TODO: Add task counting when Task model exists
-            completed_count=0,
-            created_at=list_obj.created_at,
-            updated_at=list_obj.updated_at
-        )
-        for list_obj in lists
-    ]
+    `fields` narrows each list to those fields (`id` always); task counts are
+    only computed when `task_count` or `completed_count` is among them.
+
+    Responses carry a weak ETag; send it back in `If-None-Match` to get
+    `304 Not Modified` while the user's lists and their tasks are unchanged.
+    """
+    lists_service = service.AsyncListsService(db)
+    return await response_cache.respond(
+        request, db, current_user.id, "lists", (limit, cursor, fields),
+        version=lambda: lists_service.get_lists_version(current_user.id),
+        build=lambda: lists_service.get_all_lists(current_user.id, limit, cursor, fields),
+        cache_control=PRIVATE_REVALIDATE
+    )
 
 
 @router.get("/{list_id}", response_model=schemas.ListResponse)
-def get_list(
+async def get_list(
     list_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    fields: Optional[Tuple[str, ...]] = sparse_fields(schemas.ListResponse),
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
-    Get a specific list by ID.
+    Get a specific list by ID. `fields` narrows it to those fields (`id` always).
     """
-    lists_service = service.ListsService(db)
-    list_obj = lists_service.get_list_by_id(list_id, current_user.id)
+    lists_service = service.AsyncListsService(db)
+    list_obj = await lists_service.get_list_by_id(list_id, current_user.id, fields)
 
     if not list_obj:
         raise HTTPException(
@@ -56,78 +64,44 @@ def get_list(
             detail="List not found"
         )
 
-    return schemas.ListResponse(
-        id=list_obj.id,
-        name=list_obj.name,
-        color=list_obj.color,
-        description=list_obj.description,
-        user_id=list_obj.user_id,
-        task_count=0,  # TODO: Add task counting when Task model exists
-        completed_count=0,
-        created_at=list_obj.created_at,
-        updated_at=list_obj.updated_at
-    )
+    return list_obj if fields is None else sparse_response(list_obj)
 
 
 @router.post("", response_model=schemas.ListResponse, status_code=status.HTTP_201_CREATED)
-def create_list(
+async def create_list(
     list_data: schemas.ListCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
     Create a new list for the authenticated user.
     """
-    lists_service = service.ListsService(db)
-    list_obj = lists_service.create_list(list_data, current_user.id)
-
-    return schemas.ListResponse(
-        id=list_obj.id,
-        name=list_obj.name,
-        color=list_obj.color,
-        description=list_obj.description,
-        user_id=list_obj.user_id,
-        task_count=0,
-        completed_count=0,
-        created_at=list_obj.created_at,
-        updated_at=list_obj.updated_at
-    )
+    lists_service = service.AsyncListsService(db)
+    return await lists_service.create_list(list_data, current_user.id)
 
 @router.put("/{list_id}", response_model=schemas.ListResponse)
-def update_list(
+async def update_list(
     list_id: int,
     list_data: schemas.ListUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
     Update an existing list. Only provided fields will be updated.
     """
-    lists_service = service.ListsService(db)
-    list_obj = lists_service.update_list(list_id, list_data, current_user.id)
-
-    return schemas.ListResponse(
-        id=list_obj.id,
-        name=list_obj.name,
-        color=list_obj.color,
-        description=list_obj.description,
-        user_id=list_obj.user_id,
-        task_count=0,
-        completed_count=0,
-        created_at=list_obj.created_at,
-        updated_at=list_obj.updated_at
-    )
+    lists_service = service.AsyncListsService(db)
+    return await lists_service.update_list(list_id, list_data, current_user.id)
 
 
 @router.delete("/{list_id}", response_model=schemas.MessageResponse)
-def delete_list(
+async def delete_list(
     list_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
     Delete a list.
     """
-    lists_service = service.ListsService(db)
-    lists_service.delete_list(list_id, current_user.id)
+    lists_service = service.AsyncListsService(db)
+    await lists_service.delete_list(list_id, current_user.id)
     return {"message": "List deleted successfully"}
\ No newline at end of file
@@ -1,32 +1,168 @@
-from typing import List as ListType, Optional
-from sqlalchemy.orm import Session
+from typing import Dict, List as ListType, Optional, Tuple
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, load_only
 from fastapi import HTTPException, status
 
+from app.core.fields import sparse_columns, sparse_model
+from app.core.pagination import DEFAULT_PAGE_SIZE, KeysetColumn, build_cursor_response, keyset_paginate
+from app.core.response_cache import response_cache
+from app.core.schemas import CursorPaginatedResponse
+from app.db.routing import read_only
+from app.db.session import AsyncService
+from app.domains.sync.changes import publish_change, record_tombstones, reserve_change_seqs
+from app.domains.tasks.models import Task
 from . import models, schemas
 
+# Newest first; id breaks ties between lists created in the same instant
+LIST_KEYSET = (
+    KeysetColumn(models.List.created_at, descending=True),
+    KeysetColumn(models.List.id),
+)
+
+# Columns read for ListResponse; plain rows skip ORM identity-map bookkeeping
+LIST_RESPONSE_COLUMNS = (
+    models.List.id, models.List.name, models.List.color, models.List.description,
+    models.List.user_id, models.List.created_at, models.List.updated_at,
+)
+
+# Aggregates over tasks: (task_count, completed_count)
+TASK_COUNT = func.count(Task.id)
+COMPLETED_COUNT = func.coalesce(func.sum(case((Task.completed == True, 1), else_=0)), 0)
+COUNT_FIELDS = ("task_count", "completed_count")
+
 
 class ListsService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all_lists(self, user_id: int) -> ListType[models.List]:
+    @staticmethod
+    def to_response(list_obj: models.List, task_count: int = 0, completed_count: int = 0) -> schemas.ListResponse:
         """
-        Get all lists for a user
+        Build the response schema for a list and its task counts
         """
-        return self.db.query(models.List).filter(
-            models.List.user_id == user_id
-        ).order_by(models.List.created_at.desc()).all()
+        return schemas.ListResponse(
+            id=list_obj.id,
+            name=list_obj.name,
+            color=list_obj.color,
+            description=list_obj.description,
+            user_id=list_obj.user_id,
+            task_count=task_count,
+            completed_count=completed_count,
+            created_at=list_obj.created_at,
+            updated_at=list_obj.updated_at
+        )
+
+    @staticmethod
+    def to_sparse_response(
+        fields: Tuple[str, ...], values: Dict, task_count: int = 0, completed_count: int = 0
+    ) -> schemas.ListResponse:
+        """
+        Build the ListResponse narrowed to ``fields`` from the column values read for them
+        """
+        return sparse_model(schemas.ListResponse, fields).model_validate(
+            {**values, "task_count": task_count, "completed_count": completed_count}
+        )
+
+    @staticmethod
+    def wants_counts(fields: Optional[Tuple[str, ...]]) -> bool:
+        return fields is None or any(field in COUNT_FIELDS for field in fields)
+
+    def get_task_counts(self, list_ids: ListType[int]) -> Dict[int, Tuple[int, int]]:
+        """
+        Get (task_count, completed_count) for several lists in one grouped query.
+        Lists without tasks are absent from the result.
+        """
+        if not list_ids:
+            return {}
+
+        rows = self.db.query(Task.list_id, TASK_COUNT, COMPLETED_COUNT).filter(
+            Task.list_id.in_(list_ids)
+        ).group_by(Task.list_id).all()
+
+        return {list_id: (task_count, completed_count) for list_id, task_count, completed_count in rows}
 
-    def get_list_by_id(self, list_id: int, user_id: int) -> Optional[models.List]:
+    @read_only
+    def get_lists_version(self, user_id: int) -> Tuple:
         """
-        Get a specific list by ID
+        Validator for a user's lists: (list count, latest list update, task count,
+        latest task update). One aggregate query, no rows loaded.
         """
-        return self.db.query(models.List).filter(
+        return tuple(self.db.query(
+            func.count(models.List.id.distinct()),
+            func.max(models.List.updated_at),
+            func.count(Task.id),
+            func.max(Task.updated_at)
+        ).select_from(models.List).outerjoin(
+            Task, Task.list_id == models.List.id
+        ).filter(
+            models.List.user_id == user_id
+        ).one())
+
+    @read_only
+    def get_all_lists(
+        self,
+        user_id: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> CursorPaginatedResponse[schemas.ListResponse]:
+        """
+        Get one page of a user's lists with their task counts. With ``fields``
+        only those columns (and the sort key) are read and returned, and the
+        counts are only computed when asked for.
+        """
+        query = self.db.query(*sparse_columns(LIST_RESPONSE_COLUMNS, fields, LIST_KEYSET)).filter(
+            models.List.user_id == user_id
+        )
+        lists, next_cursor, prev_cursor = keyset_paginate(query, LIST_KEYSET, limit, cursor)
+
+        # One aggregate query for the whole page instead of one per list
+        counts = self.get_task_counts([list_obj.id for list_obj in lists]) if self.wants_counts(fields) else {}
+
+        if fields is None:
+            items = [self.to_response(list_obj, *counts.get(list_obj.id, (0, 0))) for list_obj in lists]
+        else:
+            items = [
+                self.to_sparse_response(fields, row._mapping, *counts.get(row.id, (0, 0))) for row in lists
+            ]
+        return build_cursor_response(items, limit, next_cursor, prev_cursor)
+
+    @read_only
+    def get_list_by_id(
+        self, list_id: int, user_id: int, fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[schemas.ListResponse]:
+        """
+        Get a specific list by ID with its task counts; with ``fields``, only
+        those are loaded and returned
+        """
+        if not self.wants_counts(fields):
+            # No counts asked for: no join with tasks and no aggregate
+            row = self.db.query(*sparse_columns(LIST_RESPONSE_COLUMNS, fields)).filter(
+                models.List.id == list_id,
+                models.List.user_id == user_id
+            ).first()
+            return self.to_sparse_response(fields, row._mapping) if row else None
+
+        query = self.db.query(models.List, TASK_COUNT, COMPLETED_COUNT).outerjoin(
+            Task, Task.list_id == models.List.id
+        ).filter(
             models.List.id == list_id,
             models.List.user_id == user_id
-        ).first()
+        ).group_by(models.List.id)
+        if fields is not None:
+            query = query.options(load_only(*sparse_columns(LIST_RESPONSE_COLUMNS, fields)))
+        row = query.first()
+
+        if not row:
+            return None
 
-    def create_list(self, payload: schemas.ListCreate, user_id: int) -> models.List:
+        list_obj, task_count, completed_count = row
+        if fields is None:
+            return self.to_response(list_obj, task_count, completed_count)
+        values = {field: getattr(list_obj, field) for field in fields if field not in COUNT_FIELDS}
+        return self.to_sparse_response(fields, values, task_count, completed_count)
+
+    def create_list(self, payload: schemas.ListCreate, user_id: int) -> schemas.ListResponse:
         """
         Create a new list
         """
@@ -34,16 +170,19 @@ class ListsService:
             name=payload.name,
             color=payload.color,
             description=payload.description,
-            user_id=user_id
+            user_id=user_id,
+            change_seq=reserve_change_seqs(self.db, user_id)
         )
 
         self.db.add(db_list)
         self.db.commit()
+        response_cache.bump(user_id)
         self.db.refresh(db_list)
+        publish_change(user_id, "list", "created", [db_list.id], db_list.change_seq)
 
-        return db_list
+        return self.to_response(db_list)
 
-    def update_list(self, list_id: int, payload: schemas.ListUpdate, user_id: int) -> models.List:
+    def update_list(self, list_id: int, payload: schemas.ListUpdate, user_id: int) -> schemas.ListResponse:
         """
         Update an existing list
         """
@@ -62,11 +201,15 @@ class ListsService:
         update_data = payload.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_list, field, value)
+        db_list.change_seq = reserve_change_seqs(self.db, user_id)
 
         self.db.commit()
+        response_cache.bump(user_id)
         self.db.refresh(db_list)
+        publish_change(user_id, "list", "updated", [db_list.id], db_list.change_seq)
 
-        return db_list
+        counts = self.get_task_counts([db_list.id])
+        return self.to_response(db_list, *counts.get(db_list.id, (0, 0)))
 
     def delete_list(self, list_id: int, user_id: int) -> None:
         """
@@ -83,5 +226,22 @@ class ListsService:
                 detail="List not found"
             )
 
+        # The list's tombstone also stands for its tasks, deleted with it
+        change_seq = reserve_change_seqs(self.db, user_id)
+        record_tombstones(self.db, user_id, "list", [list_id], change_seq)
         self.db.delete(db_list)
-        self.db.commit()
\ No newline at end of file
+        self.db.commit()
+        response_cache.bump(user_id)
+        publish_change(user_id, "list", "deleted", [list_id], change_seq)
+
+
+class AsyncListsService(AsyncService):
+    """Awaitable ListsService for the request path"""
+    service_class = ListsService
+
+    async def _call(self, name: str, *args, **kwargs):
+        try:
+            return await super()._call(name, *args, **kwargs)
+        finally:
+            # A write on the event loop only scheduled its generation bump
+            await response_cache.settle()
@@ -0,0 +1,47 @@
+from typing import Sequence
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.core.events.event_payloads import ChangeEventPayload
+from app.core.events.events import event_bus
+from app.domains.auth.models import User
+from app.domains.sync.models import SyncTombstone
+
+CHANGE_EVENT = "sync.change"
+
+
+def reserve_change_seqs(db: Session, user_id: int, count: int = 1) -> int:
+    """
+    Reserve ``count`` consecutive change sequence numbers for a user's next
+    writes and return the first one. Every written list, task and tombstone
+    gets its own number, so a sync page can stop between any two changes.
+
+    The UPDATE holds the user's row lock until commit: a user's writes commit
+    in sequence order, and a sync never sees N + 1 before N.
+    """
+    last = db.execute(
+        update(User).where(User.id == user_id).values(change_seq=User.change_seq + count).returning(User.change_seq),
+        execution_options={"synchronize_session": False}
+    ).scalar_one()
+    return last - count + 1
+
+
+def record_tombstones(db: Session, user_id: int, entity: str, entity_ids: Sequence[int], first_seq: int) -> None:
+    """Record deleted lists or tasks, numbered from ``first_seq`` on"""
+    if not entity_ids:
+        return
+    db.execute(insert(SyncTombstone), [
+        {"user_id": user_id, "entity": entity, "entity_id": entity_id, "change_seq": first_seq + offset}
+        for offset, entity_id in enumerate(entity_ids)
+    ])
+
+
+def publish_change(user_id: int, entity: str, action: str, entity_ids: Sequence[int], change_seq: int) -> None:
+    """
+    Announce a committed write on the event bus (the change feed forwards it).
+    ``change_seq`` is the last sequence number the write used.
+    """
+    event_bus.publish(CHANGE_EVENT, ChangeEventPayload(
+        user_id=user_id, entity=entity, action=action, ids=list(entity_ids), change_seq=change_seq
+    ).model_dump())
@@ -0,0 +1,279 @@
+import asyncio
+from typing import AsyncIterator, Dict, List as ListType, Optional, Set
+
+import orjson
+from fastapi import HTTPException, status
+
+from app import logger
+from app.core.config import settings
+
+CHANNEL = "changes:{user_id}"
+
+# Reconnect delay hint for EventSource clients, sent when a stream opens
+OPEN_FRAME = b"retry: 5000\n\n"
+# Comment line: keeps proxies from closing an idle stream and finds dead peers
+HEARTBEAT_FRAME = b": keepalive\n\n"
+# Sent instead of changes that were dropped; the client catches up with GET /sync
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+
+
+def encode_change_frame(payload: dict) -> bytes:
+    """SSE frame for a ChangeEventPayload, encoded once and shared by every stream of the user"""
+    data = {key: value for key, value in payload.items() if key != "user_id"}
+    return b"id: %d\nevent: change\ndata: %s\n\n" % (payload["change_seq"], orjson.dumps(data))
+
+
+class FeedSubscription:
+    """
+    One open stream: a bounded buffer of encoded frames.
+
+    Publishing never waits on a reader. When a client reads slower than its
+    changes arrive the buffer is dropped and replaced by a single resync frame,
+    so a stream never holds more than ``max_frames`` frames. An idle one holds
+    an empty list and the future it waits on, no deque or asyncio.Event (each
+    preallocates a ~700 byte block).
+    """
+
+    __slots__ = ("user_id", "frames", "max_frames", "overflowed", "waiter")
+
+    def __init__(self, user_id: int, max_frames: int):
+        self.user_id = user_id
+        self.frames: ListType[bytes] = []
+        self.max_frames = max_frames
+        self.overflowed = False
+        self.waiter: Optional[asyncio.Future] = None
+
+    def push(self, frame: bytes) -> bool:
+        """Buffer a frame; False when it was dropped"""
+        if self.overflowed:
+            # The pending resync frame already stands in for it
+            return False
+        if len(self.frames) >= self.max_frames:
+            self.resync()
+            return False
+        self.frames.append(frame)
+        self._wake()
+        return True
+
+    def resync(self) -> None:
+        self.frames = []
+        self.overflowed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def wait(self) -> None:
+        """Return once there is something to take"""
+        if self.frames or self.overflowed:
+            return
+        self.waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self.waiter
+        finally:
+            self.waiter = None
+
+    def take(self) -> bytes:
+        """Everything buffered, as one chunk"""
+        if self.overflowed:
+            self.overflowed = False
+            return RESYNC_FRAME
+        chunk = b"".join(self.frames)
+        self.frames = []
+        return chunk
+
+
+class ChangeFeed:
+    """
+    Fan-out of ChangeEventPayload events to the user's open streams.
+
+    ``publish`` is the EventBus handler and runs in whichever thread committed
+    the write; on the event loop (async sessions) the Redis round trip is
+    scheduled instead of blocking it. With Redis every event goes through a
+    per-user channel, and each worker holds one pub/sub connection subscribed
+    to the channels of the users it has streams for; without Redis events reach
+    this worker's streams only.
+    """
+
+    def __init__(self, enabled: bool, queue_size: int, max_streams_per_user: int, redis_url: Optional[str] = None):
+        self.enabled = enabled
+        self.queue_size = queue_size
+        self.max_streams_per_user = max_streams_per_user
+        self._streams: Dict[int, Set[FeedSubscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis = None
+        self._async_redis = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._has_channels = asyncio.Event()
+        self._publish_tasks: Set[asyncio.Task] = set()
+        if enabled and redis_url:
+            import redis
+            import redis.asyncio
+
+            self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.1, socket_connect_timeout=0.1)
+            self._async_redis = redis.asyncio.Redis.from_url(redis_url)
+        self.published = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.errors = 0
+
+    async def start(self) -> None:
+        """Bind to the running event loop; with Redis, start reading the pub/sub connection"""
+        self._loop = asyncio.get_running_loop()
+        if self._async_redis is not None:
+            self._pubsub = self._async_redis.pubsub(ignore_subscribe_messages=True)
+            self._reader = asyncio.create_task(self._read())
+
+    async def stop(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            await self._pubsub.aclose()
+            self._reader = None
+        self._loop = None
+
+    def publish(self, payload: dict) -> None:
+        if not self.enabled:
+            return
+        user_id = payload["user_id"]
+        frame = encode_change_frame(payload)
+        self.published += 1
+        if self._redis is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                task = loop.create_task(self._publish_async(user_id, frame))
+                self._publish_tasks.add(task)
+                task.add_done_callback(self._publish_tasks.discard)
+                return
+            try:
+                self._redis.publish(CHANNEL.format(user_id=user_id), frame)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Change feed publish failed for user {user_id}: {str(e)}")
+            return
+        loop = self._loop
+        if loop is not None and user_id in self._streams:
+            loop.call_soon_threadsafe(self._dispatch, user_id, frame)
+
+    async def _publish_async(self, user_id: int, frame: bytes) -> None:
+        try:
+            await self._async_redis.publish(CHANNEL.format(user_id=user_id), frame)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Change feed publish failed for user {user_id}: {str(e)}")
+
+    def _dispatch(self, user_id: int, frame: bytes) -> None:
+        for subscription in self._streams.get(user_id, ()):
+            if not subscription.push(frame):
+                self.dropped += 1
+
+    async def subscribe(self, user_id: int) -> FeedSubscription:
+        streams = self._streams.get(user_id)
+        if streams is not None and len(streams) >= self.max_streams_per_user:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many open change streams"
+            )
+
+        subscription = FeedSubscription(user_id, self.queue_size)
+        if streams is None:
+            streams = self._streams[user_id] = set()
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.subscribe(CHANNEL.format(user_id=user_id))
+                except Exception as e:
+                    self.errors += 1
+                    del self._streams[user_id]
+                    logger.warning(f"Change feed subscribe failed for user {user_id}: {str(e)}")
+                    raise HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail="Change feed unavailable"
+                    )
+                self._has_channels.set()
+        streams.add(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription: FeedSubscription) -> None:
+        streams = self._streams.get(subscription.user_id)
+        if not streams or subscription not in streams:
+            return
+        streams.discard(subscription)
+        if streams:
+            return
+        del self._streams[subscription.user_id]
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(CHANNEL.format(user_id=subscription.user_id))
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Change feed unsubscribe failed: {str(e)}")
+
+    async def stream(self, subscription: FeedSubscription, heartbeat_seconds: float) -> AsyncIterator[bytes]:
+        """
+        SSE body for a subscription. Flow control is the server's: while the
+        client does not read, the send of the previous chunk does not return,
+        and new changes pile up in the bounded buffer instead. The subscription
+        is released when the stream is closed, for whatever reason.
+        """
+        try:
+            yield OPEN_FRAME
+            while True:
+                try:
+                    # A deadline on the current task, not a new task per wait like wait_for
+                    async with asyncio.timeout(heartbeat_seconds):
+                        await subscription.wait()
+                except TimeoutError:
+                    yield HEARTBEAT_FRAME
+                    continue
+                yield subscription.take()
+        finally:
+            await self.unsubscribe(subscription)
+
+    async def _read(self) -> None:
+        while True:
+            if not self._pubsub.subscribed:
+                self._has_channels.clear()
+                await self._has_channels.wait()
+                continue
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Change feed connection lost: {str(e)}")
+                # Changes published meanwhile are gone: every stream has to resync
+                for streams in self._streams.values():
+                    for subscription in streams:
+                        subscription.resync()
+                await asyncio.sleep(1)
+                continue
+            if message is not None and message["type"] == "message":
+                user_id = int(message["channel"].rsplit(b":", 1)[1])
+                self._dispatch(user_id, message["data"])
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "backend": "redis" if self._redis is not None else "memory",
+            "users": len(self._streams),
+            "streams": sum(len(streams) for streams in list(self._streams.values())),
+            "published": self.published,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+change_feed = ChangeFeed(
+    enabled=settings.CHANGE_FEED_ENABLED,
+    queue_size=settings.CHANGE_FEED_QUEUE_SIZE,
+    max_streams_per_user=settings.CHANGE_FEED_MAX_STREAMS_PER_USER,
+    redis_url=settings.REDIS_URL if settings.CHANGE_FEED_REDIS_ENABLED else None,
+)
@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String
+from datetime import datetime
+from app.db.base import Base
+
+
+class SyncTombstone(Base):
+    """
+    Record of a deleted list or task, so delta sync can report the delete.
+
+    A list tombstone stands for the list's tasks too: they are deleted with it
+    and get no tombstones of their own.
+    """
+    __tablename__ = "sync_tombstones"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entity = Column(String(8), nullable=False)  # "list" or "task"
+    entity_id = Column(Integer, nullable=False)
+    change_seq = Column(BigInteger, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_sync_tombstones_user_id_change_seq", "user_id", "change_seq"),
+    )
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.core.config import settings
+from app.core.responses import ClosingStreamingResponse
+from app.db.session import AnySession, get_request_db
+from app.domains.auth.utils import get_verified_user
+from app.domains.auth.schemas import Principal
+from app.domains.sync.feed import change_feed
+from app.domains.sync.schemas import SyncResponse
+from app.domains.sync.service import DEFAULT_SYNC_LIMIT, MAX_SYNC_LIMIT, AsyncSyncService
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.get("", response_model=SyncResponse)
+async def sync(
+    since: Optional[str] = Query(None, description="next_token from the previous sync; omit for a full sync"),
+    limit: int = Query(DEFAULT_SYNC_LIMIT, ge=1, le=MAX_SYNC_LIMIT, description="Maximum changes returned"),
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
+):
+    """
+    Get the lists and tasks created, changed or deleted since the `since` token.
+
+    Changes come oldest first. Store `next_token` once they are applied and
+    pass it as `since` next time; while `has_more` is true, call again at once.
+    A `410` means the token can't be resumed: drop local data and sync without one.
+    """
+    sync_service = AsyncSyncService(db)
+    return await sync_service.get_changes(current_user.id, since, limit)
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def sync_events(
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
+):
+    """
+    Stream the user's changes as Server-Sent Events.
+
+    Each `change` event carries the entity, action, ids and `change_seq` of a
+    committed write; apply it by calling `GET /sync`. A `resync` event means
+    changes were dropped (slow reader, lost connection): call `GET /sync` too.
+    Open the stream before the first sync so no change falls in between.
+    """
+    if not change_feed.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Change feed is disabled"
+        )
+
+    # Authentication may have used the session; don't hold a pooled
+    # connection for as long as the stream stays open
+    if isinstance(db, AsyncSession):
+        await db.close()
+    else:
+        db.close()
+
+    subscription = await change_feed.subscribe(current_user.id)
+    return ClosingStreamingResponse(
+        change_feed.stream(subscription, settings.CHANGE_FEED_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # unsubscribe is idempotent: the stream's own finally usually got there first
+        on_close=lambda: change_feed.unsubscribe(subscription)
+    )
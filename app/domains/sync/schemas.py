@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+from app.domains.tasks.schemas import TaskResponse
+
+class SyncedList(BaseModel):
+    # ListResponse without the task counts: clients derive them from the synced tasks
+    id: int
+    name: str
+    color: str
+    description: Optional[str]
+    user_id: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class SyncResponse(BaseModel):
+    # Created or changed since the token, in change order
+    lists: List[SyncedList]
+    tasks: List[TaskResponse]
+    # Deleted since the token; a deleted list takes its tasks with it
+    deleted_list_ids: List[int]
+    deleted_task_ids: List[int]
+    # Pass as `since` on the next call; has_more means call again right away
+    next_token: str
+    has_more: bool
@@ -0,0 +1,280 @@
+import codecs
+import csv
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List as ListType, Optional, Tuple, Union
+
+import anyio.from_thread
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import Column, Date, DateTime, Integer, MetaData, Table, Text, cast, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app import logger
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.db.session import SessionLocal
+from app.domains.lists.models import List
+from app.domains.sync.changes import publish_change, reserve_change_seqs
+from app.domains.tasks.models import Task
+from app.domains.tasks.schemas import TaskCreate, TaskImportError, TaskImportResponse
+from app.domains.tasks.service import TasksService
+
+IMPORT_COLUMNS = ["title", "description", "list_id", "priority", "due_date"]
+
+# Per-transaction staging table for the Postgres COPY path. Kept out of
+# Base.metadata: it is created on demand and dropped on commit.
+TASK_IMPORT_STAGING = Table(
+    "task_import_staging",
+    MetaData(),
+    Column("title", Text),
+    Column("description", Text),
+    Column("list_id", Integer),
+    Column("priority", Text),
+    Column("due_date", Date),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# (line number, validated task or error message)
+ParsedRow = Tuple[int, Union[TaskCreate, str]]
+
+
+def iter_request_body(stream) -> Iterator[bytes]:
+    """
+    Iterate an async request body stream from a worker thread, pulling one
+    chunk at a time from the event loop, so the upload is never buffered whole.
+    """
+    iterator = stream.__aiter__()
+
+    async def next_chunk() -> Optional[bytes]:
+        try:
+            return await iterator.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    while True:
+        chunk = anyio.from_thread.run(next_chunk)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def iter_lines(chunks: Iterator[bytes]) -> Iterator[str]:
+    """Split a UTF-8 byte stream into lines, newline kept (the csv module wants it)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line + "\n"
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Upload is not valid UTF-8")
+    if pending:
+        yield pending
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" if item["loc"] else item["msg"]
+        for item in error.errors()
+    )
+
+
+def parse_ndjson(lines: Iterator[str]) -> Iterator[ParsedRow]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, TaskCreate.model_validate_json(line)
+        except ValidationError as e:
+            yield line_number, format_validation_error(e)
+
+
+def parse_csv(lines: Iterator[str]) -> Iterator[ParsedRow]:
+    reader = csv.DictReader(lines)
+    missing = {"title", "list_id"} - set(reader.fieldnames or ())
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV header is missing: {', '.join(sorted(missing))}"
+        )
+    for row in reader:
+        # Empty cells fall back to the schema defaults; extra columns (e.g. from an export) are ignored
+        values = {name: value for name, value in row.items() if name in IMPORT_COLUMNS and value != ""}
+        try:
+            yield reader.line_num, TaskCreate.model_validate(values)
+        except ValidationError as e:
+            yield reader.line_num, format_validation_error(e)
+
+
+class TaskImporter:
+    """
+    Load validated rows for one user in a single transaction.
+
+    List ownership is resolved once per distinct list_id, a batch of new ids at
+    a time. On Postgres (psycopg) each batch is COPYed into a temporary staging
+    table and one INSERT ... SELECT moves everything into tasks at the end;
+    other databases get a multi-row executemany INSERT per batch.
+    """
+
+    def __init__(self, db: Session, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self.tasks_service = TasksService(db)
+        dialect = db.get_bind().dialect
+        self.use_copy = dialect.name == "postgresql" and dialect.driver == "psycopg"
+        self.owned_lists: Dict[int, bool] = {}
+        self.staged = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: ListType[TaskImportError] = []
+        self.last_seq = 0
+        self.now = datetime.utcnow()
+
+    def fail(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.TASKS_IMPORT_MAX_ERRORS:
+            self.errors.append(TaskImportError(line=line, error=error))
+
+    def load(self, batch: ListType[ParsedRow]) -> None:
+        """Check ownership for a batch of parsed rows and load the valid ones"""
+        new_list_ids = {
+            task.list_id for _, task in batch
+            if isinstance(task, TaskCreate) and task.list_id not in self.owned_lists
+        }
+        if new_list_ids:
+            owned, _ = self.tasks_service.get_owned_ids(new_list_ids, set(), self.user_id)
+            self.owned_lists.update((list_id, list_id in owned) for list_id in new_list_ids)
+
+        tasks = []
+        for line, task in batch:
+            if isinstance(task, str):
+                self.fail(line, task)
+            elif not self.owned_lists[task.list_id]:
+                self.fail(line, f"list_id: List {task.list_id} not found or access denied")
+            else:
+                tasks.append(task)
+
+        if not tasks:
+            return
+        if self.use_copy:
+            self._copy(tasks)
+        else:
+            change_seq = reserve_change_seqs(self.db, self.user_id, len(tasks))
+            self.db.execute(insert(Task), [
+                {
+                    "title": task.title,
+                    "description": task.description,
+                    "list_id": task.list_id,
+                    "priority": task.priority,
+                    "due_date": task.due_date,
+                    "completed": False,
+                    "created_at": self.now,
+                    "updated_at": self.now,
+                    "change_seq": change_seq + offset,
+                }
+                for offset, task in enumerate(tasks)
+            ])
+            self.imported += len(tasks)
+            self.last_seq = change_seq + len(tasks) - 1
+
+    def _copy(self, tasks: ListType[TaskCreate]) -> None:
+        connection = self.db.connection()
+        if not self.staged:
+            TASK_IMPORT_STAGING.create(connection)
+        # psycopg 3 connection under the pooled SQLAlchemy one
+        with connection.connection.driver_connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY {TASK_IMPORT_STAGING.name} ({', '.join(IMPORT_COLUMNS)}) FROM STDIN"
+            ) as copy:
+                for task in tasks:
+                    copy.write_row((task.title, task.description, task.list_id, task.priority.value, task.due_date))
+        self.staged += len(tasks)
+
+    def finish(self) -> TaskImportResponse:
+        """Move staged rows into tasks (COPY path) and commit"""
+        if self.staged:
+            staging = TASK_IMPORT_STAGING.c
+            # Enough sequence numbers for every staged row; the ones of rows
+            # dropped by the join below are simply never used
+            change_seq = reserve_change_seqs(self.db, self.user_id, self.staged)
+            result = self.db.execute(
+                insert(Task).from_select(
+                    [*IMPORT_COLUMNS, "completed", "created_at", "updated_at", "change_seq"],
+                    # Joined on lists again so a list deleted meanwhile loses its rows instead of failing the load
+                    select(
+                        staging.title,
+                        staging.description,
+                        staging.list_id,
+                        cast(staging.priority, Task.priority.type),
+                        staging.due_date,
+                        literal(False, Task.completed.type),
+                        literal(self.now, DateTime),
+                        literal(self.now, DateTime),
+                        func.row_number().over() + literal(change_seq - 1, Task.change_seq.type),
+                    ).join(List, List.id == staging.list_id).where(List.user_id == self.user_id)
+                ),
+                # rowcount is otherwise only kept for UPDATE and DELETE
+                execution_options={"preserve_rowcount": True}
+            )
+            self.imported = result.rowcount
+            self.last_seq = change_seq + self.staged - 1
+        self.db.commit()
+        if self.imported:
+            response_cache.bump(self.user_id)
+            # Too many rows to list: clients pick them up with a sync
+            publish_change(self.user_id, "task", "imported", [], self.last_seq)
+
+        return TaskImportResponse(
+            imported=self.imported,
+            failed=self.failed,
+            errors=self.errors,
+            errors_truncated=self.failed > len(self.errors)
+        )
+
+
+def run_task_import(
+    user_id: int,
+    import_format: str,
+    chunks: Iterator[bytes],
+    on_write: Optional[Callable[[], None]] = None
+) -> TaskImportResponse:
+    """
+    Validate and load an NDJSON or CSV upload of TaskCreate rows, as it arrives.
+
+    Blocking: run it in the threadpool. Invalid rows and rows for foreign lists
+    are skipped and reported by line; the valid ones are committed together, and
+    a malformed upload (bad encoding, missing CSV columns) loads nothing.
+    ``on_write`` is called after a commit that imported rows (see RoutingSession).
+    """
+    lines = iter_lines(chunks)
+    rows = parse_ndjson(lines) if import_format == "ndjson" else parse_csv(lines)
+
+    db = SessionLocal()
+    if on_write is not None:
+        db.info["on_write"] = on_write
+    try:
+        importer = TaskImporter(db, user_id)
+        batch: ListType[ParsedRow] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= settings.TASKS_IMPORT_BATCH_SIZE:
+                importer.load(batch)
+                batch = []
+        if batch:
+            importer.load(batch)
+        result = importer.finish()
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Task import for user {user_id} failed: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+    return result
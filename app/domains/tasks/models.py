@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, Enum
+from sqlalchemy import (
+    DDL, BigInteger, Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, Enum, Index, event
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -21,6 +23,33 @@ class Task(Base):
     completed = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Per-user change sequence of the last write (see app.domains.sync)
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
     
     # Relationships
-    list = relationship("List", back_populates="tasks")
\ No newline at end of file
+    list = relationship("List", back_populates="tasks")
+
+
+# Matches the get_tasks_by_list filter and ORDER BY (completed, due_date, priority desc)
+Index(
+    "ix_tasks_list_id_completed_due_date",
+    Task.list_id, Task.completed, Task.due_date, Task.priority.desc(), Task.id,
+)
+
+# Delta sync: a list's tasks changed after a watermark
+Index("ix_tasks_list_id_change_seq", Task.list_id, Task.change_seq)
+
+# Full-text search document (Postgres only): title weighted above description.
+# Left unmapped so entity loads and RETURNING never carry it; created here for
+# create_all and by migration b6d41e8f0a93 on migrated databases.
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+event.listen(Task.__table__, "after_create", DDL(
+    f"ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+).execute_if(dialect="postgresql"))
+event.listen(Task.__table__, "after_create", DDL(
+    "CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)"
+).execute_if(dialect="postgresql"))
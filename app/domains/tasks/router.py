@@ -1,80 +1,240 @@
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.db.session import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional, Tuple
+from app.core.fields import sparse_fields, sparse_response
+from app.core.http_cache import PRIVATE_REVALIDATE, cache_control
+from app.core.response_cache import response_cache
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.schemas import CursorPaginatedResponse
+from app.db.routing import is_pinned, set_pin
+from app.db.session import AnySession, get_request_db, replica_engines
 from app.domains.auth.utils import get_verified_user
-from app.domains.auth.models import User
-from app.domains.tasks.schemas import TaskCreate, TaskUpdate, TaskResponse, MessageResponse
-from app.domains.tasks.service import TasksService
+from app.domains.auth.schemas import Principal
+from app.domains.lists.service import AsyncListsService
+from app.domains.tasks.schemas import (
+    BulkTaskRequest, BulkTaskResponse, TaskCreate, TaskImportResponse, TaskSearchResult, TaskUpdate, TaskResponse,
+    MessageResponse
+)
+from app.domains.tasks.export import EXPORT_FORMATS, stream_tasks_export
+from app.domains.tasks.importer import iter_request_body, run_task_import
+from app.domains.tasks.service import AsyncTasksService
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
-@router.get("", response_model=List[TaskResponse])
-def get_tasks(
+@router.get(
+    "",
+    response_model=CursorPaginatedResponse[TaskResponse],
+    dependencies=[cache_control(PRIVATE_REVALIDATE)]
+)
+async def get_tasks(
+    request: Request,
     list_id: int = Query(..., description="ID of the list to get tasks from"),
     completed: Optional[bool] = Query(None, description="Filter by completion status"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[Tuple[str, ...]] = sparse_fields(TaskResponse),
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
-    Get all tasks for a specific list. Optional filter by completion status.
+    Get a page of tasks for a specific list. Optional filter by completion status.
 
     - **list_id**: Required. The ID of the list to get tasks from
     - **completed**: Optional. Filter tasks by completion status (true/false)
+    - **limit**: Optional. Page size
+    - **cursor**: Optional. `next_cursor` / `prev_cursor` from a previous page
+    - **fields**: Optional. Only return these task fields (`id` always), e.g.
+      `id,title,completed,due_date` for a compact view without descriptions
+
+    Responses carry a weak ETag; send it back in `If-None-Match` to get
+    `304 Not Modified` while the list's tasks are unchanged.
+    """
+    tasks_service = AsyncTasksService(db)
+
+    async def version():
+        version = await tasks_service.get_tasks_version(list_id, current_user.id)
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="List not found or access denied"
+            )
+        return version
+
+    return await response_cache.respond(
+        request, db, current_user.id, "tasks", (list_id, completed, limit, cursor, fields),
+        version=version,
+        build=lambda: tasks_service.get_tasks_by_list(list_id, current_user.id, completed, limit, cursor, fields),
+        cache_control=PRIVATE_REVALIDATE
+    )
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    list_id: Optional[List[int]] = Query(None, description="Lists to export (repeatable); all lists when omitted"),
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
+):
+    """
+    Export the user's tasks, streamed as they are read from the database.
+
+    - **format**: `ndjson` (one TaskResponse object per line) or `csv` (with a header row)
+    - **list_id**: Optional, repeatable. Only export these lists
+    """
+    if list_id:
+        tasks_service = AsyncTasksService(db)
+        owned_list_ids, _ = await tasks_service.get_owned_ids(set(list_id), set(), current_user.id)
+        if len(owned_list_ids) != len(set(list_id)):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="List not found or access denied"
+            )
+
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        stream_tasks_export(current_user.id, format, list_id, pinned=is_pinned(request)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{extension}"'}
+    )
+
+@router.get(
+    "/search",
+    response_model=CursorPaginatedResponse[TaskSearchResult],
+    dependencies=[cache_control(PRIVATE_REVALIDATE)]
+)
+async def search_tasks(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in task titles and descriptions"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    fields: Optional[Tuple[str, ...]] = sparse_fields(TaskResponse),
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
+):
+    """
+    Search the user's tasks across all lists, best match first.
+
+    - **q**: Required. Words to find in titles (ranked higher) and descriptions.
+      Quoted phrases, `or` and `-word` are understood on Postgres
+    - **limit**: Optional. Page size
+    - **cursor**: Optional. `next_cursor` / `prev_cursor` from a previous page, with the same `q`
+    - **fields**: Optional. Only return these task fields (`id` always); `rank` and
+      `headline` are always included
+
+    `headline` is an HTML excerpt: the task text is escaped and the matches
+    are wrapped in `<mark></mark>`. Responses carry a weak ETag, as on `GET /tasks`.
     """
-    tasks_service = TasksService(db)
-    return tasks_service.get_tasks_by_list(list_id, current_user.id, completed)
+    tasks_service = AsyncTasksService(db)
+    lists_service = AsyncListsService(db)
+    return await response_cache.respond(
+        request, db, current_user.id, "tasks.search", (q, limit, cursor, fields),
+        version=lambda: lists_service.get_lists_version(current_user.id),
+        build=lambda: tasks_service.search_tasks(current_user.id, q, limit, cursor, fields),
+        cache_control=PRIVATE_REVALIDATE
+    )
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(
+async def get_task(
     task_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    fields: Optional[Tuple[str, ...]] = sparse_fields(TaskResponse),
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
     Get a specific task by ID.
+
+    - **fields**: Optional. Only return these task fields (`id` always)
     """
-    tasks_service = TasksService(db)
-    return tasks_service.get_task_by_id(task_id, current_user.id)
+    tasks_service = AsyncTasksService(db)
+    task = await tasks_service.get_task_by_id(task_id, current_user.id, fields)
+    return task if fields is None else sparse_response(task)
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     task_data: TaskCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
     Create a new task in a list.
 
     The list must belong to the authenticated user.
     """
-    tasks_service = TasksService(db)
-    return tasks_service.create_task(task_data, current_user.id)
+    tasks_service = AsyncTasksService(db)
+    return await tasks_service.create_task(task_data, current_user.id)
+
+@router.post("/bulk", response_model=BulkTaskResponse)
+async def bulk_tasks(
+    payload: BulkTaskRequest,
+    response: Response,
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
+):
+    """
+    Create, update and delete many tasks in a single transaction.
+
+    - **operations**: List of `create` (with `data`), `update` (with `task_id` and `data`)
+      and `delete` (with `task_id`) operations
+    - **atomic**: When true (default) nothing is written if any operation fails and the
+      response is 409. When false, valid operations are applied and failures reported per item.
+    """
+    tasks_service = AsyncTasksService(db)
+    result = await tasks_service.bulk_tasks(payload, current_user.id)
+    if not result.committed:
+        response.status_code = status.HTTP_409_CONFLICT
+    return result
+
+@router.post("/import", response_model=TaskImportResponse)
+async def import_tasks(
+    request: Request,
+    format: Optional[Literal["ndjson", "csv"]] = Query(
+        None, description="Upload format; taken from Content-Type (text/csv or NDJSON) when omitted"
+    ),
+    current_user: Principal = Depends(get_verified_user)
+):
+    """
+    Import tasks from a streamed NDJSON or CSV upload (the request body).
+
+    Each NDJSON line, or CSV row under a header, is a task as accepted by
+    `POST /tasks` (`title`, `list_id`, optional `description`, `priority`,
+    `due_date`; other fields are ignored, so exports can be re-imported).
+    Valid rows are committed together; invalid rows and rows for lists that
+    are not the user's are skipped and reported with their line number.
+    """
+    import_format = format or ("csv" if "csv" in request.headers.get("content-type", "") else "ndjson")
+    return await run_in_threadpool(
+        run_task_import,
+        current_user.id,
+        import_format,
+        iter_request_body(request.stream()),
+        on_write=(lambda: set_pin(request)) if replica_engines else None
+    )
 
 @router.put("/{task_id}", response_model=TaskResponse)
-def update_task(
+async def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
     Update an existing task. Only provided fields will be updated.
 
     Can be used to update title, description, priority, due_date, or completion status.
     """
-    tasks_service = TasksService(db)
-    return tasks_service.update_task(task_id, task_data, current_user.id)
+    tasks_service = AsyncTasksService(db)
+    return await tasks_service.update_task(task_id, task_data, current_user.id)
 
 @router.delete("/{task_id}", response_model=MessageResponse)
-def delete_task(
+async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_verified_user)
+    db: AnySession = Depends(get_request_db),
+    current_user: Principal = Depends(get_verified_user)
 ):
     """
     Delete a task.
     """
-    tasks_service = TasksService(db)
-    tasks_service.delete_task(task_id, current_user.id)
+    tasks_service = AsyncTasksService(db)
+    await tasks_service.delete_task(task_id, current_user.id)
     return {"message": "Task deleted successfully"}
\ No newline at end of file
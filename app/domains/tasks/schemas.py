@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime, date
-from typing import Optional
+from typing import Annotated, List, Literal, Optional, Union
 from enum import Enum
 
+from app.core.config import settings
+
 class PriorityEnum(str, Enum):
     low = "low"
     medium = "medium"
@@ -36,5 +38,58 @@ class TaskResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TaskSearchResult(TaskResponse):
+    # ts_rank on Postgres; on other databases a coarse title/description score
+    rank: float
+    # Matching excerpt as HTML: task text escaped, matches wrapped in <mark></mark>
+    headline: Optional[str] = None
+
 class MessageResponse(BaseModel):
-    message: str
\ No newline at end of file
+    message: str
+
+
+class BulkCreateOperation(BaseModel):
+    op: Literal["create"]
+    data: TaskCreate
+
+class BulkUpdateOperation(BaseModel):
+    op: Literal["update"]
+    task_id: int
+    data: TaskUpdate
+
+class BulkDeleteOperation(BaseModel):
+    op: Literal["delete"]
+    task_id: int
+
+BulkTaskOperation = Annotated[
+    Union[BulkCreateOperation, BulkUpdateOperation, BulkDeleteOperation],
+    Field(discriminator="op")
+]
+
+class BulkTaskRequest(BaseModel):
+    operations: List[BulkTaskOperation] = Field(..., min_length=1, max_length=settings.TASKS_BULK_MAX_OPERATIONS)
+    # True: apply every operation or none. False: apply the valid ones, report the rest.
+    atomic: bool = True
+
+class BulkTaskResult(BaseModel):
+    index: int
+    op: str
+    status: int
+    task_id: Optional[int] = None
+    task: Optional[TaskResponse] = None
+    error: Optional[str] = None
+
+class BulkTaskResponse(BaseModel):
+    committed: bool
+    results: List[BulkTaskResult]
+
+class TaskImportError(BaseModel):
+    line: int
+    error: str
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    failed: int
+    # At most TASKS_IMPORT_MAX_ERRORS entries; errors_truncated tells whether more were dropped
+    errors: List[TaskImportError]
+    errors_truncated: bool = False
@@ -0,0 +1,101 @@
+import html
+import re
+from typing import List as ListType, Optional, Tuple
+
+from sqlalchemy import Float, and_, case, cast, false, func, literal_column, or_, type_coerce
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.domains.tasks.models import SEARCH_CONFIG, Task
+
+# Generated column created outside the mapping (see app.domains.tasks.models)
+SEARCH_VECTOR = literal_column("tasks.search_vector", TSVECTOR)
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+# Placeholders for the markers while the text is still raw task text: private
+# use characters, which html.escape leaves alone and task text has no use for
+START_SENTINEL = "\ue000"
+STOP_SENTINEL = "\ue001"
+HEADLINE_OPTIONS = (
+    f'StartSel="{START_SENTINEL}", StopSel="{STOP_SENTINEL}", MinWords=12, MaxWords=30, MaxFragments=2'
+)
+# Text a headline is cut from: the title, then the description when there is one
+HEADLINE_SOURCE = func.coalesce(Task.title + " — " + Task.description, Task.title)
+# Characters kept on each side of the first match in a LIKE fallback headline
+HEADLINE_CONTEXT = 60
+
+# (WHERE clause, rank column, headline column) of a search
+SearchClauses = Tuple[object, object, object]
+
+
+def fulltext_search(q: str) -> SearchClauses:
+    """
+    Postgres: websearch syntax (quoted phrases, ``or``, ``-word``) against the
+    GIN-indexed ``search_vector``. ts_headline is costly, but Postgres only
+    evaluates it for the rows that survive the LIMIT.
+    """
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    # ts_rank is a real (float4): the cursor's Python float compared against
+    # it as float8 would not equal it, so ties would be skipped across pages
+    rank = cast(func.ts_rank(SEARCH_VECTOR, tsquery), Float(53)).label("rank")
+    # Sentinels typed into a task are stripped, so only ts_headline places them
+    source = func.translate(HEADLINE_SOURCE, START_SENTINEL + STOP_SENTINEL, "")
+    headline = func.ts_headline(SEARCH_CONFIG, source, tsquery, HEADLINE_OPTIONS).label("headline")
+    return SEARCH_VECTOR.bool_op("@@")(tsquery), rank, headline
+
+
+def search_terms(q: str) -> ListType[str]:
+    """Words of a query for the LIKE fallback; operators and quotes are dropped"""
+    return [term for term in re.findall(r"\w+", q) if term.lower() != "or"]
+
+
+def like_search(terms: ListType[str]) -> SearchClauses:
+    """
+    Other databases (SQLite test runs): every term in the title or the
+    description, ranked by how many of them the title holds. A full scan of
+    the user's tasks, and the headline column is the raw text for ``highlight``.
+    """
+    headline = HEADLINE_SOURCE.label("headline")
+    if not terms:
+        return false(), type_coerce(0.0, Float).label("rank"), headline
+
+    patterns = [f"%{escape_like(term)}%" for term in terms]
+    match = and_(*(
+        or_(Task.title.ilike(pattern, escape="\\"), Task.description.ilike(pattern, escape="\\"))
+        for pattern in patterns
+    ))
+    in_title = [case((Task.title.ilike(pattern, escape="\\"), 1.0), else_=0.0) for pattern in patterns]
+    rank = type_coerce(sum(in_title[1:], in_title[0]), Float).label("rank")
+    return match, rank, headline
+
+
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def highlight(text: Optional[str], terms: ListType[str]) -> Optional[str]:
+    """
+    Excerpt around the first term found in ``text``, with every term between
+    sentinels like ts_headline does
+    """
+    if not text or not terms:
+        return text and text.replace(START_SENTINEL, "").replace(STOP_SENTINEL, "")
+    text = text.replace(START_SENTINEL, "").replace(STOP_SENTINEL, "")
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(text)
+    if match is None:
+        excerpt = text[:2 * HEADLINE_CONTEXT]
+    else:
+        excerpt = text[max(match.start() - HEADLINE_CONTEXT, 0):match.end() + HEADLINE_CONTEXT]
+    return pattern.sub(lambda found: f"{START_SENTINEL}{found.group(0)}{STOP_SENTINEL}", excerpt)
+
+
+def render_headline(marked: Optional[str]) -> Optional[str]:
+    """
+    HTML for a sentinel-marked excerpt: the task text escaped, only the
+    markers turned into tags. Sentinels typed into a task were stripped before
+    the markers went in, so they can't open or close a tag.
+    """
+    if marked is None:
+        return None
+    return html.escape(marked).replace(START_SENTINEL, HIGHLIGHT_START).replace(STOP_SENTINEL, HIGHLIGHT_STOP)
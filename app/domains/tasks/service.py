@@ -1,9 +1,37 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+from sqlalchemy import and_, delete, func, insert, literal, or_, select, update
+from sqlalchemy.orm import Session, load_only
 from fastapi import HTTPException, status
-from typing import List as ListType, Optional
+from typing import List as ListType, Optional, Set, Tuple
 from app.domains.tasks.models import Task
-from app.domains.tasks.schemas import TaskCreate, TaskUpdate, TaskResponse
+from app.domains.tasks.schemas import (
+    BulkTaskRequest, BulkTaskResponse, BulkTaskResult, TaskCreate, TaskSearchResult, TaskUpdate, TaskResponse
+)
+from app.domains.tasks.search import fulltext_search, highlight, like_search, render_headline, search_terms
 from app.domains.lists.models import List
+from app.core.fields import sparse_columns, sparse_model
+from app.core.pagination import DEFAULT_PAGE_SIZE, KeysetColumn, build_cursor_response, keyset_paginate
+from app.core.response_cache import response_cache
+from app.core.schemas import CursorPaginatedResponse
+from app.db.routing import read_only
+from app.db.session import AsyncService
+from app.domains.sync.changes import publish_change, record_tombstones, reserve_change_seqs
+
+# Incomplete first, then by due date (undated last), then by priority
+TASK_KEYSET = (
+    KeysetColumn(Task.completed),
+    KeysetColumn(Task.due_date, nullable=True),
+    KeysetColumn(Task.priority, descending=True),
+    KeysetColumn(Task.id),
+)
+
+# Columns read for TaskResponse. Selecting plain rows instead of Task entities
+# skips ORM identity-map bookkeeping, which dominates on large pages; rows are
+# validated through their mapping (a dict-like input, unlike from_attributes).
+TASK_RESPONSE_COLUMNS = tuple(getattr(Task, field) for field in TaskResponse.model_fields)
+
+# Returned with every search hit, whatever ``fields`` narrows the task to
+SEARCH_RESULT_FIELDS = ("rank", "headline")
 
 class TasksService:
     def __init__(self, db: Session):
@@ -26,45 +54,104 @@ class TasksService:
 
         return db_list
 
+    @read_only
+    def get_tasks_version(self, list_id: int, user_id: int) -> Optional[Tuple]:
+        """
+        Validator for the tasks of a list: (task count, latest task update).
+        None when the list doesn't exist or isn't the user's.
+        """
+        row = self.db.query(func.count(Task.id), func.max(Task.updated_at)).select_from(List).outerjoin(
+            Task, Task.list_id == List.id
+        ).filter(
+            List.id == list_id,
+            List.user_id == user_id
+        ).group_by(List.id).first()
+
+        return tuple(row) if row else None
+
+    @read_only
     def get_tasks_by_list(
         self,
         list_id: int,
         user_id: int,
-        completed: Optional[bool] = None
-    ) -> ListType[TaskResponse]:
+        completed: Optional[bool] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> CursorPaginatedResponse[TaskResponse]:
         """
-        Get all tasks for a specific list with optional completed filter
+        Get one page of tasks for a specific list with optional completed filter.
+        With ``fields`` only those columns (and the sort key) are read and returned.
         """
-        # Verify list ownership
+        # Verify list ownership; the task query below needs no second join
         self.verify_list_ownership(list_id, user_id)
 
         # Build query
-        query = self.db.query(Task).join(List).filter(
-            Task.list_id == list_id,
-            List.user_id == user_id
+        response_model = sparse_model(TaskResponse, fields) if fields else TaskResponse
+        query = self.db.query(*sparse_columns(TASK_RESPONSE_COLUMNS, fields, TASK_KEYSET)).filter(
+            Task.list_id == list_id
         )
 
         # Apply completed filter if provided
         if completed is not None:
             query = query.filter(Task.completed == completed)
 
-        # Order by: incomplete first, then by due date, then by priority
-        tasks = query.order_by(
-            Task.completed.asc(),
-            Task.due_date.asc().nullslast(),
-            Task.priority.desc()
-        ).all()
+        tasks, next_cursor, prev_cursor = keyset_paginate(query, TASK_KEYSET, limit, cursor)
 
-        return [TaskResponse.model_validate(task) for task in tasks]
+        return build_cursor_response(
+            [response_model.model_validate(row._mapping) for row in tasks], limit, next_cursor, prev_cursor
+        )
 
-    def get_task_by_id(self, task_id: int, user_id: int) -> TaskResponse:
+    @read_only
+    def search_tasks(
+        self,
+        user_id: int,
+        q: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> CursorPaginatedResponse[TaskSearchResult]:
         """
-        Get a specific task by ID
+        One page of the user's tasks, across all lists, matching ``q`` in the
+        title or description, best match first. Full-text search on Postgres,
+        LIKE on other databases.
         """
-        task = self.db.query(Task).join(List).filter(
+        if self.db.get_bind().dialect.name == "postgresql":
+            terms = None
+            match, rank, headline = fulltext_search(q)
+        else:
+            terms = search_terms(q)
+            match, rank, headline = like_search(terms)
+
+        # Best rank first, newest first among equal ranks
+        keyset = (KeysetColumn(rank, descending=True), KeysetColumn(Task.id, descending=True))
+        query = self.db.query(*sparse_columns(TASK_RESPONSE_COLUMNS, fields), rank, headline).join(
+            List, List.id == Task.list_id
+        ).filter(
+            List.user_id == user_id,
+            match
+        )
+        hits, next_cursor, prev_cursor = keyset_paginate(query, keyset, limit, cursor)
+
+        response_model = sparse_model(TaskSearchResult, fields + SEARCH_RESULT_FIELDS) if fields else TaskSearchResult
+        items = []
+        for hit in hits:
+            marked = hit.headline if terms is None else highlight(hit.headline, terms)
+            items.append(response_model.model_validate({**hit._mapping, "headline": render_headline(marked)}))
+        return build_cursor_response(items, limit, next_cursor, prev_cursor)
+
+    @read_only
+    def get_task_by_id(self, task_id: int, user_id: int, fields: Optional[Tuple[str, ...]] = None) -> TaskResponse:
+        """
+        Get a specific task by ID, with only ``fields`` loaded and returned when given
+        """
+        query = self.db.query(Task).join(List).filter(
             Task.id == task_id,
             List.user_id == user_id
-        ).first()
+        )
+        if fields:
+            query = query.options(load_only(*sparse_columns(TASK_RESPONSE_COLUMNS, fields)))
+        task = query.first()
 
         if not task:
             raise HTTPException(
@@ -72,39 +159,67 @@ class TasksService:
                 detail="Task not found"
             )
 
-        return TaskResponse.model_validate(task)
+        return (sparse_model(TaskResponse, fields) if fields else TaskResponse).model_validate(task)
 
     def create_task(self, task_data: TaskCreate, user_id: int) -> TaskResponse:
         """
         Create a new task
         """
-        # Verify list ownership
-        self.verify_list_ownership(task_data.list_id, user_id)
+        change_seq = reserve_change_seqs(self.db, user_id)
 
-        db_task = Task(
-            title=task_data.title,
-            description=task_data.description,
-            list_id=task_data.list_id,
-            priority=task_data.priority,
-            due_date=task_data.due_date,
-            completed=False
+        # INSERT ... SELECT FROM lists: the row is only written when the list
+        # belongs to the user, so ownership check and insert are one round trip
+        owned_list = select(
+            literal(task_data.title, Task.title.type),
+            literal(task_data.description, Task.description.type),
+            List.id,
+            literal(task_data.priority, Task.priority.type),
+            literal(task_data.due_date, Task.due_date.type),
+            literal(False, Task.completed.type),
+            literal(change_seq, Task.change_seq.type),
+        ).where(
+            List.id == task_data.list_id,
+            List.user_id == user_id
         )
+        db_task = self.db.execute(
+            insert(Task).from_select(
+                ["title", "description", "list_id", "priority", "due_date", "completed", "change_seq"], owned_list
+            ).returning(Task)
+        ).scalar_one_or_none()
 
-        self.db.add(db_task)
+        if not db_task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="List not found or access denied"
+            )
+
+        # Build the response before COMMIT expires the instance, so no refresh is needed
+        response = TaskResponse.model_validate(db_task)
         self.db.commit()
-        self.db.refresh(db_task)
+        response_cache.bump(user_id)
+        publish_change(user_id, "task", "created", [response.id], change_seq)
 
-        return TaskResponse.model_validate(db_task)
+        return response
 
     def update_task(self, task_id: int, task_data: TaskUpdate, user_id: int) -> TaskResponse:
         """
         Update an existing task
         """
-        # Get task and verify ownership through list
-        db_task = self.db.query(Task).join(List).filter(
-            Task.id == task_id,
-            List.user_id == user_id
-        ).first()
+        # Update only provided fields
+        update_data = task_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.get_task_by_id(task_id, user_id)
+
+        # UPDATE tasks ... FROM lists WHERE lists.user_id = :uid RETURNING *
+        change_seq = reserve_change_seqs(self.db, user_id)
+        db_task = self.db.execute(
+            update(Task).where(
+                Task.id == task_id,
+                Task.list_id == List.id,
+                List.user_id == user_id
+            ).values(**update_data, change_seq=change_seq).returning(Task),
+            execution_options={"synchronize_session": False, "populate_existing": True}
+        ).scalar_one_or_none()
 
         if not db_task:
             raise HTTPException(
@@ -112,31 +227,203 @@ class TasksService:
                 detail="Task not found"
             )
 
-        # Update only provided fields
-        update_data = task_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
-
+        response = TaskResponse.model_validate(db_task)
         self.db.commit()
-        self.db.refresh(db_task)
+        response_cache.bump(user_id)
+        publish_change(user_id, "task", "updated", [task_id], change_seq)
 
-        return TaskResponse.model_validate(db_task)
+        return response
 
     def delete_task(self, task_id: int, user_id: int) -> None:
         """
         Delete a task
         """
-        # Get task and verify ownership through list
-        db_task = self.db.query(Task).join(List).filter(
-            Task.id == task_id,
-            List.user_id == user_id
-        ).first()
+        change_seq = reserve_change_seqs(self.db, user_id)
 
-        if not db_task:
+        # Ownership is part of the DELETE itself; no rows deleted means not found
+        result = self.db.execute(
+            delete(Task).where(
+                Task.id == task_id,
+                Task.list_id.in_(select(List.id).where(List.user_id == user_id))
+            ),
+            execution_options={"synchronize_session": False}
+        )
+
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Task not found"
             )
 
-        self.db.delete(db_task)
-        self.db.commit()
\ No newline at end of file
+        record_tombstones(self.db, user_id, "task", [task_id], change_seq)
+        self.db.commit()
+        response_cache.bump(user_id)
+        publish_change(user_id, "task", "deleted", [task_id], change_seq)
+
+    def get_owned_ids(self, list_ids: Set[int], task_ids: Set[int], user_id: int) -> Tuple[Set[int], Set[int]]:
+        """
+        Resolve which of the given lists and tasks belong to the user, in one query
+        """
+        if not list_ids and not task_ids:
+            return set(), set()
+
+        rows = self.db.query(List.id, Task.id).outerjoin(
+            Task, and_(Task.list_id == List.id, Task.id.in_(task_ids))
+        ).filter(
+            List.user_id == user_id,
+            or_(List.id.in_(list_ids), Task.id.isnot(None))
+        ).all()
+
+        owned_list_ids = {list_id for list_id, _ in rows if list_id in list_ids}
+        owned_task_ids = {task_id for _, task_id in rows if task_id is not None}
+        return owned_list_ids, owned_task_ids
+
+    def bulk_tasks(self, payload: BulkTaskRequest, user_id: int) -> BulkTaskResponse:
+        """
+        Apply a batch of create/update/delete operations in a single transaction
+        """
+        operations = payload.operations
+        owned_list_ids, owned_task_ids = self.get_owned_ids(
+            {operation.data.list_id for operation in operations if operation.op == "create"},
+            {operation.task_id for operation in operations if operation.op != "create"},
+            user_id
+        )
+
+        # Validate every operation before writing anything
+        results: ListType[Optional[BulkTaskResult]] = [None] * len(operations)
+        creates, updates, deletes = [], [], []
+        seen_task_ids = set()
+        for index, operation in enumerate(operations):
+            if operation.op == "create":
+                if operation.data.list_id in owned_list_ids:
+                    creates.append((index, operation))
+                else:
+                    results[index] = BulkTaskResult(
+                        index=index, op=operation.op, status=status.HTTP_404_NOT_FOUND,
+                        error="List not found or access denied"
+                    )
+                continue
+
+            if operation.task_id in seen_task_ids:
+                error, error_status = "Task appears more than once in the batch", status.HTTP_409_CONFLICT
+            elif operation.task_id not in owned_task_ids:
+                error, error_status = "Task not found", status.HTTP_404_NOT_FOUND
+            else:
+                error = None
+            seen_task_ids.add(operation.task_id)
+
+            if error:
+                results[index] = BulkTaskResult(
+                    index=index, op=operation.op, status=error_status, task_id=operation.task_id, error=error
+                )
+            elif operation.op == "update":
+                updates.append((index, operation))
+            else:
+                deletes.append((index, operation))
+
+        if payload.atomic and any(result is not None for result in results):
+            for index, operation in enumerate(operations):
+                if results[index] is None:
+                    results[index] = BulkTaskResult(
+                        index=index, op=operation.op, status=status.HTTP_424_FAILED_DEPENDENCY,
+                        task_id=getattr(operation, "task_id", None),
+                        error="Not applied: another operation in the batch failed"
+                    )
+            return BulkTaskResponse(committed=False, results=results)
+
+        try:
+            # One change sequence per applied operation, handed out in order
+            change_seq = reserve_change_seqs(self.db, user_id, len(creates) + len(updates) + len(deletes))
+            # (action, task ids, last sequence number) announced after commit
+            changes = []
+
+            if creates:
+                # Multi-row INSERT ... RETURNING, rows come back in parameter order
+                created = self.db.execute(
+                    insert(Task).returning(Task, sort_by_parameter_order=True),
+                    [
+                        {
+                            "title": operation.data.title,
+                            "description": operation.data.description,
+                            "list_id": operation.data.list_id,
+                            "priority": operation.data.priority,
+                            "due_date": operation.data.due_date,
+                            "completed": False,
+                            "change_seq": change_seq + offset,
+                        }
+                        for offset, (_, operation) in enumerate(creates)
+                    ]
+                ).scalars().all()
+                for (index, operation), task in zip(creates, created):
+                    results[index] = BulkTaskResult(
+                        index=index, op=operation.op, status=status.HTTP_201_CREATED,
+                        task_id=task.id, task=TaskResponse.model_validate(task)
+                    )
+                change_seq += len(creates)
+                changes.append(("created", [task.id for task in created], change_seq - 1))
+
+            if updates:
+                # Bulk UPDATE by primary key, batched per distinct set of fields
+                now = datetime.utcnow()
+                self.db.execute(
+                    update(Task),
+                    [
+                        {
+                            "id": operation.task_id,
+                            **operation.data.model_dump(exclude_unset=True),
+                            "updated_at": now,
+                            "change_seq": change_seq + offset,
+                        }
+                        for offset, (_, operation) in enumerate(updates)
+                    ]
+                )
+                updated = {
+                    task.id: task
+                    for task in self.db.query(Task).filter(
+                        Task.id.in_([operation.task_id for _, operation in updates])
+                    ).populate_existing()
+                }
+                for index, operation in updates:
+                    results[index] = BulkTaskResult(
+                        index=index, op=operation.op, status=status.HTTP_200_OK,
+                        task_id=operation.task_id, task=TaskResponse.model_validate(updated[operation.task_id])
+                    )
+                change_seq += len(updates)
+                changes.append(("updated", [operation.task_id for _, operation in updates], change_seq - 1))
+
+            if deletes:
+                self.db.execute(
+                    delete(Task).where(Task.id.in_([operation.task_id for _, operation in deletes])),
+                    execution_options={"synchronize_session": False}
+                )
+                record_tombstones(
+                    self.db, user_id, "task", [operation.task_id for _, operation in deletes], change_seq
+                )
+                for index, operation in deletes:
+                    results[index] = BulkTaskResult(
+                        index=index, op=operation.op, status=status.HTTP_200_OK, task_id=operation.task_id
+                    )
+                change_seq += len(deletes)
+                changes.append(("deleted", [operation.task_id for _, operation in deletes], change_seq - 1))
+
+            self.db.commit()
+            response_cache.bump(user_id)
+        except Exception:
+            self.db.rollback()
+            raise
+
+        for action, task_ids, last_seq in changes:
+            publish_change(user_id, "task", action, task_ids, last_seq)
+        return BulkTaskResponse(committed=True, results=results)
+
+
+class AsyncTasksService(AsyncService):
+    """Awaitable TasksService for the request path"""
+    service_class = TasksService
+
+    async def _call(self, name: str, *args, **kwargs):
+        try:
+            return await super()._call(name, *args, **kwargs)
+        finally:
+            # A write on the event loop only scheduled its generation bump
+            await response_cache.settle()
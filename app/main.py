@@ -1,7 +1,9 @@
-from fastapi import FastAPI, Request, Response
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from starlette.middleware.base import BaseHTTPMiddleware
 
 import sentry_sdk
 from app.api.router import router
@@ -10,36 +12,74 @@ import os
 
 from app.core.events.events import event_bus
 from app.core.middleware.api_key import APIKeyMiddleware
+from app.core.middleware.compression import CompressionMiddleware
+from app.core.middleware.no_cache import NoCacheMiddleware
+from app.core.middleware.replica_pin import ReplicaPinMiddleware
 
-from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
-from app.domains.api_clients.api_key_loader import load_active_hashed_keys
+from app.domains.api_clients.registry import api_key_registry, usage_recorder
+from app.domains.auth.hashing import calibrate_rounds, password_hasher
+from app.domains.sync.changes import CHANGE_EVENT
+from app.domains.sync.feed import change_feed
 
 from app import logger
 
-# Middleware to prevent caching of API responses
-class NoCacheMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-        # Only add no-cache headers for API endpoints
-        if request.url.path.startswith("/api/"):
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-        return response
+# Skip API key middleware in testing environment
+is_testing = os.environ.get("TESTING") == "1"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.PASSWORD_HASH_CALIBRATE_ON_STARTUP:
+        rounds = await run_in_threadpool(calibrate_rounds, settings.PASSWORD_HASH_TARGET_MS)
+        password_hasher.set_rounds(rounds)
+        logger.info(f"bcrypt calibrated to {rounds} rounds for a {settings.PASSWORD_HASH_TARGET_MS} ms target")
+
+    await change_feed.start()
+    background = []
+    if not is_testing:
+        await run_in_threadpool(api_key_registry.refresh)
+        background = [
+            asyncio.create_task(api_key_registry.run(settings.API_KEY_REFRESH_SECONDS)),
+            asyncio.create_task(usage_recorder.run(settings.API_USAGE_FLUSH_SECONDS)),
+        ]
+    yield
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await change_feed.stop()
+    # Don't lose the counters of the last partial window
+    await usage_recorder.flush()
+    password_hasher.shutdown()
 
 
 app = FastAPI(
     title="TaskFlow API",
     description="A simple FastAPI starter template with auth, users, and lists",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 logger.info("Initializing TaskFlow FastAPI application...")
 
+# Committed list and task writes go out to the change feed streams
+event_bus.subscribe(CHANGE_EVENT, change_feed.publish)
+
 # Add no-cache middleware first (executes last in response chain)
 app.add_middleware(NoCacheMiddleware)
 
+# Read-your-writes pin after a write, on whatever response the route sends
+if settings.DATABASE_REPLICA_URLS:
+    app.add_middleware(ReplicaPinMiddleware)
+
+# Compress inside the API key middleware, so usage is counted in bytes on the wire
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 # Configure CORS using settings
 logger.info(f"CORS Origins: {settings.CORS_ORIGINS}")
 app.add_middleware(
@@ -51,18 +91,9 @@ app.add_middleware(
     expose_headers=["X-Total-Count"],
 )
 
-def get_hashed_keys() -> set[str]:
-    db: Session = SessionLocal()
-    try:
-        return load_active_hashed_keys(db)
-    finally:
-        db.close()
-
-# Skip API key middleware in testing environment
-is_testing = os.environ.get("TESTING") == "1"
+# Keys are loaded at startup and refreshed in the background by the lifespan
 if not is_testing:
-    allowed_api_keys = get_hashed_keys()
-    app.add_middleware(APIKeyMiddleware, allowed_keys=allowed_api_keys)
+    app.add_middleware(APIKeyMiddleware, registry=api_key_registry, usage=usage_recorder)
 
 app.include_router(router)
 # Initialize Sentry conditionally based on environment settings
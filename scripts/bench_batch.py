@@ -0,0 +1,132 @@
+# scripts/bench_batch.py
+"""
+Web client initial load: GET /auth/me, GET /lists and one GET /tasks per list
+as separate calls vs. a single POST /batch.
+
+Separate calls go out like a browser on HTTP/1.1: /auth/me and /lists
+together, then the per-list calls over at most --connections at a time. The
+batch assumes the list ids are known from the previous session. --rtt-ms adds a
+modeled network round trip to every HTTP call (the app runs in-process, so
+without it only server-side cost is compared). The API-key middleware is off
+(TESTING=1), so its per-call cost is not in the figures.
+
+Usage:
+    python scripts/bench_batch.py --lists 10 --rounds 50 --rtt-ms 40
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from bench_common import create_schema, print_table, seed_user
+
+import httpx
+from sqlalchemy import event, insert
+
+from app.db.session import SessionLocal, async_engine, engine
+from app.domains.lists.models import List
+from app.domains.tasks.models import Task
+from app.main import app
+
+
+class Client:
+    """httpx client that counts calls and waits one modeled round trip per call"""
+
+    def __init__(self, client: httpx.AsyncClient, headers: dict, rtt: float, connections: int):
+        self.client = client
+        self.headers = headers
+        self.rtt = rtt
+        self.slots = asyncio.Semaphore(connections)
+        self.calls = 0
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        async with self.slots:
+            self.calls += 1
+            if self.rtt:
+                await asyncio.sleep(self.rtt)
+            response = await self.client.request(method, path, headers=self.headers, **kwargs)
+            response.raise_for_status()
+            return response
+
+
+async def load_separately(client: Client, list_ids: list) -> None:
+    await asyncio.gather(
+        client.request("GET", "/api/v1/auth/me"), client.request("GET", "/api/v1/lists")
+    )
+    await asyncio.gather(*(client.request("GET", f"/api/v1/tasks?list_id={list_id}") for list_id in list_ids))
+
+
+async def load_batched(client: Client, list_ids: list) -> None:
+    requests = [{"method": "GET", "path": "/auth/me"}, {"method": "GET", "path": "/lists"}]
+    requests += [{"method": "GET", "path": f"/tasks?list_id={list_id}"} for list_id in list_ids]
+    response = await client.request("POST", "/api/v1/batch", json={"requests": requests})
+    assert all(item["status"] == 200 for item in response.json()["responses"])
+
+
+async def run(headers: dict, list_ids: list, rounds: int, rtt: float, connections: int) -> list:
+    statements = 0
+
+    def count(*args, **kwargs):
+        nonlocal statements
+        statements += 1
+
+    engines = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+    for target in engines:
+        event.listen(target, "before_cursor_execute", count)
+
+    rows = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as http:
+        for name, load in (("separate calls", load_separately), ("POST /batch", load_batched)):
+            client = Client(http, headers, rtt, connections)
+            await load(client, list_ids)  # warm up caches
+            client.calls = statements = 0
+            timings = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                await load(client, list_ids)
+                timings.append(time.perf_counter() - started)
+            rows.append({
+                "load": name,
+                "HTTP calls": client.calls // rounds,
+                "DB statements": statements // rounds,
+                "median ms": f"{statistics.median(timings) * 1000:.1f}",
+                "p90 ms": f"{sorted(timings)[int(len(timings) * 0.9) - 1] * 1000:.1f}",
+            })
+
+    for target in engines:
+        event.remove(target, "before_cursor_execute", count)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark POST /batch against separate calls")
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks per list")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="Modeled network round trip per HTTP call")
+    parser.add_argument("--connections", type=int, default=6, help="Concurrent HTTP/1.1 connections")
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user, headers = seed_user(db)
+        list_ids = db.execute(
+            insert(List).returning(List.id),
+            [{"name": f"List {i}", "user_id": user.id} for i in range(args.lists)],
+        ).scalars().all()
+        db.execute(insert(Task), [
+            {"title": f"Task {k}", "list_id": list_id} for list_id in list_ids for k in range(args.tasks)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+    rows = asyncio.run(run(headers, list_ids, args.rounds, args.rtt_ms / 1000, args.connections))
+    print(f"{args.lists} lists x {args.tasks} tasks, modeled RTT {args.rtt_ms:g} ms, {args.connections} connections")
+    print_table(rows, ["load", "HTTP calls", "DB statements", "median ms", "p90 ms"])
+
+
+if __name__ == "__main__":
+    main()
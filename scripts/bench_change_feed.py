@@ -0,0 +1,170 @@
+# scripts/bench_change_feed.py
+"""
+Change feed cost: Python memory per idle GET /sync/events stream, latency
+from a write to its event on every open stream of the user, and what a
+reader that stops reading gets.
+
+Streams are driven through the ASGI app in-process (one asyncio task each, as
+under uvicorn), so the memory figure covers the route, the middleware stack and
+the feed buffer but not the socket. Without CHANGE_FEED_REDIS_ENABLED events go
+through the in-process path; with it, through Redis pub/sub at REDIS_URL.
+
+Usage:
+    python scripts/bench_change_feed.py --users 200 --streams-per-user 5 --writes 200
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from bench_common import create_schema, percentile, print_table, seed_user
+
+import httpx
+
+from app.db.session import SessionLocal
+from app.domains.lists.models import List
+from app.domains.sync.feed import change_feed
+from app.main import app
+
+
+class Stream:
+    """One open /sync/events request; records when each change event arrives"""
+
+    def __init__(self, headers: dict, blocked: bool = False):
+        self.scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/sync/events",
+            "raw_path": b"/api/v1/sync/events",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+        }
+        self.status = None
+        self.opened = asyncio.Event()
+        self.changes = []
+        self.resyncs = 0
+        self.disconnected = asyncio.Event()
+        # A blocked stream stops reading after the first chunk, like a stalled client
+        self.unblocked = asyncio.Event()
+        if not blocked:
+            self.unblocked.set()
+        self.task = asyncio.create_task(app(self.scope, self.receive, self.send))
+
+    async def receive(self):
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            if self.status != 200:
+                self.opened.set()
+            return
+        body = message.get("body", b"")
+        if not self.opened.is_set():
+            self.opened.set()
+            await self.unblocked.wait()
+        now = time.perf_counter()
+        self.changes.extend(now for _ in range(body.count(b"event: change\n")))
+        self.resyncs += body.count(b"event: resync\n")
+
+    async def close(self):
+        self.disconnected.set()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+async def run(args, users: list) -> list:
+    rows = []
+    await change_feed.start()
+    change_feed.max_streams_per_user = args.streams_per_user + 1
+
+    # Allocations of this script (the client side) are left out
+    server_side = [tracemalloc.Filter(False, __file__)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(server_side)
+    streams = [Stream(headers) for _, headers, _ in users for _ in range(args.streams_per_user)]
+    await asyncio.gather(*(stream.opened.wait() for stream in streams))
+    after = tracemalloc.take_snapshot().filter_traces(server_side)
+    tracemalloc.stop()
+    stream_bytes = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    rows.append({
+        "measure": "idle streams open",
+        "value": f"{sum(stream.status == 200 for stream in streams):,}",
+    })
+    rows.append({"measure": "KB per idle stream", "value": f"{stream_bytes / len(streams) / 1024:.1f}"})
+
+    _, headers, list_id = users[0]
+    watched = streams[:args.streams_per_user]
+    latencies = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for k in range(args.writes):
+            seen = len(watched[0].changes)
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/tasks", json={"title": f"Feed {k}", "list_id": list_id}, headers=headers
+            )
+            response.raise_for_status()
+            while any(len(stream.changes) <= seen for stream in watched):
+                await asyncio.sleep(0)
+            latencies.append(max(stream.changes[seen] for stream in watched) - started)
+
+        rows.append({"measure": "write -> all streams p50 ms", "value": f"{percentile(latencies, 50) * 1000:.2f}"})
+        rows.append({"measure": "write -> all streams p99 ms", "value": f"{percentile(latencies, 99) * 1000:.2f}"})
+
+        # A stalled reader: its buffer fills, is dropped, and it gets one resync
+        stalled = Stream(headers, blocked=True)
+        await stalled.opened.wait()
+        for k in range(change_feed.queue_size + 10):
+            response = await client.post(
+                "/api/v1/tasks", json={"title": f"Burst {k}", "list_id": list_id}, headers=headers
+            )
+            response.raise_for_status()
+        await asyncio.sleep(0.05)
+        stalled.unblocked.set()
+        await asyncio.sleep(0.05)
+        rows.append({
+            "measure": f"stalled reader after {change_feed.queue_size + 10} writes",
+            "value": f"{len(stalled.changes)} changes, {stalled.resyncs} resync",
+        })
+        streams.append(stalled)
+
+    await asyncio.gather(*(stream.close() for stream in streams))
+    rows.append({"measure": "streams left after disconnect", "value": change_feed.stats()["streams"]})
+    await change_feed.stop()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the change feed")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--streams-per-user", type=int, default=5)
+    parser.add_argument("--writes", type=int, default=200)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        users = []
+        for _ in range(args.users):
+            user, headers = seed_user(db)
+            list_obj = List(name="Feed", user_id=user.id)
+            db.add(list_obj)
+            db.commit()
+            users.append((user.id, headers, list_obj.id))
+    finally:
+        db.close()
+
+    rows = asyncio.run(run(args, users))
+    print(f"{args.users} users x {args.streams_per_user} streams, backend {change_feed.stats()['backend']}")
+    print_table(rows, ["measure", "value"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# scripts/bench_common.py
+"""
+Shared helpers for the benchmark scripts in this folder.
+
+Benchmarks run the app in-process (httpx ASGITransport) against the database
+configured in DATABASE_URL, with TESTING=1 so the API-key middleware is skipped.
+Environment switches must be set before ``app`` is imported.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the parent directory to Python path so we can import from app
+script_dir = Path(__file__).parent
+app_dir = script_dir.parent
+sys.path.insert(0, str(app_dir))
+
+os.environ.setdefault("TESTING", "1")
+
+
+def create_schema():
+    """Create any missing tables (no-op on a migrated database)"""
+    import app.domains.api_clients.models  # noqa: F401
+    import app.domains.auth.models  # noqa: F401
+    import app.domains.lists.models  # noqa: F401
+    import app.domains.sync.models  # noqa: F401
+    import app.domains.tasks.models  # noqa: F401
+    from app.db.base import Base
+    from app.db.session import engine
+
+    Base.metadata.create_all(engine)
+
+
+def seed_user(db, password_hash: str = "x") -> tuple:
+    """Create a verified user and return (user, auth headers)"""
+    from app.domains.auth.models import User
+    from app.domains.auth.utils import create_access_token
+
+    user = User(
+        name="Bench User",
+        email=f"bench-{uuid.uuid4().hex[:12]}@example.com",
+        hashed_password=password_hash,
+        is_verified=True,
+    )
+    db.add(user)
+    db.commit()
+    token = create_access_token(data={"sub": str(user.id)})
+    return user, {"Authorization": f"Bearer {token}"}
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_load(app, method: str, path: str, headers: dict, requests: int, concurrency: int, **kwargs) -> dict:
+    """Fire ``requests`` calls with ``concurrency`` workers and summarize latency"""
+    import httpx
+
+    latencies = []
+    statuses = {}
+    counter = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            for _ in counter:
+                start = time.perf_counter()
+                response = await client.request(method, path, headers=headers, **kwargs)
+                latencies.append(time.perf_counter() - start)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "statuses": statuses,
+    }
+
+
+def print_table(rows: list, columns: list) -> None:
+    widths = [max(len(col), *(len(f"{row.get(col, '')}") for row in rows)) for col in columns]
+    print("  ".join(col.ljust(width) for col, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(f"{row.get(col, '')}".ljust(width) for col, width in zip(columns, widths)))
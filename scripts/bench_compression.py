@@ -0,0 +1,156 @@
+# scripts/bench_compression.py
+"""
+Bytes on the wire and CPU cost of CompressionMiddleware per encoding and level.
+
+Seeds a user whose lists and tasks carry realistic text, fetches a full page of
+GET /tasks and GET /lists uncompressed, then replays each body through the
+middleware at several gzip levels and brotli qualities, both as one complete
+body and streamed in 16 KiB chunks (flushed per chunk, as for exports).
+
+Usage:
+    python scripts/bench_compression.py --tasks 200 --repeat 50
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "0")
+
+from bench_common import create_schema, print_table, seed_user
+
+import httpx
+from sqlalchemy import insert
+
+from app.core.middleware.compression import CompressionMiddleware, brotli
+from app.core.pagination import MAX_PAGE_SIZE
+from app.db.session import SessionLocal
+from app.domains.lists.models import List
+from app.domains.tasks.models import Task
+from app.main import app
+
+WORDS = (
+    "review draft send invoice client meeting notes update release fix bug deploy "
+    "call plan budget design test write report check email follow up schedule team "
+    "sprint backlog migrate database refactor onboarding docs weekly sync prepare slides"
+).split()
+STREAM_CHUNK = 16 * 1024
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def seed(db, tasks: int, lists: int) -> tuple:
+    rng = random.Random(42)
+    user, headers = seed_user(db)
+    list_ids = db.execute(
+        insert(List).returning(List.id),
+        [{"name": sentence(rng, 3), "description": sentence(rng, 20), "user_id": user.id} for _ in range(lists)],
+    ).scalars().all()
+    db.execute(insert(Task), [
+        {"title": sentence(rng, 6), "description": sentence(rng, rng.randint(10, 60)),
+         "list_id": list_ids[0], "completed": rng.random() < 0.3}
+        for _ in range(tasks)
+    ])
+    db.commit()
+    return list_ids[0], headers
+
+
+async def fetch(path: str, headers: dict, **params) -> bytes:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        response = await client.get(path, params=params, headers={**headers, "Accept-Encoding": "identity"})
+        response.raise_for_status()
+        return response.content
+
+
+def payload_app(body: bytes, streamed: bool):
+    async def asgi(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        if not streamed:
+            await send({"type": "http.response.body", "body": body})
+            return
+        for offset in range(0, len(body), STREAM_CHUNK):
+            await send({"type": "http.response.body", "body": body[offset:offset + STREAM_CHUNK], "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    return asgi
+
+
+async def measure(middleware: CompressionMiddleware, encoding: str, repeat: int) -> tuple:
+    """Return (bytes on the wire, best ms per response) for one middleware setup"""
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", encoding.encode())]}
+    wire = 0
+
+    async def send(message):
+        nonlocal wire
+        if message["type"] == "http.response.body":
+            wire += len(message.get("body", b""))
+
+    best = float("inf")
+    for _ in range(repeat):
+        wire = 0
+        started = time.perf_counter()
+        await middleware(scope, None, send)
+        best = min(best, time.perf_counter() - started)
+    return wire, best * 1000
+
+
+async def run(payloads: dict, repeat: int) -> list:
+    setups = [("identity", {}, "-")]
+    setups += [("gzip", {"gzip_level": level}, str(level)) for level in (1, 6, 9)]
+    if brotli is not None:
+        setups += [("br", {"brotli_quality": quality}, str(quality)) for quality in (1, 4, 5, 6, 11)]
+
+    rows = []
+    for name, body in payloads.items():
+        for streamed in (False, True):
+            for encoding, options, level in setups:
+                middleware = CompressionMiddleware(payload_app(body, streamed), **options)
+                wire, ms = await measure(middleware, encoding, repeat)
+                rows.append({
+                    "payload": name,
+                    "mode": "streamed" if streamed else "whole",
+                    "encoding": encoding,
+                    "level": level,
+                    "bytes": f"{wire:,}",
+                    "ratio": f"{len(body) / wire:.1f}x",
+                    "ms": f"{ms:.2f}",
+                    "MB/s": f"{len(body) / 1e6 / (ms / 1000):.0f}" if ms else "-",
+                })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response compression")
+    parser.add_argument("--tasks", type=int, default=MAX_PAGE_SIZE, help="Tasks in the fetched page")
+    parser.add_argument("--lists", type=int, default=100, help="Lists in the fetched page")
+    parser.add_argument("--repeat", type=int, default=30, help="Runs per setup (best is reported)")
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        list_id, headers = seed(db, args.tasks, args.lists)
+    finally:
+        db.close()
+
+    payloads = {
+        "GET /tasks": asyncio.run(fetch("/api/v1/tasks", headers, list_id=list_id, limit=MAX_PAGE_SIZE)),
+        "GET /lists": asyncio.run(fetch("/api/v1/lists", headers, limit=MAX_PAGE_SIZE)),
+    }
+    rows = asyncio.run(run(payloads, args.repeat))
+
+    if brotli is None:
+        print("brotli is not installed: only gzip is measured")
+    print(", ".join(f"{name}: {len(body):,} bytes" for name, body in payloads.items()))
+    print_table(rows, ["payload", "mode", "encoding", "level", "bytes", "ratio", "ms", "MB/s"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# scripts/bench_db_path.py
+"""
+Compare the sync (threadpool) and async (AsyncSession) database paths.
+
+Each mode runs in its own interpreter because DB_ASYNC_ENABLED is read at import.
+
+Usage:
+    python scripts/bench_db_path.py --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from bench_common import create_schema, print_table, run_load, seed_user
+
+
+def run_mode(args) -> dict:
+    from app.db.session import SessionLocal
+    from app.domains.lists.models import List
+    from app.main import app
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user, headers = seed_user(db)
+        db.add_all([List(name=f"List {i}", user_id=user.id) for i in range(args.lists)])
+        db.commit()
+    finally:
+        db.close()
+
+    return asyncio.run(run_load(app, "GET", args.path, headers, args.requests, args.concurrency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async database paths")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--lists", type=int, default=20, help="Lists seeded for the bench user")
+    parser.add_argument("--path", default="/api/v1/lists")
+    parser.add_argument("--mode", choices=["sync", "async"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args)))
+        return
+
+    rows = []
+    for mode in ("sync", "async"):
+        # Response cache off: every request should reach the database
+        env = dict(os.environ, DB_ASYNC_ENABLED="1" if mode == "async" else "0", RESPONSE_CACHE_ENABLED="0")
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, *sys.argv[1:]],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        rows.append({
+            "mode": mode,
+            "req/s": f"{result['rps']:.0f}",
+            "p50 ms": f"{result['p50_ms']:.1f}",
+            "p99 ms": f"{result['p99_ms']:.1f}",
+            "statuses": result["statuses"],
+        })
+
+    print(f"GET {args.path}: {args.requests} requests, concurrency {args.concurrency}")
+    print_table(rows, ["mode", "req/s", "p50 ms", "p99 ms", "statuses"])
+
+
+if __name__ == "__main__":
+    main()
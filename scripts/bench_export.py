@@ -0,0 +1,119 @@
+# scripts/bench_export.py
+"""
+Time to first byte, throughput and peak Python memory of GET /tasks/export.
+
+Seeds one user with --tasks tasks spread over --lists lists, then drives the
+export route through the ASGI app with a receiver that discards the body, so
+the measured memory is the server's alone (tracemalloc peak). Run it with two
+sizes to check that peak memory does not grow with the row count.
+
+Usage:
+    python scripts/bench_export.py --tasks 100000 --lists 20
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from bench_common import create_schema, print_table, seed_user
+
+from sqlalchemy import insert
+
+from app.db.session import SessionLocal
+from app.domains.lists.models import List
+from app.domains.tasks.models import Task
+from app.main import app
+
+INSERT_BATCH = 10_000
+
+
+def seed(db, tasks: int, lists: int) -> dict:
+    user, headers = seed_user(db)
+    list_ids = db.execute(
+        insert(List).returning(List.id),
+        [{"name": f"List {i}", "user_id": user.id} for i in range(lists)],
+    ).scalars().all()
+    for start in range(0, tasks, INSERT_BATCH):
+        db.execute(insert(Task), [
+            {"title": f"Task {k}", "description": "d" * 200, "list_id": list_ids[k % lists], "completed": k % 3 == 0}
+            for k in range(start, min(tasks, start + INSERT_BATCH))
+        ])
+    db.commit()
+    return headers
+
+
+async def export(headers: dict, query_string: str) -> tuple:
+    """Run one export request; return (stats, elapsed s, time to first byte s, peak traced bytes)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/tasks/export",
+        "raw_path": b"/api/v1/tasks/export",
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    stats = {"status": None, "bytes": 0, "first_byte": None}
+
+    async def receive():
+        # The client never disconnects during the benchmark
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            stats["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            if stats["first_byte"] is None:
+                stats["first_byte"] = time.perf_counter()
+            stats["bytes"] += len(message.get("body", b""))
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return stats, elapsed, stats["first_byte"] - started if stats["first_byte"] else None, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming task export")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--lists", type=int, default=20)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        headers = seed(db, args.tasks, args.lists)
+    finally:
+        db.close()
+
+    # Warm the auth and routing path on a cheap 404 before measuring
+    asyncio.run(export(headers, "list_id=0"))
+
+    rows = []
+    for export_format in ("ndjson", "csv"):
+        stats, elapsed, first_byte, peak = asyncio.run(export(headers, f"format={export_format}"))
+        rows.append({
+            "format": export_format,
+            "status": stats["status"],
+            "MB sent": f"{stats['bytes'] / 1e6:.1f}",
+            "first byte ms": f"{first_byte * 1000:.1f}",
+            "total ms": f"{elapsed * 1000:.0f}",
+            "rows/s": f"{args.tasks / elapsed:,.0f}",
+            "peak MB": f"{peak / 1e6:.1f}",
+        })
+    print(f"{args.tasks:,} tasks over {args.lists} lists")
+    print_table(rows, ["format", "status", "MB sent", "first byte ms", "total ms", "rows/s", "peak MB"])
+
+
+if __name__ == "__main__":
+    main()
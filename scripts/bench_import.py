@@ -0,0 +1,143 @@
+# scripts/bench_import.py
+"""
+Task import throughput: POST /tasks one row at a time vs POST /tasks/bulk vs a
+streamed POST /tasks/import upload (NDJSON and CSV).
+
+Row-by-row creation is timed on --sample rows and reported as rows/s, the
+others on all --tasks rows. The import uses COPY + INSERT ... SELECT on
+Postgres (psycopg) and batched executemany elsewhere.
+
+Usage:
+    python scripts/bench_import.py --tasks 100000 --lists 10
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import time
+
+from bench_common import create_schema, print_table, seed_user
+
+import httpx
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.domains.lists.models import List
+from app.main import app
+
+UPLOAD_CHUNK_ROWS = 500
+
+
+def seed(db, lists: int) -> tuple:
+    user, headers = seed_user(db)
+    list_ids = db.execute(
+        insert(List).returning(List.id),
+        [{"name": f"List {i}", "user_id": user.id} for i in range(lists)],
+    ).scalars().all()
+    db.commit()
+    return list_ids, headers
+
+
+def make_rows(list_ids: list, count: int) -> list:
+    return [
+        {
+            "title": f"Imported task {k}",
+            "description": "Migrated from the previous tool " * 4,
+            "list_id": list_ids[k % len(list_ids)],
+            "priority": ("low", "medium", "high")[k % 3],
+            "due_date": f"2026-{k % 12 + 1:02d}-{k % 28 + 1:02d}" if k % 2 else None,
+        }
+        for k in range(count)
+    ]
+
+
+async def upload(rows: list, upload_format: str):
+    """Yield the rows as an NDJSON or CSV body, a few hundred rows per chunk"""
+    if upload_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for start in range(0, len(rows), UPLOAD_CHUNK_ROWS):
+            writer.writerows(rows[start:start + UPLOAD_CHUNK_ROWS])
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        return
+    for start in range(0, len(rows), UPLOAD_CHUNK_ROWS):
+        yield "".join(json.dumps(row) + "\n" for row in rows[start:start + UPLOAD_CHUNK_ROWS]).encode()
+
+
+async def run(rows: list, sample: int, headers: dict) -> list:
+    results = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=None
+    ) as client:
+        started = time.perf_counter()
+        for row in rows[:sample]:
+            response = await client.post("/api/v1/tasks", json=row, headers=headers)
+            response.raise_for_status()
+        results.append(("POST /tasks (one by one)", sample, time.perf_counter() - started, 0))
+
+        batch = settings.TASKS_BULK_MAX_OPERATIONS
+        started = time.perf_counter()
+        for start in range(0, len(rows), batch):
+            operations = [{"op": "create", "data": row} for row in rows[start:start + batch]]
+            response = await client.post("/api/v1/tasks/bulk", json={"operations": operations}, headers=headers)
+            response.raise_for_status()
+        results.append((f"POST /tasks/bulk ({batch} per call)", len(rows), time.perf_counter() - started, 0))
+
+        for upload_format, content_type in (("ndjson", "application/x-ndjson"), ("csv", "text/csv")):
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/tasks/import",
+                content=upload(rows, upload_format),
+                headers={**headers, "Content-Type": content_type},
+            )
+            response.raise_for_status()
+            report = response.json()
+            results.append((
+                f"POST /tasks/import ({upload_format})", report["imported"], time.perf_counter() - started,
+                report["failed"]
+            ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk task import")
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--sample", type=int, default=500, help="Rows created one by one")
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        list_ids, headers = seed(db, args.lists)
+    finally:
+        db.close()
+
+    rows = make_rows(list_ids, args.tasks)
+    results = asyncio.run(run(rows, min(args.sample, args.tasks), headers))
+
+    dialect = engine.dialect
+    print(f"{args.tasks:,} tasks over {args.lists} lists on {dialect.name}+{dialect.driver}")
+    print_table(
+        [
+            {
+                "path": path,
+                "rows": f"{count:,}",
+                "seconds": f"{elapsed:.2f}",
+                "rows/s": f"{count / elapsed:,.0f}",
+                "failed": failed,
+            }
+            for path, count, elapsed, failed in results
+        ],
+        ["path", "rows", "seconds", "rows/s", "failed"]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# scripts/bench_list_counts.py
+"""
+Benchmark task_count / completed_count on list responses.
+
+Seeds one user with --lists lists of --tasks tasks each, then walks every page
+of ListsService.get_all_lists (one grouped aggregate per page) and compares it
+with the per-list count queries (N+1) clients effectively paid before.
+
+Usage:
+    python scripts/bench_list_counts.py --lists 1000 --tasks 100
+"""
+
+import argparse
+import time
+
+from bench_common import create_schema, print_table, seed_user
+
+from sqlalchemy import event, func, insert
+
+from app.db.session import SessionLocal, engine
+from app.domains.lists.models import List
+from app.domains.lists.service import ListsService
+from app.domains.tasks.models import Task
+
+
+def seed(db, lists: int, tasks: int) -> int:
+    user, _ = seed_user(db)
+    list_ids = db.execute(
+        insert(List).returning(List.id),
+        [{"name": f"List {i}", "user_id": user.id} for i in range(lists)],
+    ).scalars().all()
+    rows = [
+        {"title": f"Task {k}", "list_id": list_id, "completed": k % 3 == 0}
+        for list_id in list_ids for k in range(tasks)
+    ]
+    for start in range(0, len(rows), 10_000):
+        db.execute(insert(Task), rows[start:start + 10_000])
+    db.commit()
+    return user.id
+
+
+def count_statements(fn):
+    statements = []
+
+    def before_cursor_execute(*args):
+        statements.append(1)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return elapsed, len(statements)
+
+
+def aggregate_path(db, user_id: int, page_size: int) -> None:
+    service = ListsService(db)
+    cursor = None
+    while True:
+        page = service.get_all_lists(user_id, page_size, cursor)
+        if not page.meta.next_cursor:
+            break
+        cursor = page.meta.next_cursor
+
+
+def per_list_path(db, user_id: int) -> None:
+    lists = db.query(List).filter(List.user_id == user_id).all()
+    for list_obj in lists:
+        db.query(func.count(Task.id)).filter(Task.list_id == list_obj.id).scalar()
+        db.query(func.count(Task.id)).filter(Task.list_id == list_obj.id, Task.completed == True).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list task counts")
+    parser.add_argument("--lists", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=100, help="Tasks per list")
+    parser.add_argument("--page-size", type=int, default=200)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user_id = seed(db, args.lists, args.tasks)
+        rows = []
+        for name, fn in (
+            ("grouped aggregate per page", lambda: aggregate_path(db, user_id, args.page_size)),
+            ("per-list counts (N+1)", lambda: per_list_path(db, user_id)),
+        ):
+            db.expunge_all()
+            elapsed, statements = count_statements(fn)
+            rows.append({"path": name, "ms": f"{elapsed * 1000:.1f}", "statements": statements})
+    finally:
+        db.close()
+
+    print(f"{args.lists} lists x {args.tasks} tasks, page size {args.page_size}")
+    print_table(rows, ["path", "ms", "statements"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# scripts/bench_login_storm.py
+"""
+Login throughput and GET latency during a login storm.
+
+Fires a burst of POST /auth/login calls (real bcrypt hashes) while a second
+load keeps hitting GET /lists, and reports both: login throughput, the 503s
+from the bounded hashing queue, and how much the concurrent GETs slow down.
+
+Each hashing mode runs in its own interpreter because the settings are read at
+import: "threadpool" (PASSWORD_HASH_WORKERS=0) vs "process" (the process pool).
+
+Usage:
+    python scripts/bench_login_storm.py --logins 200 --login-concurrency 50
+    python scripts/bench_login_storm.py --workers 4 --max-pending 32
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from bench_common import create_schema, print_table, run_load, seed_user
+
+PASSWORD = "storm-password"
+
+
+async def storm(app, args, login_body: dict, headers: dict) -> dict:
+    baseline = await run_load(app, "GET", "/api/v1/lists", headers, args.gets, args.get_concurrency)
+    logins, during = await asyncio.gather(
+        run_load(app, "POST", "/api/v1/auth/login", {}, args.logins, args.login_concurrency, json=login_body),
+        run_load(app, "GET", "/api/v1/lists", headers, args.gets, args.get_concurrency),
+    )
+    return {"baseline": baseline, "logins": logins, "during": during}
+
+
+def run_mode(args) -> dict:
+    from app.db.session import SessionLocal
+    from app.domains.auth.utils import get_password_hash
+    from app.main import app
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user, headers = seed_user(db, password_hash=get_password_hash(PASSWORD))
+        login_body = {"email": user.email, "password": PASSWORD}
+    finally:
+        db.close()
+
+    return asyncio.run(storm(app, args, login_body, headers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bcrypt hashing under a login storm")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--login-concurrency", type=int, default=50)
+    parser.add_argument("--gets", type=int, default=500, help="GET /lists requests per phase")
+    parser.add_argument("--get-concurrency", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="Process pool size")
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--mode", choices=["threadpool", "process"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args)))
+        return
+
+    rows = []
+    for mode in ("threadpool", "process"):
+        env = dict(
+            os.environ,
+            PASSWORD_HASH_WORKERS="0" if mode == "threadpool" else str(args.workers),
+            PASSWORD_HASH_MAX_PENDING=str(args.max_pending),
+        )
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, *sys.argv[1:]],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        logins, baseline, during = result["logins"], result["baseline"], result["during"]
+        rows.append({
+            "mode": mode,
+            "logins/s": f"{logins['rps']:.1f}",
+            "login statuses": logins["statuses"],
+            "GET p50 idle": f"{baseline['p50_ms']:.1f}",
+            "GET p50 storm": f"{during['p50_ms']:.1f}",
+            "GET p99 idle": f"{baseline['p99_ms']:.1f}",
+            "GET p99 storm": f"{during['p99_ms']:.1f}",
+        })
+
+    print(f"{args.logins} logins (concurrency {args.login_concurrency}) "
+          f"alongside {args.gets} GET /lists (concurrency {args.get_concurrency}); latencies in ms")
+    print_table(rows, ["mode", "logins/s", "login statuses", "GET p50 idle", "GET p50 storm",
+                       "GET p99 idle", "GET p99 storm"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# scripts/bench_middleware.py
+"""
+Requests/sec through the API-key and no-cache middleware stack: the previous
+BaseHTTPMiddleware implementations vs the plain ASGI ones.
+
+Both stacks wrap the same API router and share a database; the API key is
+registered in an in-memory registry, so no api_clients row is needed.
+
+Usage:
+    python scripts/bench_middleware.py --requests 3000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import hashlib
+
+from bench_common import create_schema, print_table, run_load, seed_user
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.router import router
+from app.core.middleware.api_key import EXEMPT_PATHS, APIKeyMiddleware
+from app.core.middleware.no_cache import NO_CACHE_HEADERS, NoCacheMiddleware
+from app.db.session import SessionLocal
+from app.domains.api_clients.registry import APIKeyRegistry, UsageRecorder
+from app.domains.lists.models import List
+
+BENCH_KEY = "bench-api-key"
+
+
+class LegacyNoCacheMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response: Response = await call_next(request)
+        if request.url.path.startswith("/api/"):
+            response.headers.update(NO_CACHE_HEADERS)
+        return response
+
+
+class LegacyAPIKeyMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, registry: APIKeyRegistry, usage: UsageRecorder):
+        super().__init__(app)
+        self.registry = registry
+        self.usage = usage
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method == "OPTIONS" or request.url.path in EXEMPT_PATHS:
+            return await call_next(request)
+        raw_key = request.headers.get("x-api-key")
+        if not raw_key:
+            return JSONResponse(status_code=401, content={"detail": "Missing API key"})
+        client_id = self.registry.lookup(hashlib.sha256(raw_key.encode()).hexdigest())
+        if client_id is None:
+            return JSONResponse(status_code=403, content={"detail": "Invalid API key"})
+        response = await call_next(request)
+        self.usage.record(
+            client_id,
+            int(request.headers.get("content-length") or 0),
+            int(response.headers.get("content-length") or 0)
+        )
+        return response
+
+
+def build_app(no_cache, api_key) -> FastAPI:
+    registry = APIKeyRegistry()
+    registry.keys = {hashlib.sha256(BENCH_KEY.encode()).hexdigest(): "bench-client"}
+    app = FastAPI()
+    app.add_middleware(no_cache)
+    app.add_middleware(api_key, registry=registry, usage=UsageRecorder())
+    app.include_router(router)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BaseHTTPMiddleware vs plain ASGI middleware")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--lists", type=int, default=5, help="Lists seeded for the bench user")
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user, headers = seed_user(db)
+        db.add_all([List(name=f"List {i}", user_id=user.id) for i in range(args.lists)])
+        db.commit()
+    finally:
+        db.close()
+    headers["X-API-Key"] = BENCH_KEY
+
+    stacks = {
+        "BaseHTTPMiddleware": build_app(LegacyNoCacheMiddleware, LegacyAPIKeyMiddleware),
+        "ASGI": build_app(NoCacheMiddleware, APIKeyMiddleware),
+    }
+    rows = []
+    for path in ("/api/v1/health", "/api/v1/lists"):
+        for name, app in stacks.items():
+            result = asyncio.run(run_load(app, "GET", path, headers, args.requests, args.concurrency))
+            rows.append({
+                "path": path,
+                "middleware": name,
+                "req/s": f"{result['rps']:.0f}",
+                "p50 ms": f"{result['p50_ms']:.1f}",
+                "p99 ms": f"{result['p99_ms']:.1f}",
+                "statuses": result["statuses"],
+            })
+
+    print(f"{args.requests} requests per row, concurrency {args.concurrency}")
+    print_table(rows, ["path", "middleware", "req/s", "p50 ms", "p99 ms", "statuses"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# scripts/bench_response_cache.py
+"""
+GET /lists and GET /tasks with the per-user response cache off and on.
+
+Each mode runs in its own interpreter because the settings are read at import.
+Without RESPONSE_CACHE_REDIS_ENABLED the "on" mode uses the in-process tier,
+where a hit still runs the aggregate validator query; with Redis it runs none.
+Every --write-every requests one task is updated, invalidating the user's entries.
+
+Usage:
+    python scripts/bench_response_cache.py --requests 2000 --concurrency 20
+    RESPONSE_CACHE_REDIS_ENABLED=1 python scripts/bench_response_cache.py
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from bench_common import create_schema, print_table, run_load, seed_user
+
+
+async def load(app, args, headers: dict, list_id: int, task_id: int) -> dict:
+    results = {}
+    for path in ("/api/v1/lists", f"/api/v1/tasks?list_id={list_id}"):
+        remaining = args.requests
+        runs = []
+        while remaining > 0:
+            batch = min(args.write_every, remaining)
+            runs.append(await run_load(app, "GET", path, headers, batch, args.concurrency))
+            await run_load(app, "PUT", f"/api/v1/tasks/{task_id}", headers, 1, 1, json={"title": f"w{remaining}"})
+            remaining -= batch
+        elapsed = sum(run["requests"] / run["rps"] for run in runs if run["rps"])
+        results[path.split("?")[0]] = {
+            "rps": args.requests / elapsed if elapsed else 0.0,
+            "p50_ms": sorted(run["p50_ms"] for run in runs)[len(runs) // 2],
+        }
+    return results
+
+
+def run_mode(args) -> dict:
+    from app.core.response_cache import response_cache
+    from app.db.session import SessionLocal
+    from app.domains.lists.models import List
+    from app.domains.tasks.models import Task
+    from app.main import app
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user, headers = seed_user(db)
+        lists = [List(name=f"List {i}", user_id=user.id) for i in range(args.lists)]
+        db.add_all(lists)
+        db.flush()
+        tasks = [Task(title=f"Task {k}", list_id=lists[0].id) for k in range(args.tasks)]
+        db.add_all(tasks)
+        db.commit()
+        list_id, task_id = lists[0].id, tasks[0].id
+    finally:
+        db.close()
+
+    results = asyncio.run(load(app, args, headers, list_id, task_id))
+    results["stats"] = response_cache.stats()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-user response cache")
+    parser.add_argument("--requests", type=int, default=2000, help="GET requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--write-every", type=int, default=200, help="GETs between invalidating writes")
+    parser.add_argument("--lists", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=50, help="Tasks in the polled list")
+    parser.add_argument("--mode", choices=["off", "on"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args)))
+        return
+
+    rows = []
+    saved = 0.0
+    for mode in ("off", "on"):
+        env = dict(os.environ, RESPONSE_CACHE_ENABLED="1" if mode == "on" else "0")
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, *sys.argv[1:]],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        stats = result.pop("stats")
+        for path, numbers in result.items():
+            rows.append({
+                "cache": mode,
+                "path": path,
+                "req/s": f"{numbers['rps']:.0f}",
+                "p50 ms": f"{numbers['p50_ms']:.1f}",
+                "hit ratio": stats["hit_ratio"] if mode == "on" else "-",
+            })
+        if mode == "on":
+            saved = stats["estimated_saved_ms"]
+
+    print(f"{args.requests} GETs per endpoint, concurrency {args.concurrency}, "
+          f"one write every {args.write_every} GETs")
+    print_table(rows, ["cache", "path", "req/s", "p50 ms", "hit ratio"])
+    print(f"\nEstimated time saved by cache hits: {saved:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# scripts/bench_search.py
+"""
+GET /tasks/search latency on a large tasks table.
+
+Seeds --tasks tasks spread over --users users (10 lists each), with titles and
+descriptions drawn from a Zipf-distributed vocabulary, then measures search
+latency for the bench user with the response cache off:
+
+* a rare word, the most common word, two words, a quoted phrase, no match;
+* a deep page (the fifth, through next cursors) of the most common word.
+
+On Postgres this is the search_vector / GIN path; on SQLite the LIKE fallback,
+which scans the user's tasks (use a much smaller --tasks there).
+
+Usage:
+    python scripts/bench_search.py --tasks 1000000 --users 1000
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import random
+
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "0")
+
+from bench_common import create_schema, print_table, run_load, seed_user
+
+import httpx
+from sqlalchemy import insert
+
+from app.db.session import SessionLocal, engine
+from app.domains.lists.models import List
+from app.domains.tasks.models import Task
+from app.main import app
+
+SYLLABLES = ["ka", "lo", "mi", "ren", "to", "sa", "vel", "du", "an", "ri", "po", "ne", "gor", "li", "ma", "tes"]
+VOCABULARY_SIZE = 5000
+TITLE_WORDS = 4
+DESCRIPTION_WORDS = 30
+INSERT_BATCH = 10_000
+LISTS_PER_USER = 10
+LATENCY_COLUMNS = ("p50_ms", "p99_ms", "rps")
+
+
+def vocabulary(rng: random.Random) -> list:
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    return sorted(words, key=lambda word: rng.random())
+
+
+def seed(db, tasks: int, users: int, words: list, rng: random.Random) -> tuple:
+    """Insert the dataset; return the bench user's auth headers"""
+    weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+    list_ids, headers = [], None
+    for _ in range(users):
+        user, user_headers = seed_user(db)
+        headers = headers or user_headers
+        list_ids.append(db.execute(
+            insert(List).returning(List.id),
+            [{"name": f"List {i}", "user_id": user.id} for i in range(LISTS_PER_USER)],
+        ).scalars().all())
+    db.commit()
+
+    def text(count: int) -> str:
+        return " ".join(rng.choices(words, cum_weights=weights, k=count))
+
+    for start in range(0, tasks, INSERT_BATCH):
+        db.execute(insert(Task), [
+            {
+                "title": text(TITLE_WORDS),
+                "description": text(DESCRIPTION_WORDS),
+                "list_id": rng.choice(list_ids[k % users]),
+            }
+            for k in range(start, min(start + INSERT_BATCH, tasks))
+        ])
+        db.commit()
+    return headers
+
+
+async def deep_page_load(q: str, headers: dict, pages: int, requests: int) -> dict:
+    """Latency of page ``pages`` of ``q``, its cursor found by walking the pages before it"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        cursor = None
+        for _ in range(pages - 1):
+            response = await client.get(
+                "/api/v1/tasks/search", params={"q": q, **({"cursor": cursor} if cursor else {})}, headers=headers
+            )
+            cursor = response.json()["meta"]["next_cursor"]
+            if not cursor:
+                break
+    return await run_load(
+        app, "GET", "/api/v1/tasks/search", headers, requests, 1, params={"q": q, "cursor": cursor}
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark task search")
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per query")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = vocabulary(rng)
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        headers = seed(db, args.tasks, args.users, words, rng)
+    finally:
+        db.close()
+
+    queries = [
+        ("rare word", words[-1]),
+        ("most common word", words[0]),
+        ("two words", f"{words[0]} {words[1]}"),
+        ("phrase", f'"{words[2]} {words[3]}"'),
+        ("no match", "zzzqqq"),
+    ]
+    rows = []
+    for name, q in queries:
+        async def first_page():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+                response = await client.get("/api/v1/tasks/search", params={"q": q}, headers=headers)
+                return len(response.json()["items"])
+
+        hits = asyncio.run(first_page())
+        result = asyncio.run(run_load(
+            app, "GET", "/api/v1/tasks/search", headers, args.requests, args.concurrency, params={"q": q}
+        ))
+        rows.append({"query": name, "q": q, "page hits": hits, **{key: f"{result[key]:.1f}" for key in LATENCY_COLUMNS}})
+
+    result = asyncio.run(deep_page_load(words[0], headers, 5, args.requests))
+    rows.append({"query": "page 5, most common", "q": words[0], **{key: f"{result[key]:.1f}" for key in LATENCY_COLUMNS}})
+
+    print(f"{args.tasks:,} tasks over {args.users:,} users, {engine.dialect.name}")
+    print_table(rows, ["query", "q", "page hits", *LATENCY_COLUMNS])
+
+
+if __name__ == "__main__":
+    main()
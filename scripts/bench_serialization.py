@@ -0,0 +1,160 @@
+# scripts/bench_serialization.py
+"""
+Cost of building and serializing large list and task payloads.
+
+Seeds one user with --lists lists, one of which holds --tasks tasks, then walks
+every page of that task list and of the user's lists:
+
+* loading: ORM entities + per-row model_validate (the previous service code)
+  vs the plain column rows the services select now;
+* encoding one full page: stdlib json over jsonable_encoder (what FastAPI does
+  for non-model routes with JSONResponse) vs orjson vs pydantic-core dump;
+* end to end: walking every page over HTTP with the response cache off.
+
+Usage:
+    python scripts/bench_serialization.py --tasks 5000 --lists 1000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "0")
+
+from bench_common import create_schema, print_table, seed_user
+
+import httpx
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+
+from app.core.pagination import MAX_PAGE_SIZE, build_cursor_response, keyset_paginate
+from app.db.session import SessionLocal
+from app.domains.lists.models import List
+from app.domains.lists.service import LIST_KEYSET, ListsService
+from app.domains.tasks.models import Task
+from app.domains.tasks.schemas import TaskResponse
+from app.domains.tasks.service import TASK_KEYSET, TasksService
+from app.main import app
+
+
+def seed(db, lists: int, tasks: int) -> tuple:
+    user, headers = seed_user(db)
+    list_ids = db.execute(
+        insert(List).returning(List.id),
+        [{"name": f"List {i}", "user_id": user.id, "description": "d" * 200} for i in range(lists)],
+    ).scalars().all()
+    db.execute(insert(Task), [
+        {"title": f"Task {k}", "description": "d" * 500, "list_id": list_ids[0], "completed": k % 4 == 0}
+        for k in range(tasks)
+    ])
+    db.commit()
+    return user.id, list_ids[0], headers
+
+
+def walk(fetch) -> tuple:
+    """Follow next cursors until the end; return (elapsed seconds, last page)"""
+    started = time.perf_counter()
+    page = fetch(None)
+    while page.meta.next_cursor:
+        page = fetch(page.meta.next_cursor)
+    return time.perf_counter() - started, page
+
+
+def entity_tasks_page(db, list_id: int, user_id: int, cursor):
+    """The previous get_tasks_by_list body: Task entities validated row by row"""
+    TasksService(db).verify_list_ownership(list_id, user_id)
+    query = db.query(Task).filter(Task.list_id == list_id)
+    tasks, next_cursor, prev_cursor = keyset_paginate(query, TASK_KEYSET, MAX_PAGE_SIZE, cursor)
+    return build_cursor_response(
+        [TaskResponse.model_validate(task) for task in tasks], MAX_PAGE_SIZE, next_cursor, prev_cursor
+    )
+
+
+def entity_lists_page(db, user_id: int, cursor):
+    """The previous get_all_lists body: List entities"""
+    service = ListsService(db)
+    query = db.query(List).filter(List.user_id == user_id)
+    lists, next_cursor, prev_cursor = keyset_paginate(query, LIST_KEYSET, MAX_PAGE_SIZE, cursor)
+    counts = service.get_task_counts([list_obj.id for list_obj in lists])
+    return build_cursor_response(
+        [service.to_response(list_obj, *counts.get(list_obj.id, (0, 0))) for list_obj in lists],
+        MAX_PAGE_SIZE, next_cursor, prev_cursor
+    )
+
+
+def timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def http_walk(path: str, headers: dict, **query) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        started = time.perf_counter()
+        cursor = None
+        while True:
+            params = {**query, "limit": MAX_PAGE_SIZE, **({"cursor": cursor} if cursor else {})}
+            response = await client.get(path, params=params, headers=headers)
+            cursor = response.json()["meta"]["next_cursor"]
+            if not cursor:
+                return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark payload building and serialization")
+    parser.add_argument("--tasks", type=int, default=5000, help="Tasks in the walked list")
+    parser.add_argument("--lists", type=int, default=1000, help="Lists of the bench user")
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user_id, list_id, headers = seed(db, args.lists, args.tasks)
+    finally:
+        db.close()
+
+    def with_session(fn):
+        def run():
+            db = SessionLocal()
+            try:
+                return walk(lambda cursor: fn(db, cursor))
+            finally:
+                db.close()
+        return run
+
+    rows = [
+        {"step": "tasks: entities + validate", "ms": timed(with_session(lambda db, c: entity_tasks_page(db, list_id, user_id, c)))},
+        {"step": "tasks: column rows (now)", "ms": timed(with_session(
+            lambda db, c: TasksService(db).get_tasks_by_list(list_id, user_id, limit=MAX_PAGE_SIZE, cursor=c)))},
+        {"step": "lists: entities", "ms": timed(with_session(lambda db, c: entity_lists_page(db, user_id, c)))},
+        {"step": "lists: column rows (now)", "ms": timed(with_session(
+            lambda db, c: ListsService(db).get_all_lists(user_id, limit=MAX_PAGE_SIZE, cursor=c)))},
+    ]
+
+    db = SessionLocal()
+    try:
+        page = TasksService(db).get_tasks_by_list(list_id, user_id, limit=MAX_PAGE_SIZE)
+    finally:
+        db.close()
+    rows += [
+        {"step": "encode page: json + jsonable_encoder", "ms": timed(lambda: json.dumps(jsonable_encoder(page)).encode())},
+        {"step": "encode page: orjson (model_dump)", "ms": timed(lambda: orjson.dumps(page.model_dump()))},
+        {"step": "encode page: pydantic-core dump", "ms": timed(lambda: page.model_dump_json().encode())},
+        {"step": "HTTP walk GET /tasks", "ms": asyncio.run(http_walk("/api/v1/tasks", headers, list_id=list_id))},
+        {"step": "HTTP walk GET /lists", "ms": asyncio.run(http_walk("/api/v1/lists", headers))},
+    ]
+
+    for row in rows:
+        row["ms"] = f"{row['ms']:.1f}"
+    print(f"{args.tasks} tasks / {args.lists} lists, pages of {MAX_PAGE_SIZE}; best of 5 (HTTP: single run)")
+    print_table(rows, ["step", "ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# scripts/bench_sparse_fields.py
+"""
+GET /tasks with and without ?fields= on tasks with large descriptions.
+
+Seeds one list with --tasks tasks whose descriptions are --description-kb KB,
+then walks every page of it for each field set:
+
+* query: the page queries alone, with the column subset the field set selects;
+* build: query + validation into the (sparse) response model, as the service does;
+* payload: JSON bytes over all pages;
+* end to end: walking every page over HTTP with the response cache off.
+
+Usage:
+    python scripts/bench_sparse_fields.py --tasks 5000 --description-kb 4
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "0")
+
+from bench_common import create_schema, print_table, seed_user
+
+import httpx
+from sqlalchemy import insert
+
+from app.core.fields import parse_fields, sparse_columns
+from app.core.pagination import MAX_PAGE_SIZE, keyset_paginate
+from app.db.session import SessionLocal
+from app.domains.lists.models import List
+from app.domains.tasks.models import Task
+from app.domains.tasks.schemas import TaskResponse
+from app.domains.tasks.service import TASK_KEYSET, TASK_RESPONSE_COLUMNS, TasksService
+from app.main import app
+
+FIELD_SETS = [None, "id,title,completed,due_date", "id,title"]
+
+
+def seed(db, tasks: int, description_kb: int) -> tuple:
+    user, headers = seed_user(db)
+    list_obj = List(name="Sparse", user_id=user.id)
+    db.add(list_obj)
+    db.flush()
+    description = "d" * (description_kb * 1024)
+    db.execute(insert(Task), [
+        {"title": f"Task {k}", "description": description, "list_id": list_obj.id, "completed": k % 4 == 0}
+        for k in range(tasks)
+    ])
+    db.commit()
+    return user.id, list_obj.id, headers
+
+
+def timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def walk_query(db, list_id: int, fields) -> None:
+    query = db.query(*sparse_columns(TASK_RESPONSE_COLUMNS, fields, TASK_KEYSET)).filter(Task.list_id == list_id)
+    cursor = None
+    while True:
+        _, cursor, _ = keyset_paginate(query, TASK_KEYSET, MAX_PAGE_SIZE, cursor)
+        if not cursor:
+            return
+
+
+def walk_build(db, list_id: int, user_id: int, fields) -> int:
+    """Walk the pages through the service; JSON bytes of all of them"""
+    service = TasksService(db)
+    size = 0
+    cursor = None
+    while True:
+        page = service.get_tasks_by_list(list_id, user_id, None, MAX_PAGE_SIZE, cursor, fields)
+        size += len(page.model_dump_json())
+        cursor = page.meta.next_cursor
+        if not cursor:
+            return size
+
+
+async def http_walk(list_id: int, headers: dict, fields) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        started = time.perf_counter()
+        cursor = None
+        while True:
+            params = {"list_id": list_id, "limit": MAX_PAGE_SIZE}
+            params.update({"fields": fields} if fields else {})
+            params.update({"cursor": cursor} if cursor else {})
+            response = await client.get("/api/v1/tasks", params=params, headers=headers)
+            response.raise_for_status()
+            cursor = response.json()["meta"]["next_cursor"]
+            if not cursor:
+                return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sparse fieldsets on GET /tasks")
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--description-kb", type=int, default=4)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    try:
+        user_id, list_id, headers = seed(db, args.tasks, args.description_kb)
+        rows = []
+        for raw in FIELD_SETS:
+            fields = parse_fields(raw, TaskResponse)
+            payload = walk_build(db, list_id, user_id, fields)
+            rows.append({
+                "fields": raw or "(all)",
+                "query ms": f"{timed(lambda: walk_query(db, list_id, fields)):.1f}",
+                "build ms": f"{timed(lambda: walk_build(db, list_id, user_id, fields)):.1f}",
+                "payload KB": f"{payload / 1024:,.0f}",
+                "HTTP walk ms": f"{min(asyncio.run(http_walk(list_id, headers, raw)) for _ in range(3)):.1f}",
+            })
+    finally:
+        db.close()
+
+    print(f"{args.tasks} tasks, {args.description_kb} KB descriptions, pages of {MAX_PAGE_SIZE}")
+    print_table(rows, ["fields", "query ms", "build ms", "payload KB", "HTTP walk ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# scripts/bench_token_verify.py
+"""
+JWT verifications per second: a full python-jose ``jwt.decode`` on every call
+vs ``token_service.decode`` with its digest-keyed cache.
+
+Tokens are verified round-robin from a pool of ``--tokens`` distinct tokens, as
+if that many users were active at once. Set --tokens above
+TOKEN_CACHE_MAX_ENTRIES to see the cost of a thrashing cache.
+
+Usage:
+    python scripts/bench_token_verify.py --tokens 1000 --verifications 200000
+"""
+
+import argparse
+import itertools
+import time
+
+from bench_common import print_table
+
+from jose import jwt
+
+from app.core.config import settings
+from app.core.tokens import TokenService, token_service
+
+
+def decode_uncached(token: str) -> dict:
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+def measure(verify, tokens: list, verifications: int) -> float:
+    cycle = itertools.cycle(tokens)
+    started = time.perf_counter()
+    for _ in range(verifications):
+        verify(next(cycle))
+    return verifications / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cached vs uncached JWT verification")
+    parser.add_argument("--tokens", type=int, default=1000, help="Distinct tokens in rotation")
+    parser.add_argument("--verifications", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tokens = [token_service.create_access_token({"sub": str(user_id)}) for user_id in range(args.tokens)]
+    cached = TokenService(
+        settings.SECRET_KEY, settings.ALGORITHM, settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+        settings.TOKEN_CACHE_MAX_ENTRIES
+    )
+    # Each token verified once up front, as on a user's first request
+    for token in tokens:
+        cached.decode(token)
+
+    rows = [
+        {
+            "path": "jwt.decode",
+            "verifications/s": f"{measure(decode_uncached, tokens, args.verifications):,.0f}",
+        },
+        {
+            "path": "token_service.decode (warm)",
+            "verifications/s": f"{measure(cached.decode, tokens, args.verifications):,.0f}",
+        },
+    ]
+    print(f"{args.verifications:,} verifications over {args.tokens:,} tokens "
+          f"(cache size {settings.TOKEN_CACHE_MAX_ENTRIES:,})")
+    print_table(rows, ["path", "verifications/s"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# scripts/calibrate_password_hash.py
+"""
+Pick the bcrypt work factor for this machine.
+
+Times one hash at every cost between MIN_BCRYPT_ROUNDS and MAX_BCRYPT_ROUNDS and
+recommends the highest one within the latency target. Run it on each node type
+and set BCRYPT_ROUNDS for the deployment; existing hashes are upgraded (or
+downgraded) the next time their owner logs in.
+
+Usage:
+    python scripts/calibrate_password_hash.py
+    python scripts/calibrate_password_hash.py --target-ms 300 --samples 5
+"""
+
+import argparse
+
+from bench_common import print_table
+
+from app.core.config import settings
+from app.domains.auth.hashing import MAX_BCRYPT_ROUNDS, MIN_BCRYPT_ROUNDS, bcrypt_rounds, measure_rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate the bcrypt work factor")
+    parser.add_argument("--target-ms", type=float, default=settings.PASSWORD_HASH_TARGET_MS)
+    parser.add_argument("--samples", type=int, default=3, help="Hashes timed per cost (median is used)")
+    parser.add_argument("--max-rounds", type=int, default=MAX_BCRYPT_ROUNDS)
+    args = parser.parse_args()
+
+    rows = []
+    recommended = MIN_BCRYPT_ROUNDS
+    for rounds in range(MIN_BCRYPT_ROUNDS, args.max_rounds + 1):
+        elapsed_ms = measure_rounds(rounds, args.samples)
+        within = elapsed_ms <= args.target_ms
+        if within:
+            recommended = rounds
+        rows.append({"rounds": rounds, "ms / hash": f"{elapsed_ms:.1f}", "within target": "yes" if within else "no"})
+        if elapsed_ms > args.target_ms * 2:
+            # Every further round doubles again; no need to time them
+            break
+
+    print(f"Target: {args.target_ms:.0f} ms per hash (currently configured: {bcrypt_rounds()} rounds)")
+    print_table(rows, ["rounds", "ms / hash", "within target"])
+    print(f"\nRecommended: BCRYPT_ROUNDS={recommended}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# scripts/check_query_plans.py
+"""
+Query-plan regression check for the service layer.
+
+Seeds the database configured in DATABASE_URL with a realistic volume of users,
+lists and tasks, calls the read paths of the services while capturing the SQL
+they emit, and runs EXPLAIN on every captured statement. Exits non-zero when a
+sequential scan shows up on one of the large tables. On Postgres sequential
+scans are priced out first (enable_seqscan = off), so with small seed data one
+still only shows up where no index can serve the query.
+tests/test_query_plans.py runs the same check under pytest.
+
+Point DATABASE_URL at a scratch database: the seed data is not cleaned up.
+
+Usage:
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --users 500 --lists 10 --tasks 50
+"""
+
+import argparse
+import json
+import re
+import sys
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add the parent directory to Python path so we can import from app
+script_dir = Path(__file__).parent
+app_dir = script_dir.parent
+sys.path.insert(0, str(app_dir))
+
+from fastapi import HTTPException
+from sqlalchemy import event, insert, select, text
+
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.domains.api_clients.models import APIClient  # noqa: F401
+from app.domains.auth.models import User
+from app.domains.auth.service import AuthService
+from app.domains.lists.models import List
+from app.domains.lists.service import ListsService
+from app.domains.sync.service import SyncService, encode_sync_token
+from app.domains.tasks.models import PriorityEnum, Task
+from app.domains.tasks.service import TasksService
+
+LARGE_TABLES = {"users", "lists", "tasks", "sync_tombstones"}
+
+
+def seed(db, users: int, lists_per_user: int, tasks_per_list: int) -> None:
+    """Bulk insert the dataset with executemany INSERTs"""
+    run_id = uuid.uuid4().hex[:8]
+    priorities = list(PriorityEnum)
+    user_rows = [
+        {
+            "name": f"User {i}",
+            "email": f"plan-{run_id}-{i}@example.com",
+            "hashed_password": "x",
+            "is_verified": True,
+            "verification_token": f"verify-{run_id}-{i}" if i % 100 == 0 else None,
+            "reset_token": f"reset-{run_id}-{i}" if i % 100 == 1 else None,
+            "reset_token_expires": datetime.utcnow() + timedelta(hours=1) if i % 100 == 1 else None,
+            "change_seq": lists_per_user * (1 + tasks_per_list),
+        }
+        for i in range(users)
+    ]
+    user_ids = db.execute(insert(User).returning(User.id), user_rows).scalars().all()
+
+    list_rows = [
+        {"name": f"List {j}", "user_id": user_id, "change_seq": j + 1}
+        for user_id in user_ids for j in range(lists_per_user)
+    ]
+    list_ids = db.execute(insert(List).returning(List.id), list_rows).scalars().all()
+
+    batch = []
+    for index, list_id in enumerate(list_ids):
+        # Change sequences numbered per user: lists first, then their tasks
+        first_seq = lists_per_user + (index % lists_per_user) * tasks_per_list + 1
+        for k in range(tasks_per_list):
+            batch.append({
+                "title": f"Task {k}",
+                "list_id": list_id,
+                "priority": priorities[k % len(priorities)],
+                "due_date": date.today() + timedelta(days=k) if k % 3 else None,
+                "completed": k % 4 == 0,
+                "change_seq": first_seq + k,
+            })
+        if len(batch) >= 10_000:
+            db.execute(insert(Task), batch)
+            batch = []
+    if batch:
+        db.execute(insert(Task), batch)
+    db.commit()
+    db.execute(text("ANALYZE"))
+    db.commit()
+
+
+def service_queries(db) -> list:
+    """(name, callable) pairs exercising each service read path"""
+    user = db.execute(select(User).where(User.verification_token.isnot(None)).limit(1)).scalar_one()
+    reset_user = db.execute(select(User).where(User.reset_token.isnot(None)).limit(1)).scalar_one()
+    list_obj = db.execute(select(List).where(List.user_id == user.id).limit(1)).scalar_one()
+    task = db.execute(select(Task).where(Task.list_id == list_obj.id).limit(1)).scalar_one()
+
+    lists_service = ListsService(db)
+    tasks_service = TasksService(db)
+    auth_service = AuthService(db)
+    sync_service = SyncService(db)
+
+    # Cursors pointing into the middle of the keyset orderings
+    lists_cursor = lists_service.get_all_lists(user.id, limit=2).meta.next_cursor
+    tasks_cursor = tasks_service.get_tasks_by_list(list_obj.id, user.id, limit=10).meta.next_cursor
+
+    return [
+        ("ListsService.get_lists_version", lambda: lists_service.get_lists_version(user.id)),
+        ("ListsService.get_all_lists", lambda: lists_service.get_all_lists(user.id)),
+        ("ListsService.get_all_lists(cursor)", lambda: lists_service.get_all_lists(user.id, cursor=lists_cursor)),
+        ("ListsService.get_list_by_id", lambda: lists_service.get_list_by_id(list_obj.id, user.id)),
+        ("TasksService.verify_list_ownership", lambda: tasks_service.verify_list_ownership(list_obj.id, user.id)),
+        ("TasksService.get_tasks_version", lambda: tasks_service.get_tasks_version(list_obj.id, user.id)),
+        ("TasksService.get_tasks_by_list", lambda: tasks_service.get_tasks_by_list(list_obj.id, user.id)),
+        ("TasksService.get_tasks_by_list(completed)", lambda: tasks_service.get_tasks_by_list(list_obj.id, user.id, False)),
+        ("TasksService.get_tasks_by_list(cursor)", lambda: tasks_service.get_tasks_by_list(list_obj.id, user.id, cursor=tasks_cursor)),
+        ("TasksService.get_task_by_id", lambda: tasks_service.get_task_by_id(task.id, user.id)),
+        ("TasksService.search_tasks", lambda: tasks_service.search_tasks(user.id, task.title.split()[0])),
+        ("SyncService.get_changes", lambda: sync_service.get_changes(user.id)),
+        ("SyncService.get_changes(since)", lambda: sync_service.get_changes(user.id, encode_sync_token(1))),
+        ("AuthService.get_user_by_email", lambda: auth_service.get_user_by_email(user.email)),
+        ("AuthService.verify_email (lookup)", lambda: auth_service.verify_email("no-such-token")),
+        ("AuthService.get_user_for_reset", lambda: auth_service.get_user_for_reset(reset_user.reset_token)),
+    ]
+
+
+def capture_statements(fn, target=engine) -> list:
+    """Run ``fn`` and return the (statement, parameters) pairs it executed on ``target``"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    except HTTPException:
+        # Lookups with a bogus token end in a 400/404; the query still ran
+        pass
+    finally:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def _postgres_seq_scans(plan: dict) -> list:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in LARGE_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_postgres_seq_scans(child))
+    return found
+
+
+def explain_seq_scans(conn, statement: str, parameters) -> list:
+    """Return the large tables read with a full scan by ``statement``"""
+    if conn.dialect.name == "postgresql":
+        # Scratch tables are small enough for a scan to be the cheapest plan
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        plan = result if isinstance(result, list) else json.loads(result)
+        return _postgres_seq_scans(plan[0]["Plan"])
+
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        scans = [re.match(r"SCAN (\w+)", row[-1]) for row in rows]
+        return [match.group(1) for match in scans if match and match.group(1) in LARGE_TABLES]
+
+    raise SystemExit(f"EXPLAIN check not supported for dialect {conn.dialect.name}")
+
+
+def check_plans(db, target=engine) -> list:
+    """(service call, statement, tables it scans) for every statement the read paths run"""
+    results = []
+    for name, fn in service_queries(db):
+        statements = capture_statements(fn, target)
+        with target.connect() as conn:
+            for statement, parameters in statements:
+                results.append((name, statement, explain_seq_scans(conn, statement, parameters)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail on sequential scans in service queries")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--lists", type=int, default=10, help="Lists per user")
+    parser.add_argument("--tasks", type=int, default=50, help="Tasks per list")
+    parser.add_argument("--no-seed", action="store_true", help="Reuse the data already in the database")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    failures = []
+    try:
+        if not args.no_seed:
+            seed(db, args.users, args.lists, args.tasks)
+
+        for name, statement, scans in check_plans(db):
+            status = "SEQ SCAN on " + ", ".join(scans) if scans else "ok"
+            print(f"{name:<45} {status}")
+            if scans:
+                failures.append((name, statement))
+    finally:
+        db.close()
+
+    if failures:
+        print(f"\n❌ {len(failures)} statement(s) scan a large table:")
+        for name, statement in failures:
+            print(f"\n-- {name}\n{statement}")
+        sys.exit(1)
+    print("\n✅ No sequential scans on large tables")
+
+
+if __name__ == "__main__":
+    main()
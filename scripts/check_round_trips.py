@@ -0,0 +1,145 @@
+# scripts/check_round_trips.py
+"""
+Per-endpoint database round-trip budget check.
+
+Calls each endpoint in-process and counts the round trips it makes to the
+database (statements executed + COMMITs). Exits non-zero when an endpoint goes
+over its budget, so a regression such as a re-added refresh() shows up.
+
+Runs against DATABASE_URL (SQLite is fine); point it at a scratch database.
+tests/test_round_trips.py runs the same checks under pytest.
+
+Usage:
+    DATABASE_URL=sqlite:///./roundtrips.db python scripts/check_round_trips.py
+"""
+
+import sys
+
+from bench_common import create_schema, seed_user
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.db.session import SessionLocal, async_engine, engine
+from app.domains.lists.models import List
+from app.domains.tasks.models import Task
+from app.main import app
+
+# (name, method, path, json body, budget); {list_id} / {task_id} are filled in per run.
+# Budgets assume a warm principal cache: no user lookup on authenticated requests.
+ENDPOINTS = [
+    ("POST /lists", "POST", "/api/v1/lists", {"name": "Budget"}, 4),
+    ("GET /lists", "GET", "/api/v1/lists", None, 3),
+    ("GET /lists?fields=id,name", "GET", "/api/v1/lists?fields=id,name", None, 2),
+    ("GET /lists/{id}", "GET", "/api/v1/lists/{list_id}", None, 1),
+    ("POST /tasks", "POST", "/api/v1/tasks", {"title": "Budget", "list_id": "{list_id}"}, 3),
+    ("GET /tasks", "GET", "/api/v1/tasks?list_id={list_id}", None, 3),
+    ("GET /tasks?fields=title", "GET", "/api/v1/tasks?list_id={list_id}&fields=title", None, 3),
+    ("GET /tasks/search", "GET", "/api/v1/tasks/search?q=budget", None, 2),
+    ("GET /tasks/{id}", "GET", "/api/v1/tasks/{task_id}", None, 1),
+    ("PUT /tasks/{id}", "PUT", "/api/v1/tasks/{task_id}", {"completed": True}, 3),
+    ("PUT /tasks/{id} (404)", "PUT", "/api/v1/tasks/0", {"completed": True}, 2),
+    ("DELETE /tasks/{id}", "DELETE", "/api/v1/tasks/{task_id}", None, 4),
+    ("DELETE /tasks/{id} (404)", "DELETE", "/api/v1/tasks/0", None, 2),
+    ("POST /tasks/bulk", "POST", "/api/v1/tasks/bulk", {"operations": [
+        {"op": "create", "data": {"title": "Bulk", "list_id": "{list_id}"}},
+        {"op": "update", "task_id": "{other_task_id}", "data": {"completed": True}},
+        {"op": "delete", "task_id": "{task_id}"},
+    ]}, 8),
+    ("GET /sync", "GET", "/api/v1/sync", None, 4),
+    ("GET /sync (idle)", "GET", "/api/v1/sync?since={sync_token}", None, 1),
+    # Same cost as the three calls made one by one
+    ("POST /batch (me, lists, tasks)", "POST", "/api/v1/batch", {"requests": [
+        {"method": "GET", "path": "/auth/me"},
+        {"method": "GET", "path": "/lists"},
+        {"method": "GET", "path": "/tasks?list_id={list_id}"},
+    ]}, 6),
+]
+
+
+class RoundTripCounter:
+    """Counts statements and COMMITs on the sync and async engines"""
+
+    def __init__(self):
+        self.count = 0
+        self.engines = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+
+    def _increment(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        for target in self.engines:
+            event.listen(target, "before_cursor_execute", self._increment)
+            event.listen(target, "commit", self._increment)
+        return self
+
+    def __exit__(self, *exc):
+        for target in self.engines:
+            event.remove(target, "before_cursor_execute", self._increment)
+            event.remove(target, "commit", self._increment)
+
+
+def fill(value, ids: dict):
+    if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
+        return ids[value[1:-1]]
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, list):
+        return [fill(item, ids) for item in value]
+    if isinstance(value, dict):
+        return {key: fill(item, ids) for key, item in value.items()}
+    return value
+
+
+def seed_list() -> tuple:
+    """Create a user with one list; return (auth headers, list id)"""
+    create_schema()
+    db = SessionLocal()
+    try:
+        user, headers = seed_user(db)
+        list_obj = List(name="Round trips", user_id=user.id)
+        db.add(list_obj)
+        db.commit()
+        return headers, list_obj.id
+    finally:
+        db.close()
+
+
+def measure(client, headers: dict, list_id: int, method: str, path: str, body) -> tuple:
+    """Call one endpoint; return (response, round trips it made)"""
+    # Fresh tasks per endpoint so updates and deletes always have a target
+    db = SessionLocal()
+    tasks = [Task(title="Target", list_id=list_id), Task(title="Other", list_id=list_id)]
+    db.add_all(tasks)
+    db.commit()
+    ids = {"list_id": list_id, "task_id": tasks[0].id, "other_task_id": tasks[1].id}
+    db.close()
+    ids["sync_token"] = client.get("/api/v1/sync", headers=headers).json()["next_token"]
+
+    with RoundTripCounter() as counter:
+        response = client.request(method, fill(path, ids), json=fill(body, ids), headers=headers)
+    return response, counter.count
+
+
+def main():
+    headers, list_id = seed_list()
+
+    failures = []
+    with TestClient(app) as client:
+        # Warm the principal cache, as on any request after a user's first
+        client.get("/api/v1/auth/me", headers=headers)
+        for name, method, path, body, budget in ENDPOINTS:
+            response, count = measure(client, headers, list_id, method, path, body)
+            status = "ok" if count <= budget else "OVER BUDGET"
+            print(f"{name:<32} {response.status_code:>3}  {count:>2} / {budget:<2} round trips  {status}")
+            if count > budget:
+                failures.append(name)
+
+    if failures:
+        print(f"\n❌ Over budget: {', '.join(failures)}")
+        sys.exit(1)
+    print("\n✅ All endpoints within their round-trip budget")
+
+
+if __name__ == "__main__":
+    main()
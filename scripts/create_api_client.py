@@ -12,6 +12,7 @@ script_dir = Path(__file__).parent
 app_dir = script_dir.parent
 sys.path.insert(0, str(app_dir))
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.domains.api_clients.models import APIClient
 
@@ -26,6 +27,7 @@ def create_api_key(name: str) -> str:
 
     print(f"✅ API key created for '{name}'")
     print(f"🔑 Here is the API key (save it securely!):\n\n{raw_key}\n")
+    print(f"Running servers pick it up within API_KEY_REFRESH_SECONDS ({settings.API_KEY_REFRESH_SECONDS}s)")
     return raw_key
 
 def main():
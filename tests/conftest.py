@@ -0,0 +1,81 @@
+# tests/conftest.py
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Settings are read when app is first imported (same defaults as run_tests.py)
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("TESTING", "1")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+# The round-trip and query-plan checks are shared with their scripts
+sys.path.insert(0, str(ROOT / "scripts"))
+
+
+@pytest.fixture(scope="session")
+def postgres_engine():
+    """
+    Engine on the scratch Postgres database in TEST_POSTGRES_URL, with the
+    schema created. Tests using it are skipped when the variable is unset or
+    the server can't be reached; the data they write is not cleaned up.
+
+        TEST_POSTGRES_URL=postgresql://postgres@localhost:5432/taskflow_test python run_tests.py
+    """
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.exc import OperationalError
+
+    import app.domains.api_clients.models  # noqa: F401
+    import app.domains.auth.models  # noqa: F401
+    import app.domains.lists.models  # noqa: F401
+    import app.domains.sync.models  # noqa: F401
+    import app.domains.tasks.models  # noqa: F401
+    from app.db.base import Base
+
+    # psycopg 3, the driver the COPY paths are written for
+    engine = create_engine(make_url(url).set(drivername="postgresql+psycopg"))
+    try:
+        with engine.connect():
+            pass
+    except OperationalError as e:
+        engine.dispose()
+        pytest.skip(f"Postgres at TEST_POSTGRES_URL is unavailable: {e.orig}")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient on the app, with the schema created in DATABASE_URL"""
+    from bench_common import create_schema
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    create_schema()
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Auth headers of a fresh verified user, so no test sees another's data"""
+    from bench_common import seed_user
+
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return seed_user(db)[1]
+    finally:
+        db.close()
@@ -0,0 +1,41 @@
+# tests/test_auth_login.py
+"""Login that rehashes the stored password still issues its token inside the session"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.tokens import token_service
+from app.domains.auth import schemas
+from app.domains.auth.hashing import password_hasher
+from app.domains.auth.models import User
+from app.domains.auth.service import AsyncAuthService
+from app.main import app  # noqa: F401  (registers every mapped model)
+
+
+def test_async_login_with_rehash(tmp_path, monkeypatch):
+    async def verify_and_update(plain_password, hashed_password):
+        return True, "$2b$12$rehashed"
+
+    monkeypatch.setattr(password_hasher, "verify_and_update", verify_and_update)
+
+    async def login():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+        # Default expire_on_commit: the rehash commit expires the user
+        async with async_sessionmaker(engine)() as db:
+            db.add(User(name="Rehash", email="rehash@example.com", hashed_password="$2b$04$old", is_verified=True))
+            await db.commit()
+            token = await AsyncAuthService(db).login_user(
+                schemas.UserLogin(email="rehash@example.com", password="secret-password")
+            )
+            user = await db.get(User, 1)
+        await engine.dispose()
+        return token, user
+
+    token, user = asyncio.run(login())
+
+    assert user.hashed_password == "$2b$12$rehashed"
+    assert token["token_type"] == "bearer"
+    assert token_service.decode(token["access_token"])["sub"] == str(user.id)
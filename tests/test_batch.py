@@ -0,0 +1,75 @@
+# tests/test_batch.py
+"""POST /batch: refused paths, and a failing sub-request leaving the session usable"""
+
+import pytest
+
+from app.api.batch import NOT_BATCHABLE
+from app.domains.lists.models import List
+from app.domains.lists.service import ListsService
+
+
+def run_batch(client, headers, *requests):
+    response = client.post("/api/v1/batch", json={"requests": list(requests)}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["responses"]
+
+
+def test_sub_requests_run_in_order(client, auth_headers):
+    created, listed, missing = run_batch(
+        client, auth_headers,
+        {"method": "POST", "path": "/lists", "body": {"name": "Batched"}},
+        {"method": "GET", "path": "/lists?limit=5"},
+        {"method": "GET", "path": "/nowhere"},
+    )
+
+    assert created["status"] == 201
+    assert listed["status"] == 200
+    assert [item["id"] for item in listed["body"]["items"]] == [created["body"]["id"]]
+    assert missing["status"] == 404
+
+
+@pytest.mark.parametrize("path", sorted(NOT_BATCHABLE))
+def test_not_batchable(client, auth_headers, path):
+    (response,) = run_batch(client, auth_headers, {"method": "GET", "path": path})
+
+    assert response["status"] == 400
+    assert response["body"]["detail"] == f"{path} can't be called in a batch"
+
+
+@pytest.mark.parametrize("path", ["/batch/", "//batch", "/lists/../batch", "/%62atch", "/batch?x=1"])
+def test_nested_batch_in_disguise(client, auth_headers, path):
+    (response,) = run_batch(client, auth_headers, {"method": "POST", "path": path, "body": {"requests": []}})
+
+    assert response["status"] == 400
+    assert response["body"]["detail"] == "/batch can't be called in a batch"
+
+
+@pytest.mark.parametrize("path", ["/lists%2525", "/%252e%252e/batch", "/lists/%25"])
+def test_encoded_percent_is_refused(client, auth_headers, path):
+    (response,) = run_batch(client, auth_headers, {"method": "GET", "path": path})
+
+    assert response["status"] == 400
+    assert response["body"]["detail"] == "Encoded '%' is not allowed in batch paths"
+
+
+def test_failure_rolls_back_and_later_requests_run(client, auth_headers, monkeypatch):
+    def half_written_update(self, list_id, payload, user_id):
+        self.db.add(List(name="Half written", user_id=user_id))
+        self.db.flush()
+        raise RuntimeError("update failed midway")
+
+    monkeypatch.setattr(ListsService, "update_list", half_written_update)
+
+    created, failed, listed = run_batch(
+        client, auth_headers,
+        {"method": "POST", "path": "/lists", "body": {"name": "Kept"}},
+        {"method": "PUT", "path": "/lists/1", "body": {"name": "Never"}},
+        {"method": "GET", "path": "/lists"},
+    )
+
+    assert [created["status"], failed["status"], listed["status"]] == [201, 500, 200]
+    assert failed["body"] == {"detail": "Internal server error"}
+    # What ran before the failure stays; what the failure flushed does not
+    assert [item["name"] for item in listed["body"]["items"]] == ["Kept"]
+    names = [item["name"] for item in client.get("/api/v1/lists", headers=auth_headers).json()["items"]]
+    assert names == ["Kept"]
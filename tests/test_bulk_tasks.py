@@ -0,0 +1,86 @@
+# tests/test_bulk_tasks.py
+"""POST /tasks/bulk: atomic batches and partial failures"""
+
+import pytest
+from bench_common import seed_user
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+
+@pytest.fixture
+def tasks(client, auth_headers):
+    """(list id, [two task ids]) of the test user"""
+    list_id = client.post("/api/v1/lists", json={"name": "Bulk"}, headers=auth_headers).json()["id"]
+    ids = [
+        client.post("/api/v1/tasks", json={"title": title, "list_id": list_id}, headers=auth_headers).json()["id"]
+        for title in ("first", "second")
+    ]
+    return list_id, ids
+
+
+@pytest.fixture
+def foreign_task_id(client):
+    """A task owned by somebody else"""
+    db = SessionLocal()
+    try:
+        headers = seed_user(db)[1]
+    finally:
+        db.close()
+    list_id = client.post("/api/v1/lists", json={"name": "Theirs"}, headers=headers).json()["id"]
+    return client.post("/api/v1/tasks", json={"title": "theirs", "list_id": list_id}, headers=headers).json()["id"]
+
+
+def titles(client, headers, list_id):
+    items = client.get("/api/v1/tasks", params={"list_id": list_id}, headers=headers).json()["items"]
+    return sorted((task["title"], task["completed"]) for task in items)
+
+
+def test_atomic_batch_with_a_failure_writes_nothing(client, auth_headers, tasks, foreign_task_id):
+    list_id, (first, second) = tasks
+
+    response = client.post("/api/v1/tasks/bulk", json={"operations": [
+        {"op": "create", "data": {"title": "new", "list_id": list_id}},
+        {"op": "update", "task_id": first, "data": {"completed": True}},
+        {"op": "delete", "task_id": foreign_task_id},
+    ]}, headers=auth_headers)
+
+    assert response.status_code == 409
+    body = response.json()
+    assert body["committed"] is False
+    assert [result["status"] for result in body["results"]] == [424, 424, 404]
+    assert titles(client, auth_headers, list_id) == [("first", False), ("second", False)]
+
+
+def test_non_atomic_batch_applies_valid_operations(client, auth_headers, tasks, foreign_task_id):
+    list_id, (first, second) = tasks
+
+    response = client.post("/api/v1/tasks/bulk", json={"atomic": False, "operations": [
+        {"op": "create", "data": {"title": "new", "list_id": list_id}},
+        {"op": "update", "task_id": first, "data": {"completed": True}},
+        {"op": "delete", "task_id": first},
+        {"op": "update", "task_id": foreign_task_id, "data": {"title": "mine now"}},
+        {"op": "create", "data": {"title": "elsewhere", "list_id": 0}},
+        {"op": "delete", "task_id": second},
+    ]}, headers=auth_headers)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["committed"] is True
+    results = body["results"]
+    assert [result["index"] for result in results] == list(range(6))
+    assert [result["status"] for result in results] == [201, 200, 409, 404, 404, 200]
+    assert results[0]["task"]["title"] == "new"
+    assert results[1]["task"]["completed"] is True
+    assert results[2]["error"] == "Task appears more than once in the batch"
+    assert titles(client, auth_headers, list_id) == [("first", True), ("new", False)]
+
+
+def test_malformed_batches_are_rejected(client, auth_headers, tasks):
+    list_id, _ = tasks
+    create = {"op": "create", "data": {"title": "many", "list_id": list_id}}
+
+    for operations in ([], [create] * (settings.TASKS_BULK_MAX_OPERATIONS + 1), [{"op": "archive", "task_id": 1}]):
+        response = client.post("/api/v1/tasks/bulk", json={"operations": operations}, headers=auth_headers)
+        assert response.status_code == 422, len(operations)
+    assert titles(client, auth_headers, list_id) == [("first", False), ("second", False)]
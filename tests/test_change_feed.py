@@ -0,0 +1,54 @@
+# tests/test_change_feed.py
+"""ChangeFeed: overflow accounting, and Redis publishes that never block the event loop"""
+
+import asyncio
+
+from app.domains.sync.feed import CHANNEL, RESYNC_FRAME, ChangeFeed, encode_change_frame
+
+
+def payload(change_seq: int) -> dict:
+    return {"user_id": 1, "entity": "task", "action": "updated", "ids": [change_seq], "change_seq": change_seq}
+
+
+def test_events_after_overflow_count_as_dropped():
+    feed = ChangeFeed(enabled=True, queue_size=2, max_streams_per_user=5)
+
+    async def run():
+        subscription = await feed.subscribe(1)
+        for change_seq in range(1, 7):
+            feed._dispatch(1, encode_change_frame(payload(change_seq)))
+        return subscription
+
+    subscription = asyncio.run(run())
+
+    # Two buffered, the third overflows, the other three arrive while overflowed
+    assert feed.dropped == 4
+    assert subscription.take() == RESYNC_FRAME
+    assert subscription.take() == b""
+
+
+class SyncRedis:
+    def publish(self, channel, message):
+        raise AssertionError("blocking publish on the event loop")
+
+
+class AsyncRedis:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def test_publish_on_event_loop_uses_async_client():
+    feed = ChangeFeed(enabled=True, queue_size=2, max_streams_per_user=5)
+    feed._redis, feed._async_redis = SyncRedis(), AsyncRedis()
+
+    async def run():
+        feed.publish(payload(3))
+        await asyncio.gather(*feed._publish_tasks)
+
+    asyncio.run(run())
+
+    assert feed._async_redis.published == [(CHANNEL.format(user_id=1), encode_change_frame(payload(3)))]
+    assert feed.errors == 0
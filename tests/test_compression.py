@@ -0,0 +1,95 @@
+# tests/test_compression.py
+"""CompressionMiddleware: size threshold, negotiation and streamed bodies"""
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+THRESHOLD = 100
+
+compress_app = FastAPI()
+compress_app.add_middleware(CompressionMiddleware, minimum_size=THRESHOLD)
+
+
+@compress_app.get("/json/{size}")
+def json_body(size: int):
+    return Response(content=b"x" * size, media_type="application/json", headers={"ETag": '"v1"'})
+
+
+@compress_app.get("/png")
+def png_body():
+    return Response(content=b"x" * 1000, media_type="image/png")
+
+
+@compress_app.get("/stream/{chunk}")
+def stream_body(chunk: int):
+    return StreamingResponse(iter([b"a" * chunk] * 10), media_type="application/x-ndjson")
+
+
+@compress_app.get("/events")
+def events_body():
+    return StreamingResponse(iter([b"data: x\n\n" * 50]), media_type="text/event-stream")
+
+
+@pytest.fixture
+def client():
+    with TestClient(compress_app) as client:
+        yield client
+
+
+def get(client, path, accept="gzip, br"):
+    return client.get(path, headers={"Accept-Encoding": accept})
+
+
+@pytest.mark.parametrize("size,encoded", [(0, False), (THRESHOLD - 1, False), (THRESHOLD, True), (5000, True)])
+def test_threshold(client, size, encoded):
+    response = get(client, f"/json/{size}", "gzip")
+
+    assert response.content == b"x" * size
+    assert response.headers["Vary"] == "Accept-Encoding"
+    if encoded:
+        assert response.headers["Content-Encoding"] == "gzip"
+        # Compressed length, and the validator weakened for the new representation
+        assert int(response.headers["Content-Length"]) < size
+        assert response.headers["ETag"] == 'W/"v1"'
+    else:
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Content-Length"] == str(size)
+        assert response.headers["ETag"] == '"v1"'
+
+
+def test_brotli_preferred(client):
+    assert get(client, "/json/500").headers["Content-Encoding"] == "br"
+    assert get(client, "/json/500", "br;q=0.5, gzip").headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in get(client, "/json/500", "identity").headers
+
+
+def test_non_textual_and_event_streams_pass_through(client):
+    assert "Content-Encoding" not in get(client, "/png").headers
+    assert "Content-Encoding" not in get(client, "/events").headers
+
+
+@pytest.mark.parametrize("chunk", [7, 40, 500])
+def test_streamed_body(client, chunk):
+    response = get(client, f"/stream/{chunk}", "gzip")
+
+    # 70 bytes in total stay under the threshold and go out as they are
+    assert response.content == b"a" * chunk * 10
+    assert ("Content-Encoding" in response.headers) == (chunk * 10 >= THRESHOLD)
+    assert "Content-Length" not in response.headers
+
+
+@pytest.mark.parametrize("header,available,expected", [
+    ("gzip, deflate, br", True, "br"),
+    ("gzip, deflate, br", False, "gzip"),
+    ("br;q=0, gzip;q=0.1", True, "gzip"),
+    ("*", True, "br"),
+    ("*;q=0, gzip", True, "gzip"),
+    ("gzip;q=bogus", True, None),
+    ("", True, None),
+])
+def test_negotiate_encoding(header, available, expected):
+    assert negotiate_encoding(header, available) == expected
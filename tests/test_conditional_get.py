@@ -0,0 +1,79 @@
+# tests/test_conditional_get.py
+"""Weak ETags and If-None-Match on list and task reads, and their invalidation by writes"""
+
+import pytest
+from bench_common import seed_user
+
+from app.core.http_cache import PRIVATE_REVALIDATE
+from app.db.session import SessionLocal
+
+
+@pytest.fixture
+def list_id(client, auth_headers):
+    list_id = client.post("/api/v1/lists", json={"name": "Cached"}, headers=auth_headers).json()["id"]
+    client.post("/api/v1/tasks", json={"title": "one", "list_id": list_id}, headers=auth_headers)
+    return list_id
+
+
+def revalidate(client, headers, path, params, etag):
+    return client.get(path, params=params, headers={**headers, "If-None-Match": etag})
+
+
+@pytest.mark.parametrize("path,query", [("/api/v1/lists", False), ("/api/v1/tasks", True)])
+def test_unchanged_collection_is_not_modified(client, auth_headers, list_id, path, query):
+    params = {"list_id": list_id} if query else {}
+    first = client.get(path, params=params, headers=auth_headers)
+    etag = first.headers["ETag"]
+
+    again = revalidate(client, auth_headers, path, params, etag)
+
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == PRIVATE_REVALIDATE
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+    # Weak comparison: the strong form, among others, matches too
+    assert revalidate(client, auth_headers, path, params, f'"other", {etag[2:]}').status_code == 304
+    # Other page parameters are another representation
+    assert revalidate(client, auth_headers, path, {**params, "limit": 1}, etag).status_code == 200
+
+
+@pytest.mark.parametrize("write", ["create", "update", "delete"])
+def test_task_writes_invalidate_the_tasks_etag(client, auth_headers, list_id, write):
+    params = {"list_id": list_id}
+    before = client.get("/api/v1/tasks", params=params, headers=auth_headers)
+    task_id = before.json()["items"][0]["id"]
+
+    if write == "create":
+        client.post("/api/v1/tasks", json={"title": "two", "list_id": list_id}, headers=auth_headers)
+    elif write == "update":
+        client.put(f"/api/v1/tasks/{task_id}", json={"completed": True}, headers=auth_headers)
+    else:
+        client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    after = revalidate(client, auth_headers, "/api/v1/tasks", params, before.headers["ETag"])
+
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert after.json() != before.json()
+
+
+def test_list_write_invalidates_the_lists_etag(client, auth_headers, list_id):
+    before = client.get("/api/v1/lists", headers=auth_headers)
+
+    client.put(f"/api/v1/lists/{list_id}", json={"name": "Renamed"}, headers=auth_headers)
+    after = revalidate(client, auth_headers, "/api/v1/lists", {}, before.headers["ETag"])
+
+    assert after.status_code == 200
+    assert after.json()["items"][0]["name"] == "Renamed"
+
+
+def test_foreign_list_is_not_found_before_etag_check(client, auth_headers, list_id):
+    db = SessionLocal()
+    try:
+        stranger = seed_user(db)[1]
+    finally:
+        db.close()
+
+    response = revalidate(client, stranger, "/api/v1/tasks", {"list_id": list_id}, "*")
+
+    assert response.status_code == 404
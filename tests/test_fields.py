@@ -0,0 +1,74 @@
+# tests/test_fields.py
+"""?fields= sparse fieldsets: validation, narrowing and cache keys"""
+
+import pytest
+
+from app.core.fields import parse_fields
+from app.domains.lists.schemas import ListResponse
+from app.domains.tasks.schemas import TaskResponse
+
+
+@pytest.fixture
+def ids(client, auth_headers):
+    """(list id, task id) with one completed task"""
+    list_id = client.post("/api/v1/lists", json={"name": "Sparse", "description": "long text"}, headers=auth_headers).json()["id"]
+    task_id = client.post("/api/v1/tasks", json={"title": "narrow", "list_id": list_id}, headers=auth_headers).json()["id"]
+    client.put(f"/api/v1/tasks/{task_id}", json={"completed": True}, headers=auth_headers)
+    return list_id, task_id
+
+
+def get(client, headers, path, **params):
+    response = client.get(path, params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_task_reads_are_narrowed(client, auth_headers, ids):
+    list_id, task_id = ids
+
+    page = get(client, auth_headers, "/api/v1/tasks", list_id=list_id, fields="title,completed").json()
+    single = get(client, auth_headers, f"/api/v1/tasks/{task_id}", fields="due_date").json()
+
+    assert page["items"] == [{"id": task_id, "title": "narrow", "completed": True}]
+    assert page["meta"]["has_next"] is False
+    assert single == {"id": task_id, "due_date": None}
+
+
+def test_list_reads_are_narrowed(client, auth_headers, ids):
+    list_id, _ = ids
+
+    names = get(client, auth_headers, "/api/v1/lists", fields="name").json()["items"]
+    counts = get(client, auth_headers, f"/api/v1/lists/{list_id}", fields="completed_count").json()
+
+    assert names == [{"id": list_id, "name": "Sparse"}]
+    assert counts == {"id": list_id, "completed_count": 1}
+
+
+@pytest.mark.parametrize("path", ["/api/v1/lists", "/api/v1/tasks"])
+def test_unknown_fields_are_rejected(client, auth_headers, ids, path):
+    response = client.get(path, params={"list_id": ids[0], "fields": "id,secret,hashed_password"}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: hashed_password, secret"
+
+
+def test_spellings_of_one_field_set_share_the_etag(client, auth_headers, ids):
+    list_id, _ = ids
+
+    def etag(fields=None):
+        params = {"list_id": list_id, **({"fields": fields} if fields is not None else {})}
+        return get(client, auth_headers, "/api/v1/tasks", **params).headers["ETag"]
+
+    assert etag("title,id") == etag(" title , ,title") == etag("id,title")
+    assert etag(",".join(TaskResponse.model_fields)) == etag()
+    assert etag("title") != etag()
+
+
+@pytest.mark.parametrize("raw,expected", [
+    (None, None),
+    ("", ("id",)),
+    ("updated_at,name", ("id", "name", "updated_at")),
+    ("id,name,color,description,user_id,task_count,completed_count,created_at,updated_at", None),
+])
+def test_parse_fields(raw, expected):
+    assert parse_fields(raw, ListResponse) == expected
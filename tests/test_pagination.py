@@ -0,0 +1,80 @@
+# tests/test_pagination.py
+"""Keyset cursors on GET /tasks and GET /lists: next/prev walks and ties"""
+
+import pytest
+
+TASKS = [
+    # Ties on every key but id, and NULL due dates that sort last
+    {"title": "a", "due_date": "2026-03-01", "priority": "high"},
+    {"title": "b", "due_date": None, "priority": "medium"},
+    {"title": "c", "due_date": "2026-03-01", "priority": "high"},
+    {"title": "d", "due_date": None, "priority": "medium"},
+    {"title": "e", "due_date": "2026-01-15", "priority": "low"},
+    {"title": "f", "due_date": None, "priority": "high"},
+    {"title": "g", "due_date": "2026-03-01", "priority": "high"},
+]
+
+
+def walk(client, headers, path, query, limit, direction="next", cursor=None):
+    """Pages of ids from ``cursor``, following ``direction`` cursors to the end; also the last meta"""
+    pages = []
+    while True:
+        params = {**query, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(path, params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        pages.append([item["id"] for item in body["items"]])
+        cursor = body["meta"][f"{direction}_cursor"]
+        if not cursor:
+            return pages, body["meta"]
+
+
+@pytest.fixture
+def task_query(client, auth_headers):
+    list_id = client.post("/api/v1/lists", json={"name": "Paging"}, headers=auth_headers).json()["id"]
+    for task in TASKS:
+        response = client.post("/api/v1/tasks", json={**task, "list_id": list_id}, headers=auth_headers)
+        assert response.status_code == 201, response.text
+    return {"list_id": list_id}
+
+
+def test_task_pages_cover_every_task_once(client, auth_headers, task_query):
+    everything = client.get("/api/v1/tasks", params=task_query, headers=auth_headers).json()["items"]
+    order = [task["id"] for task in everything]
+
+    assert len(order) == len(TASKS)
+    # NULL due dates last, whatever their priority
+    assert [task["due_date"] for task in everything][-3:] == [None, None, None]
+    for limit in (1, 2, 3, 4):
+        pages, _ = walk(client, auth_headers, "/api/v1/tasks", task_query, limit)
+        assert [task_id for page in pages for task_id in page] == order, limit
+
+
+def test_task_prev_cursor_returns_same_pages(client, auth_headers, task_query):
+    forward, last = walk(client, auth_headers, "/api/v1/tasks", task_query, 2)
+    assert last["has_next"] is False
+
+    # From the last page back to the first, across the NULL due dates and ties
+    backward, meta = walk(client, auth_headers, "/api/v1/tasks", task_query, 2, "prev", last["prev_cursor"])
+
+    assert backward == forward[-2::-1]
+    assert meta["has_prev"] is False
+
+
+def test_list_pages_newest_first(client, auth_headers):
+    ids = [
+        client.post("/api/v1/lists", json={"name": f"List {n}"}, headers=auth_headers).json()["id"]
+        for n in range(5)
+    ]
+
+    pages, _ = walk(client, auth_headers, "/api/v1/lists", {}, 2)
+
+    assert [list_id for page in pages for list_id in page] == sorted(ids, reverse=True)
+    assert [len(page) for page in pages] == [2, 2, 1]
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers, task_query):
+    response = client.get("/api/v1/tasks", params={**task_query, "cursor": "not-a-cursor"}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
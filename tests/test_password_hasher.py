@@ -0,0 +1,37 @@
+# tests/test_password_hasher.py
+"""PasswordHasher: pool workers follow work factor changes made after they started"""
+
+import asyncio
+
+import pytest
+
+from app.domains.auth.hashing import PasswordHasher, configure_rounds, pwd_context
+
+
+@pytest.fixture
+def restore_rounds():
+    saved = pwd_context.to_dict()
+    yield
+    pwd_context.load(saved)
+
+
+@pytest.mark.slow
+def test_pool_uses_rounds_configured_after_start(restore_rounds):
+    hasher = PasswordHasher(workers=1, max_pending=4)
+
+    async def run():
+        configure_rounds(4)
+        first = await hasher.hash("secret-password")
+        # e.g. BCRYPT_ROUNDS=0: calibration settles the cost once the pool is up
+        configure_rounds(5)
+        second = await hasher.hash("secret-password")
+        return first, second, await hasher.verify_and_update("secret-password", first)
+
+    try:
+        first, second, (valid, new_hash) = asyncio.run(run())
+    finally:
+        hasher.shutdown()
+
+    assert first.startswith("$2b$04$")
+    assert second.startswith("$2b$05$")
+    assert valid and new_hash.startswith("$2b$05$")
@@ -0,0 +1,42 @@
+# tests/test_query_plans.py
+"""No sequential scans on large tables in the service read paths (see scripts/check_query_plans.py)"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from check_query_plans import check_plans, seed
+
+from app.db.base import Base
+
+# Enough rows for every read path to have data; Postgres has seq scans priced out
+USERS = 50
+LISTS_PER_USER = 5
+TASKS_PER_LIST = 20
+
+
+@pytest.fixture(scope="module", params=["sqlite", pytest.param("postgresql", marks=pytest.mark.integration)])
+def seeded(request, tmp_path_factory):
+    """(session, engine) on a seeded database: a throwaway SQLite file, or TEST_POSTGRES_URL"""
+    if request.param == "postgresql":
+        target = request.getfixturevalue("postgres_engine")
+    else:
+        # Not DATABASE_URL: the seed is committed (ANALYZE has to see it) and would pile up there
+        target = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+        Base.metadata.create_all(target)
+    db = Session(bind=target)
+    try:
+        seed(db, USERS, LISTS_PER_USER, TASKS_PER_LIST)
+        yield db, target
+    finally:
+        db.close()
+        if request.param == "sqlite":
+            target.dispose()
+
+
+def test_no_sequential_scans(seeded):
+    db, target = seeded
+
+    scans = [(name, tables) for name, _, tables in check_plans(db, target) if tables]
+
+    assert not scans, "\n".join(f"{name}: SEQ SCAN on {', '.join(tables)}" for name, tables in scans)
@@ -0,0 +1,59 @@
+# tests/test_replica_pin.py
+"""ReplicaPinMiddleware: the pin a write earned reaches every kind of response"""
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.middleware.replica_pin import ReplicaPinMiddleware
+from app.db.routing import PIN_COOKIE, PIN_HEADER, set_pin
+
+pin_app = FastAPI()
+pin_app.add_middleware(ReplicaPinMiddleware)
+
+
+@pin_app.post("/model")
+def returns_model(request: Request):
+    set_pin(request)
+    return {"ok": True}
+
+
+@pin_app.post("/response")
+def returns_response(request: Request):
+    set_pin(request)
+    return Response(content=b"{}", media_type="application/json")
+
+
+@pin_app.post("/stream")
+def returns_stream(request: Request):
+    set_pin(request)
+    return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+
+
+@pin_app.get("/read")
+def read():
+    return {"ok": True}
+
+
+@pytest.fixture
+def client():
+    with TestClient(pin_app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("path", ["/model", "/response", "/stream"])
+def test_write_pins_any_response(client, path):
+    response = client.post(path)
+
+    until = response.headers[PIN_HEADER]
+    assert client.cookies[PIN_COOKIE] == until
+    cookie = response.headers["set-cookie"]
+    assert "HttpOnly" in cookie and "SameSite=lax" in cookie and "Path=/" in cookie
+
+
+def test_read_sets_no_pin(client):
+    response = client.get("/read")
+
+    assert PIN_HEADER not in response.headers
+    assert "set-cookie" not in response.headers
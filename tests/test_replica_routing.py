@@ -0,0 +1,75 @@
+# tests/test_replica_routing.py
+"""RoutingSession replica choice, and the response cache building shared bodies on the primary"""
+
+import asyncio
+
+from pydantic import BaseModel
+from sqlalchemy import create_engine, select, text
+from starlette.requests import Request
+
+from app.core.response_cache import ResponseCache
+from app.db.routing import RoutingSession, replica_reads
+
+
+class Body(BaseModel):
+    ok: bool
+
+
+def make_session():
+    primary = create_engine("sqlite://")
+    replicas = [create_engine("sqlite://") for _ in range(8)]
+    return RoutingSession(bind=primary, replicas=replicas), primary, replicas
+
+
+def test_session_keeps_its_replica():
+    db, _, replicas = make_session()
+
+    with replica_reads(db):
+        binds = {db.get_bind(clause=select(text("1"))) for _ in range(50)}
+
+    assert len(binds) == 1
+    assert binds.pop() in replicas
+
+
+def test_pinned_session_reads_primary():
+    db, primary, _ = make_session()
+    db.info["pinned"] = True
+
+    with replica_reads(db):
+        assert db.get_bind(clause=select(text("1"))) is primary
+
+
+def test_shared_entry_is_built_on_primary(monkeypatch):
+    cache = ResponseCache(enabled=True, ttl_seconds=60, max_entries=10)
+    stored = {}
+
+    async def generation(user_id):
+        return b"7"
+
+    async def get(key, shared):
+        return stored.get(key)
+
+    async def set_(key, body, shared):
+        stored[key] = body
+
+    monkeypatch.setattr(cache, "_generation", generation)
+    monkeypatch.setattr(cache, "_get", get)
+    monkeypatch.setattr(cache, "_set", set_)
+
+    db, primary, _ = make_session()
+    built_on = []
+
+    async def build():
+        with replica_reads(db):
+            built_on.append(db.get_bind(clause=select(text("1"))))
+        return Body(ok=True)
+
+    async def version():
+        raise AssertionError("a generation needs no validator query")
+
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    response = asyncio.run(cache.respond(request, db, 1, "route", (), version, build, "private"))
+
+    assert response.status_code == 200
+    assert built_on == [primary]
+    assert len(stored) == 1
@@ -0,0 +1,62 @@
+# tests/test_response_cache.py
+"""ResponseCache generation bumps: an async write responds once its bump is applied"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.response_cache import GENERATION_KEY, response_cache
+from app.db.base import Base
+from app.domains.auth.models import User
+from app.domains.lists import schemas
+from app.domains.lists.service import AsyncListsService
+from app.main import app  # noqa: F401  (registers every mapped model)
+
+
+class SlowPipeline:
+    def __init__(self, store):
+        self.store = store
+        self.keys = []
+
+    def incr(self, key):
+        self.keys.append(key)
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        # Long enough that a fire-and-forget bump is still in flight at return
+        await asyncio.sleep(0.05)
+        for key in self.keys:
+            self.store[key] = self.store.get(key, 0) + 1
+
+
+class AsyncRedis:
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self):
+        return SlowPipeline(self.store)
+
+
+def test_async_write_returns_after_bump(tmp_path, monkeypatch):
+    redis = AsyncRedis()
+    # Only the on-loop path runs; the sync client is never used
+    monkeypatch.setattr(response_cache, "_redis", object())
+    monkeypatch.setattr(response_cache, "_async_redis", redis)
+
+    async def write():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            db.add(User(id=1, name="Writer", email="writer@example.com", hashed_password="x", is_verified=True))
+            await db.commit()
+            await AsyncListsService(db).create_list(schemas.ListCreate(name="Errands"), 1)
+            # Checked before anything else gets to run on the loop
+            generation = redis.store.get(GENERATION_KEY.format(user_id=1))
+        await engine.dispose()
+        return generation
+
+    assert asyncio.run(write()) == 1
+    assert 1 not in response_cache._pending
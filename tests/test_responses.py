@@ -0,0 +1,28 @@
+# tests/test_responses.py
+"""Response classes: model routes keep FastAPI's pydantic-core fast path"""
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+
+from app.api.internal import router as internal_router
+from app.core.responses import ORJSONResponse
+from app.main import app
+
+
+def test_model_routes_keep_default_response_class():
+    # An explicit response class, even as the app default, turns off dump_json
+    explicit = [
+        route.path for route in app.routes
+        if isinstance(route, APIRoute) and route.response_model is not None
+        and not isinstance(route.response_class, DefaultPlaceholder)
+    ]
+
+    assert explicit == []
+
+
+def test_internal_routes_render_with_orjson():
+    # Mounted only with INTERNAL_ENDPOINTS_ENABLED
+    internal = [route for route in internal_router.routes if isinstance(route, APIRoute)]
+
+    assert internal
+    assert all(route.response_class is ORJSONResponse for route in internal)
@@ -0,0 +1,28 @@
+# tests/test_round_trips.py
+"""Per-endpoint database round-trip budgets (see scripts/check_round_trips.py)"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from check_round_trips import ENDPOINTS, measure, seed_list
+
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def session():
+    """(client, auth headers, list id), with the principal cache warm as on any request after a user's first"""
+    headers, list_id = seed_list()
+    with TestClient(app) as client:
+        client.get("/api/v1/auth/me", headers=headers)
+        yield client, headers, list_id
+
+
+@pytest.mark.parametrize("name,method,path,body,budget", ENDPOINTS, ids=[endpoint[0] for endpoint in ENDPOINTS])
+def test_within_round_trip_budget(session, name, method, path, body, budget):
+    client, headers, list_id = session
+
+    response, count = measure(client, headers, list_id, method, path, body)
+
+    assert response.status_code == 404 if name.endswith("(404)") else response.is_success, response.text
+    assert count <= budget, f"{name}: {count} round trips, budget {budget}"
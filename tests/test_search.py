@@ -0,0 +1,101 @@
+# tests/test_search.py
+"""Task search: HTML-safe headlines, and keyset paging on Postgres full-text ranks"""
+
+import uuid
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.domains.auth.models import User
+from app.domains.lists.models import List
+from app.domains.tasks.models import Task
+from app.domains.tasks.service import TasksService
+
+
+MARKUP_TITLE = '<b>milk</b> & "eggs"'
+MARKUP_HEADLINE = '&lt;b&gt;<mark>milk</mark>&lt;/b&gt; &amp; &quot;eggs&quot;'
+# Highlight placeholders typed into a task must not turn into tags
+SENTINEL_TITLE = "fake \ue000bold\ue001 milk"
+SENTINEL_HEADLINE = "fake bold <mark>milk</mark>"
+
+
+def walk(service: TasksService, user_id: int, q: str, limit: int) -> list:
+    """Ids of every hit, following next cursors"""
+    ids, cursor = [], None
+    while True:
+        page = service.search_tasks(user_id, q, limit, cursor)
+        ids.extend(item.id for item in page.items)
+        cursor = page.meta.next_cursor
+        if not cursor:
+            return ids
+
+
+def test_headlines_are_escaped(client, auth_headers):
+    list_id = client.post("/api/v1/lists", json={"name": "Markup"}, headers=auth_headers).json()["id"]
+    for title in (MARKUP_TITLE, SENTINEL_TITLE):
+        client.post("/api/v1/tasks", json={"title": title, "list_id": list_id}, headers=auth_headers)
+
+    response = client.get("/api/v1/tasks/search", params={"q": "milk"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    headlines = {item["title"]: item["headline"] for item in response.json()["items"]}
+    assert headlines == {MARKUP_TITLE: MARKUP_HEADLINE, SENTINEL_TITLE: SENTINEL_HEADLINE}
+
+
+@pytest.mark.integration
+def test_postgres_headlines_are_escaped(postgres_engine):
+    with postgres_engine.connect() as conn:
+        db = Session(bind=conn)
+        user = User(name="Escaper", email=f"escape-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        list_obj = List(name="Markup", user_id=user.id)
+        db.add(list_obj)
+        db.flush()
+        db.add_all([Task(title=title, list_id=list_obj.id, change_seq=0) for title in (MARKUP_TITLE, SENTINEL_TITLE)])
+        db.commit()
+
+        page = TasksService(db).search_tasks(user.id, "milk", 10)
+
+        # ts_headline drops what its parser takes for tags; whatever is left is escaped
+        headlines = {item.title: item.headline for item in page.items}
+        assert headlines[SENTINEL_TITLE] == SENTINEL_HEADLINE
+        text = headlines[MARKUP_TITLE].replace("<mark>milk</mark>", "milk", 1)
+        assert "<mark>" in headlines[MARKUP_TITLE] and not set(text) & set('<>"')
+        db.close()
+
+
+@pytest.mark.integration
+def test_postgres_paging_through_tied_ranks(postgres_engine):
+    with postgres_engine.connect() as conn:
+        db = Session(bind=conn)
+        user = User(name="Searcher", email=f"search-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        list_obj = List(name="Groceries", user_id=user.id)
+        db.add(list_obj)
+        db.flush()
+        # Groups of identical text rank the same; ts_rank values are not round numbers
+        texts = [
+            ("buy oat milk", "from the corner shop"),
+            ("milk", "milk milk, whole milk and skimmed milk"),
+            ("call about the milk delivery", None),
+        ]
+        ids = db.execute(insert(Task).returning(Task.id), [
+            {"title": title, "description": description, "list_id": list_obj.id, "change_seq": 0}
+            for title, description in texts for _ in range(7)
+        ]).scalars().all()
+        db.commit()
+
+        service = TasksService(db)
+        assert sorted(walk(service, user.id, "milk", 50)) == sorted(ids)
+        for limit in (1, 2, 3, 4, 5):
+            assert walk(service, user.id, "milk", limit) == walk(service, user.id, "milk", 50), limit
+
+        # Back again through the previous cursors
+        page = service.search_tasks(user.id, "milk", 4)
+        second = service.search_tasks(user.id, "milk", 4, page.meta.next_cursor)
+        back = service.search_tasks(user.id, "milk", 4, second.meta.prev_cursor)
+        assert [item.id for item in back.items] == [item.id for item in page.items]
+        db.close()
@@ -0,0 +1,94 @@
+# tests/test_sync.py
+"""GET /sync: watermark tokens, paging and delete tombstones"""
+
+from app.domains.sync.service import encode_sync_token
+
+
+def sync(client, headers, since=None, **params):
+    response = client.get("/api/v1/sync", params={**({"since": since} if since else {}), **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def create_list(client, headers, name="Synced"):
+    return client.post("/api/v1/lists", json={"name": name}, headers=headers).json()["id"]
+
+
+def create_task(client, headers, list_id, title):
+    return client.post("/api/v1/tasks", json={"title": title, "list_id": list_id}, headers=headers).json()["id"]
+
+
+def test_full_then_idle_sync(client, auth_headers):
+    list_id = create_list(client, auth_headers)
+    task_ids = [create_task(client, auth_headers, list_id, title) for title in ("one", "two")]
+
+    full = sync(client, auth_headers)
+    idle = sync(client, auth_headers, full["next_token"])
+
+    assert [item["id"] for item in full["lists"]] == [list_id]
+    assert [item["id"] for item in full["tasks"]] == task_ids
+    assert full["has_more"] is False
+    assert idle == {
+        "lists": [], "tasks": [], "deleted_list_ids": [], "deleted_task_ids": [],
+        "next_token": full["next_token"], "has_more": False,
+    }
+
+
+def test_changes_and_tombstones_since_token(client, auth_headers):
+    kept = create_list(client, auth_headers, "Kept")
+    dropped = create_list(client, auth_headers, "Dropped")
+    changed, deleted = (create_task(client, auth_headers, kept, title) for title in ("changed", "deleted"))
+    create_task(client, auth_headers, dropped, "goes with its list")
+    token = sync(client, auth_headers)["next_token"]
+
+    client.put(f"/api/v1/tasks/{changed}", json={"completed": True}, headers=auth_headers)
+    client.delete(f"/api/v1/tasks/{deleted}", headers=auth_headers)
+    client.delete(f"/api/v1/lists/{dropped}", headers=auth_headers)
+    delta = sync(client, auth_headers, token)
+
+    assert delta["lists"] == []
+    assert [(item["id"], item["completed"]) for item in delta["tasks"]] == [(changed, True)]
+    assert delta["deleted_task_ids"] == [deleted]
+    # The list's tombstone stands for its tasks
+    assert delta["deleted_list_ids"] == [dropped]
+    assert delta["next_token"] != token
+
+
+def test_created_then_deleted_is_only_a_tombstone(client, auth_headers):
+    list_id = create_list(client, auth_headers)
+    token = sync(client, auth_headers)["next_token"]
+
+    task_id = create_task(client, auth_headers, list_id, "short-lived")
+    client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    delta = sync(client, auth_headers, token)
+
+    assert delta["tasks"] == []
+    assert delta["deleted_task_ids"] == [task_id]
+
+
+def test_paging_with_limit(client, auth_headers):
+    list_id = create_list(client, auth_headers)
+    task_ids = [create_task(client, auth_headers, list_id, f"task {n}") for n in range(4)]
+    client.delete(f"/api/v1/tasks/{task_ids[0]}", headers=auth_headers)
+
+    pages, token = [], None
+    while True:
+        page = sync(client, auth_headers, token, limit=2)
+        pages.append(page)
+        token = page["next_token"]
+        if not page["has_more"]:
+            break
+
+    assert [page["has_more"] for page in pages] == [True, True, False]
+    assert [list_id] == [item["id"] for page in pages for item in page["lists"]]
+    assert [item["id"] for page in pages for item in page["tasks"]] == task_ids[1:]
+    assert [task_id for page in pages for task_id in page["deleted_task_ids"]] == [task_ids[0]]
+    assert sync(client, auth_headers, token)["tasks"] == []
+
+
+def test_bad_and_future_tokens(client, auth_headers):
+    invalid = client.get("/api/v1/sync", params={"since": "garbage!"}, headers=auth_headers)
+    ahead = client.get("/api/v1/sync", params={"since": encode_sync_token(10 ** 9)}, headers=auth_headers)
+
+    assert invalid.status_code == 400
+    assert ahead.status_code == 410
@@ -0,0 +1,159 @@
+# tests/test_task_import.py
+"""
+The Postgres COPY path of the task importer: rows COPYed into the
+per-transaction staging table, moved into tasks with one INSERT ... SELECT.
+"""
+
+import json
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.domains.auth.models import User
+from app.domains.lists.models import List
+from app.domains.tasks import importer
+from app.domains.tasks.models import Task
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def connection(postgres_engine):
+    """One connection for the import and the checks after it: temp tables are per connection"""
+    with postgres_engine.connect() as conn:
+        yield conn
+
+
+@pytest.fixture
+def lists(connection):
+    """(user id, two lists of that user, a list of another user)"""
+    db = Session(bind=connection)
+    owner, other = (
+        User(name="Importer", email=f"import-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x")
+        for _ in range(2)
+    )
+    db.add_all([owner, other])
+    db.flush()
+    owned = [List(name="Mine", user_id=owner.id), List(name="Also mine", user_id=owner.id)]
+    foreign = List(name="Not mine", user_id=other.id)
+    db.add_all([*owned, foreign])
+    db.commit()
+    ids = owner.id, [list_obj.id for list_obj in owned], foreign.id
+    db.close()
+    return ids
+
+
+@pytest.fixture
+def run_import(connection, monkeypatch):
+    """run_task_import on ``connection``, two rows per batch so several COPYs go to one staging table"""
+    monkeypatch.setattr(importer, "SessionLocal", sessionmaker(bind=connection))
+    monkeypatch.setattr(settings, "TASKS_IMPORT_BATCH_SIZE", 2)
+
+    def run(user_id, import_format, chunks):
+        # End the checks' read transaction, so the import's session begins and commits its own
+        connection.commit()
+        return importer.run_task_import(user_id, import_format, iter(chunks))
+    return run
+
+
+def ndjson(*rows) -> bytes:
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+def staging_table_exists(connection) -> bool:
+    name = f"pg_temp.{importer.TASK_IMPORT_STAGING.name}"
+    return connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None
+
+
+def task_counts(connection, list_ids) -> dict:
+    rows = connection.execute(
+        select(Task.list_id, func.count()).where(Task.list_id.in_(list_ids)).group_by(Task.list_id)
+    ).all()
+    return {list_id: rows_count for list_id, rows_count in rows}
+
+
+def test_copy_path_is_used(connection):
+    assert importer.TaskImporter(Session(bind=connection), 0).use_copy
+
+
+def test_ndjson_import_loads_owned_rows(connection, lists, run_import):
+    user_id, (first, second), foreign = lists
+    seq_before = connection.execute(select(User.change_seq).where(User.id == user_id)).scalar_one()
+
+    result = run_import(user_id, "ndjson", [ndjson(
+        {"title": "One", "list_id": first, "priority": "high", "due_date": "2030-01-02"},
+        {"title": "Two", "list_id": second, "description": "tab\there, newline\nhere, \\N"},
+        {"list_id": first},
+        {"title": "Foreign", "list_id": foreign},
+        {"title": "Three", "list_id": first},
+    )])
+
+    assert result.imported == 3
+    assert result.failed == 2
+    assert [error.line for error in result.errors] == [3, 4]
+    assert result.errors[1].error == f"list_id: List {foreign} not found or access denied"
+    assert task_counts(connection, [first, second, foreign]) == {first: 2, second: 1}
+
+    # COPY text format escapes survive the round trip
+    description = connection.execute(select(Task.description).where(Task.list_id == second)).scalar_one()
+    assert description == "tab\there, newline\nhere, \\N"
+
+    # One change sequence number per imported row, none shared
+    seqs = connection.execute(
+        select(Task.change_seq).where(Task.list_id.in_([first, second])).order_by(Task.change_seq)
+    ).scalars().all()
+    assert seqs == list(range(seq_before + 1, seq_before + 4))
+
+
+def test_csv_import_loads_owned_rows(connection, lists, run_import):
+    user_id, (first, _), foreign = lists
+    body = (
+        "id,title,list_id,priority,due_date\n"
+        f"1,Exported,{first},low,\n"
+        f"2,Foreign,{foreign},,\n"
+        f"3,Also exported,{first},,2030-01-02\n"
+    ).encode()
+
+    result = run_import(user_id, "csv", [body])
+
+    assert (result.imported, result.failed) == (2, 1)
+    assert [error.line for error in result.errors] == [3]
+    assert task_counts(connection, [first, foreign]) == {first: 2}
+
+
+def test_staging_table_dropped_on_commit(connection, lists, run_import):
+    user_id, (first, _), _ = lists
+
+    for _ in range(2):
+        # A second import on the same connection recreates the table
+        result = run_import(user_id, "ndjson", [ndjson(*({"title": "Row", "list_id": first} for _ in range(3)))])
+        assert result.imported == 3
+        assert not staging_table_exists(connection)
+    assert task_counts(connection, [first]) == {first: 6}
+
+
+def test_only_foreign_rows_imports_nothing(connection, lists, run_import):
+    user_id, (first, _), foreign = lists
+
+    result = run_import(user_id, "ndjson", [ndjson({"title": "Foreign", "list_id": foreign})])
+
+    assert (result.imported, result.failed) == (0, 1)
+    assert task_counts(connection, [first, foreign]) == {}
+    assert not staging_table_exists(connection)
+
+
+def test_malformed_upload_loads_nothing(connection, lists, run_import):
+    user_id, (first, _), _ = lists
+    # The first batch is COPYed before the bad bytes arrive
+    chunks = [ndjson(*({"title": "Row", "list_id": first} for _ in range(3))), b"\xff\n"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        run_import(user_id, "ndjson", chunks)
+
+    assert exc_info.value.status_code == 400
+    assert task_counts(connection, [first]) == {}
+    assert not staging_table_exists(connection)
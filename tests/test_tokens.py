@@ -0,0 +1,61 @@
+# tests/test_tokens.py
+"""TokenService: cached verification still honours exp"""
+
+import time
+from datetime import timedelta
+
+import pytest
+from jose import JWTError
+from jose.exceptions import ExpiredSignatureError
+
+from app.core import tokens
+from app.core.tokens import TokenService
+
+
+@pytest.fixture
+def service():
+    return TokenService(secret_key="test-secret", algorithm="HS256", expire_minutes=5, cache_size=2)
+
+
+def test_cached_token_expires(service, monkeypatch):
+    token = service.create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=30))
+
+    assert service.decode(token)["sub"] == "1"
+    assert service.decode(token)["sub"] == "1"
+    assert (service.hits, service.misses) == (1, 1)
+
+    # A minute later the cached entry is past its exp
+    now = time.time() + 60
+    monkeypatch.setattr(tokens.time, "time", lambda: now)
+    with pytest.raises(ExpiredSignatureError):
+        service.decode(token)
+    assert service.stats()["size"] == 0
+
+
+def test_hit_returns_a_copy(service):
+    token = service.create_access_token({"sub": "1"})
+
+    service.decode(token)["sub"] = "2"
+
+    assert service.decode(token)["sub"] == "1"
+
+
+def test_invalid_tokens_are_not_cached(service):
+    token = service.create_access_token({"sub": "1"})
+    forged = TokenService("other-secret", "HS256", 5, 2).create_access_token({"sub": "1"})
+
+    for bad in (forged, token[:-2] + ("AA" if not token.endswith("AA") else "BB")):
+        with pytest.raises(JWTError):
+            service.decode(bad)
+    assert service.stats()["size"] == 0
+
+
+def test_cache_is_bounded(service):
+    issued = [service.create_access_token({"sub": str(user_id)}) for user_id in range(3)]
+    for token in issued:
+        service.decode(token)
+
+    service.decode(issued[0])
+
+    # The oldest entry was evicted: decoding it again was a miss
+    assert service.stats() == {"size": 2, "max_entries": 2, "hits": 0, "misses": 4}